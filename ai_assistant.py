@@ -2,17 +2,53 @@
 AI Assistant module for job analysis using ChatGPT
 """
 import os
+import asyncio
 import logging
+import time
+import weakref
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any, Optional
 import requests
 
+from utils import ai_batch
+from utils.blob_store import description_store
+from utils.condense import DEFAULT_TOKEN_BUDGET, condense
+from utils.llm_cache import LLMCache, llm_cache
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
+# Async analysis: concurrent requests per endpoint, per-request timeout,
+# attempts per request and the overall deadline (seconds)
+AI_CONCURRENCY = int(os.getenv('AI_CONCURRENCY', '4'))
+AI_REQUEST_TIMEOUT = 30
+AI_MAX_RETRIES = 3
+AI_DEADLINE = float(os.getenv('AI_DEADLINE', '120'))
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After header as seconds (delta-seconds or HTTP-date form)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 
 class AIAssistant:
     """ChatGPT integration for job analysis and career assistance"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[LLMCache] = None):
         self.api_key = api_key or os.getenv('DEEPSEEK_API_KEY') or os.getenv('OPENAI_API_KEY')
         
         base_url = os.getenv('AI_BASE_URL', 'https://api.openai.com/v1')
@@ -27,6 +63,12 @@ class AIAssistant:
         self.api_url = f"{base_url.rstrip('/')}/chat/completions"
             
         self.model = os.getenv('AI_MODEL', 'gpt-3.5-turbo')
+        # Responses for prompts already sent (AI_CACHE=0 disables)
+        self.cache = cache if cache is not None else (llm_cache if os.getenv('AI_CACHE', '1') != '0' else None)
+        # Prompt tokens saved by condensing descriptions, across calls
+        self.tokens_saved = 0
+        # event loop -> {endpoint: Semaphore}; semaphores are bound to one loop
+        self._semaphores = weakref.WeakKeyDictionary()
     
     def load_user_profile(self) -> str:
         """Load user profile/CV from data directory"""
@@ -39,11 +81,35 @@ class AIAssistant:
             logger.warning(f"Could not load CV: {e}")
         return ""
 
+    def _description(self, job: Dict[str, Any], prompt_type: str) -> str:
+        """Job description condensed to the prompt's token budget (replaces the old [:2000] slice)"""
+        condensed = condense(description_store.resolve(job), budget=DEFAULT_TOKEN_BUDGET, prompt_type=prompt_type)
+        self.tokens_saved += condensed.saved
+        if condensed.saved:
+            logger.info(f"Condensed {job.get('id')} for {prompt_type}: {condensed.original_tokens} -> "
+                        f"{condensed.tokens} tokens ({condensed.dropped_boilerplate} boilerplate sections dropped)")
+        return condensed.text
+
+    def _cache_key(self, messages: List[Dict[str, str]], max_tokens: int) -> Optional[str]:
+        return LLMCache.key(self.model, messages, max_tokens) if self.cache is not None else None
+
+    def _cached(self, cache_key: Optional[str]) -> Optional[str]:
+        return self.cache.get(cache_key) if cache_key else None
+
+    def _store(self, cache_key: Optional[str], content: str):
+        if cache_key and content:
+            self.cache.put(cache_key, content, model=self.model)
+
     def _call_chatgpt(self, messages: List[Dict[str, str]], max_tokens: int = 500) -> Optional[str]:
         """Make API call to LLM (ChatGPT/DeepSeek)"""
         if not self.api_key:
             logger.warning("AI API key not configured - skipping AI analysis")
             return None
+
+        cache_key = self._cache_key(messages, max_tokens)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             headers = {
@@ -62,7 +128,9 @@ class AIAssistant:
             response.raise_for_status()
             
             result = response.json()
-            return result['choices'][0]['message']['content']
+            content = result['choices'][0]['message']['content']
+            self._store(cache_key, content)
+            return content
         
         except requests.exceptions.RequestException as e:
             logger.error(f"Error calling AI API: {e}")
@@ -71,16 +139,85 @@ class AIAssistant:
             logger.error(f"Unexpected error in AI call: {e}")
             return None
     
-    def analyze_job_description(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Analyze a job description and extract key information"""
+    def _endpoint_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit shared by every async call to this endpoint on the running loop"""
+        per_loop = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if self.api_url not in per_loop:
+            per_loop[self.api_url] = asyncio.Semaphore(AI_CONCURRENCY)
+        return per_loop[self.api_url]
+
+    async def _call_chatgpt_async(self, session, messages: List[Dict[str, str]], max_tokens: int = 500,
+                                  deadline: Optional[float] = None) -> Optional[str]:
+        """
+        Async _call_chatgpt: bounded by the endpoint semaphore, retries 429/5xx
+        honouring Retry-After, and gives up at `deadline` (loop.time()).
+        """
         if not self.api_key:
+            logger.warning("AI API key not configured - skipping AI analysis")
             return None
-        
+
+        cache_key = self._cache_key(messages, max_tokens)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        deadline = deadline if deadline is not None else loop.time() + AI_DEADLINE
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+        data = {
+            'model': self.model,
+            'messages': messages,
+            'max_tokens': max_tokens,
+            'temperature': 0.7
+        }
+
+        for attempt in range(AI_MAX_RETRIES):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning("AI deadline reached - skipping remaining requests")
+                return None
+            try:
+                async with self._endpoint_semaphore():
+                    timeout = aiohttp.ClientTimeout(total=min(AI_REQUEST_TIMEOUT, remaining))
+                    async with session.post(self.api_url, headers=headers, json=data, timeout=timeout) as response:
+                        if response.status in RETRYABLE_STATUSES:
+                            wait = retry_after_seconds(response.headers.get('Retry-After'))
+                            wait = wait if wait is not None else 2 ** attempt
+                            logger.warning(f"AI API returned {response.status}, retrying in {wait:.1f}s "
+                                           f"(Attempt {attempt + 1}/{AI_MAX_RETRIES})")
+                        else:
+                            response.raise_for_status()
+                            result = await response.json(content_type=None)
+                            content = result['choices'][0]['message']['content']
+                            self._store(cache_key, content)
+                            return content
+            except aiohttp.ClientResponseError as e:
+                # Non-retryable HTTP error (auth, bad request, ...)
+                logger.error(f"Error calling AI API: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error calling AI API: {e}")
+                wait = 2 ** attempt
+            except Exception as e:
+                logger.error(f"Unexpected error in AI call: {e}")
+                return None
+
+            if attempt < AI_MAX_RETRIES - 1:
+                # Back off outside the semaphore so other requests can proceed
+                await asyncio.sleep(min(wait, max(0.0, deadline - loop.time())))
+        return None
+
+    def _analysis_messages(self, job: Dict[str, Any], description: Optional[str] = None) -> List[Dict[str, str]]:
+        """`description`: already condensed text, so callers that have it don't condense twice"""
         title = job.get('title', '')
         company = job.get('company', '')
-        description = job.get('description', '')[:2000]  # Limit to avoid token limits
+        if description is None:
+            description = self._description(job, 'analysis')
         
-        messages = [
+        return [
             {
                 'role': 'system',
                 'content': 'You are a career advisor analyzing job postings. Provide concise, actionable insights.'
@@ -101,18 +238,35 @@ Description: {description}
 Provide the analysis in a structured format."""
             }
         ]
-        
-        analysis = self._call_chatgpt(messages, max_tokens=700)
-        
+
+    @staticmethod
+    def _analysis_result(job: Dict[str, Any], analysis: Optional[str]) -> Optional[Dict[str, Any]]:
         if analysis:
             return {
                 'job_id': job.get('id'),
-                'title': title,
-                'company': company,
+                'title': job.get('title', ''),
+                'company': job.get('company', ''),
                 'analysis': analysis
             }
-        
         return None
+
+    def analyze_job_description(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Analyze a job description and extract key information"""
+        if not self.api_key:
+            return None
+        
+        analysis = self._call_chatgpt(self._analysis_messages(job), max_tokens=700)
+        return self._analysis_result(job, analysis)
+
+    async def analyze_job_description_async(self, session, job: Dict[str, Any], deadline: Optional[float] = None,
+                                            description: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Async analyze_job_description on a shared aiohttp session"""
+        if not self.api_key:
+            return None
+
+        analysis = await self._call_chatgpt_async(session, self._analysis_messages(job, description),
+                                                  max_tokens=700, deadline=deadline)
+        return self._analysis_result(job, analysis)
     
     def generate_resume_tips(self, job: Dict[str, Any], user_skills: Optional[List[str]] = None) -> Optional[str]:
         """Generate resume tailoring tips for a specific job"""
@@ -120,7 +274,7 @@ Provide the analysis in a structured format."""
             return None
         
         title = job.get('title', '')
-        description = job.get('description', '')[:2000]
+        description = self._description(job, 'resume')
         
         skills_context = ""
         user_cv = self.load_user_profile()
@@ -158,7 +312,7 @@ Focus on:
         
         title = job.get('title', '')
         company = job.get('company', '')
-        description = job.get('description', '')[:2000]
+        description = self._description(job, 'cover_letter')
         
         user_cv = self.load_user_profile()
         cv_context = f"\n\nCandidate's CV:\n{user_cv}" if user_cv else ""
@@ -193,7 +347,7 @@ Provide:
         
         title = job.get('title', '')
         company = job.get('company', '')
-        description = job.get('description', '')[:2000]
+        description = self._description(job, 'interview')
         
         messages = [
             {
@@ -241,6 +395,108 @@ Include:
             'total_analyzed': len(analyses),
             'analyses': analyses
         }
+
+    async def analyze_top_jobs_async(self, jobs: List[Dict[str, Any]], top_n: int = 5, session=None,
+                                     deadline: float = AI_DEADLINE) -> Dict[str, Any]:
+        """
+        analyze_top_jobs with the requests in flight concurrently (at most
+        AI_CONCURRENCY per endpoint) over one connection pool. Jobs not
+        analyzed within `deadline` seconds are left out; order is preserved.
+        """
+        if not self.api_key:
+            logger.info("OpenAI API key not configured - skipping AI analysis")
+            return {
+                'enabled': False,
+                'message': 'AI analysis disabled - configure OPENAI_API_KEY to enable'
+            }
+        if aiohttp is None:
+            logger.warning("aiohttp not installed - falling back to sequential AI analysis")
+            return await asyncio.to_thread(self.analyze_top_jobs, jobs, top_n)
+
+        selected = jobs[:top_n]
+        end = asyncio.get_running_loop().time() + deadline
+        owns_session = session is None
+        if owns_session:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=AI_CONCURRENCY))
+        try:
+            logger.info(f"Analyzing {len(selected)} jobs (up to {AI_CONCURRENCY} concurrent requests)")
+            results = await asyncio.gather(
+                *(self.analyze_job_description_async(session, job, deadline=end) for job in selected))
+        finally:
+            if owns_session:
+                await session.close()
+
+        analyses = [analysis for analysis in results if analysis]
+        return {
+            'enabled': True,
+            'total_analyzed': len(analyses),
+            'analyses': analyses
+        }
+
+    async def _analyze_batch(self, session, batch, deadline: float) -> List[Optional[Dict[str, Any]]]:
+        """One request for the whole batch; items that fail to parse are retried one by one."""
+        ids = [str(job.get('id')) for job, _ in batch]
+        response = await self._call_chatgpt_async(session, ai_batch.batch_messages(batch),
+                                                  max_tokens=ai_batch.output_budget(len(batch)), deadline=deadline)
+        parsed = ai_batch.parse_batch_response(response, ids)
+        failed = [(job, description) for (job, description), job_id in zip(batch, ids) if job_id not in parsed]
+        if failed:
+            logger.warning(f"Batch of {len(batch)}: retrying {len(failed)} unparsed jobs individually")
+        # Reuse the condensed descriptions: condensing again would re-count tokens_saved
+        retried = await asyncio.gather(
+            *(self.analyze_job_description_async(session, job, deadline=deadline, description=description)
+              for job, description in failed))
+        retried_by_id = {str(job.get('id')): result for (job, _), result in zip(failed, retried)}
+
+        results = []
+        for (job, _), job_id in zip(batch, ids):
+            if job_id in parsed:
+                result = self._analysis_result(job, ai_batch.render_analysis(parsed[job_id]))
+                result['structured'] = parsed[job_id]
+                results.append(result)
+            else:
+                results.append(retried_by_id.get(job_id))
+        return results
+
+    async def analyze_top_jobs_batched(self, jobs: List[Dict[str, Any]], top_n: int = 20, session=None,
+                                       deadline: float = AI_DEADLINE,
+                                       token_budget: int = ai_batch.BATCH_TOKEN_BUDGET) -> Dict[str, Any]:
+        """
+        analyze_top_jobs with several jobs per request: jobs are packed into
+        batches under `token_budget` prompt tokens and the model answers with a
+        JSON array of per-job analyses. Batches run concurrently like
+        analyze_top_jobs_async; only items that come back malformed cost an
+        extra single-job request.
+        """
+        if not self.api_key:
+            logger.info("OpenAI API key not configured - skipping AI analysis")
+            return {
+                'enabled': False,
+                'message': 'AI analysis disabled - configure OPENAI_API_KEY to enable'
+            }
+        if aiohttp is None:
+            logger.warning("aiohttp not installed - falling back to sequential AI analysis")
+            return await asyncio.to_thread(self.analyze_top_jobs, jobs, top_n)
+
+        items = [(job, self._description(job, 'analysis')) for job in jobs[:top_n]]
+        batches = ai_batch.pack_batches(items, token_budget=token_budget)
+        end = asyncio.get_running_loop().time() + deadline
+        owns_session = session is None
+        if owns_session:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=AI_CONCURRENCY))
+        try:
+            logger.info(f"Analyzing {len(items)} jobs in {len(batches)} batched requests")
+            results = await asyncio.gather(*(self._analyze_batch(session, batch, end) for batch in batches))
+        finally:
+            if owns_session:
+                await session.close()
+
+        analyses = [analysis for batch_results in results for analysis in batch_results if analysis]
+        return {
+            'enabled': True,
+            'total_analyzed': len(analyses),
+            'analyses': analyses
+        }
     
     def generate_career_insights(self, jobs: List[Dict[str, Any]]) -> Optional[str]:
         """Generate overall career insights from job trends"""
@@ -20,12 +20,25 @@ except ImportError:
     CVOrchestrator = None
 
 from datetime import datetime
+from utils.blob_store import DescriptionStore
+from utils.tracking_store import TrackingStore
+from utils.write_behind import WriteBehindTracker
+from utils.perf import PhaseTimer, RollingStats, export_stats
+from utils import columnar
+from utils.job_frame import prepare_jobs_frame, slim_jobs_frame
+from utils.view_index import SORT_MODES, ViewIndex
+from utils.search_index import SearchIndex
 
 # --- Configuration ---
 # --- Configuration ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TRACKING_FILE = os.path.join(BASE_DIR, "data", "tracking.json")
 JOB_DATA_FILE = os.path.join(BASE_DIR, "data", "jobs_agg.json")
+JOB_ARROW_FILE = os.path.join(BASE_DIR, "data", "jobs_agg.arrow")
+DESCRIPTIONS_DIR = os.path.join(BASE_DIR, "data", "descriptions")
+SEARCH_INDEX_FILE = os.path.join(BASE_DIR, "data", "search_index.json")
+PAGE_SIZES = [50, 100, 250]
+PERF_LOG_DIR = os.path.join(BASE_DIR, "logs")
 
 st.set_page_config(page_title="Job Hunter", layout="wide")
 
@@ -49,17 +62,31 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Data Loading & Saving ---
+@st.cache_resource
+def get_tracking_store():
+    # Shared across sessions. Writes apply optimistically and are flushed to the
+    # journaled, file-locked store in the background (see utils/write_behind.py)
+    return WriteBehindTracker(TrackingStore(TRACKING_FILE))
+
 def load_tracking():
-    if os.path.exists(TRACKING_FILE):
-        with open(TRACKING_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    return get_tracking_store().load()
+
+@st.cache_resource
+def get_description_store():
+    return DescriptionStore(DESCRIPTIONS_DIR)
 
-def save_tracking(data):
-    with open(TRACKING_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+def file_version(path):
+    """(mtime_ns, size) of a file, or None if missing. Cheap cache key."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def jobs_data_version():
+    # Both outputs are rewritten by the reporter at the end of each scrape
+    return (file_version(JOB_ARROW_FILE), file_version(JOB_DATA_FILE))
 
-@st.cache_data(ttl=900)
 def load_jobs_raw():
     if not os.path.exists(JOB_DATA_FILE):
         return None
@@ -76,23 +103,93 @@ def load_jobs_df(data):
     if not jobs:
         return pd.DataFrame()
     
-    df = pd.DataFrame(jobs)
-    
-    # Cleanup
-    object_cols = ['raw_data', 'keywords_matched']
-    for col in object_cols:
-        if col in df.columns:
-            df[col] = df[col].astype(str)
+    # Heavy payload columns are never displayed
+    df = slim_jobs_frame(pd.DataFrame(jobs))
             
     if 'score' in df.columns:
         df['score'] = pd.to_numeric(df['score'], errors='coerce').fillna(0)
         
     return df
 
+def arrow_is_current():
+    """Columnar export exists and is not older than the JSON aggregate."""
+    if not columnar.is_available() or not os.path.exists(JOB_ARROW_FILE):
+        return False
+    if not os.path.exists(JOB_DATA_FILE):
+        return True
+    return os.path.getmtime(JOB_ARROW_FILE) >= os.path.getmtime(JOB_DATA_FILE)
+
+@st.cache_resource(max_entries=2)
+def load_jobs_frame(data_version):
+    """
+    (DataFrame, meta) for the dashboard, cached per data file version and
+    shared read-only across sessions. Prefers the memory-mapped Arrow
+    export (no JSON parse, categorical columns); falls back to the JSON aggregate.
+    """
+    if arrow_is_current():
+        try:
+            return columnar.read_jobs_arrow(JOB_ARROW_FILE)
+        except Exception:
+            pass  # Fall back to JSON below
+    data = load_jobs_raw()
+    if not data:
+        return pd.DataFrame(), None
+    meta = {"generated_at": data.get("generated_at", "Unknown"), "total_jobs": data.get("total_jobs", 0)}
+    return load_jobs_df(data), meta
+
+@st.cache_resource(max_entries=2)
+def get_view_index(data_version):
+    """
+    Prepared jobs frame (dates parsed, categoricals) wrapped in a ViewIndex.
+    Built once per jobs data version and shared across sessions; tracking
+    changes are applied to the touched rows by sync_tracking().
+    """
+    jobs_frame, _ = load_jobs_frame(data_version)
+    return ViewIndex(prepare_jobs_frame(jobs_frame, {}))
+
+@st.cache_resource(max_entries=2)
+def load_search_index(index_version):
+    """Inverted index written by the reporter, loaded once per file version."""
+    if index_version is None:
+        return None
+    try:
+        return SearchIndex.load(SEARCH_INDEX_FILE)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+def tracking_version():
+    store = get_tracking_store()
+    store.refresh()
+    return store.version
+
+# --- Live Refresh ---
+# Poll the (cheap) file versions; rerun the app only when the scraper or
+# another session actually changed something.
+VERSION_POLL_SECONDS = 10
+
+def current_versions():
+    return (jobs_data_version(), tracking_version())
+
+if hasattr(st, "fragment"):
+    @st.fragment(run_every=VERSION_POLL_SECONDS)
+    def watch_data_versions():
+        if current_versions() != st.session_state.get("_seen_versions"):
+            st.rerun(scope="app")
+else:
+    def watch_data_versions():
+        pass
+
 # --- Main App ---
 
-# Load Raw Data (Cached with TTL)
-raw_data = load_jobs_raw()
+# Opt-in per-rerun phase timings (?perf=1)
+PERF_ENABLED = hasattr(st, "query_params") and st.query_params.get("perf") == "1"
+perf = PhaseTimer(enabled=PERF_ENABLED)
+
+# Load Data (cached per data file version - a finished scrape shows up on the next poll)
+data_version = jobs_data_version()
+jobs_frame, jobs_meta = load_jobs_frame(data_version)
+perf.mark("data_load")
+st.session_state["_seen_versions"] = (data_version, tracking_version())
 
 # Sideboard: Control & Observability
 with st.sidebar:
@@ -101,9 +198,9 @@ with st.sidebar:
     
     # --- System Status ---
     st.markdown("### 🛰️ System Status")
-    if raw_data:
+    if jobs_meta:
         st.markdown("🟢 **Live Connection**")
-        generated_at = raw_data.get("generated_at", "Unknown")
+        generated_at = jobs_meta.get("generated_at", "Unknown")
         # Format the ISO string for better readability if possible
         try:
             dt = datetime.fromisoformat(generated_at)
@@ -117,72 +214,51 @@ with st.sidebar:
 
     st.header("⚙️ Controls")
     if st.button("🔄 Force Refresh Data", type="primary", use_container_width=True):
-        load_jobs_raw.clear()
-        st.cache_data.clear()
+        # Only the job data caches; everything else is keyed on file versions
+        load_jobs_frame.clear()
+        get_view_index.clear()
         st.rerun()
+    watch_data_versions()
     
-    if raw_data:
-        total_count = raw_data.get("total_jobs", 0)
+    if jobs_meta:
+        total_count = jobs_meta.get("total_jobs", 0)
         st.caption(f"🗃️ Total Aggregated: {total_count}")
     st.divider()
 
-if not raw_data:
+if not jobs_meta:
     st.warning("⚠️ Waiting for the background scraper to complete its first run. Please check back in a few minutes.")
     st.info("💡 You can check the logs for progress.")
     st.stop()
 
-# Create a copy to prevent mutating the cached object
-df_jobs = load_jobs_df(raw_data).copy()
-tracking_data = load_tracking()
+# Shared view index over the prepared frame (read-only; see utils/view_index.py)
+perf.start()
+view_index = get_view_index(data_version)
+perf.mark("data_load")
+current_tracking_version = st.session_state["_seen_versions"][1]
+if view_index.tracking_version != current_tracking_version:
+    view_index.sync_tracking(load_tracking(), current_tracking_version)
+df_jobs = view_index.frame
+perf.mark("tracking_merge")
 
 if df_jobs.empty:
     st.warning("No jobs found in the aggregation file. Run the scraper!")
     st.stop()
 
-# --- Merge Data ---
-saved_map = {k: v.get('saved', False) for k, v in tracking_data.items()}
-status_map = {k: v.get('status', 'New') for k, v in tracking_data.items()}
-cv_status_map = {k: v.get('cv_status', 'Generic') for k, v in tracking_data.items()}
-resume_map = {k: os.path.basename(v['cv_pdf_path']) if v.get('cv_pdf_path') else '' for k, v in tracking_data.items()}
-
-df_jobs['Status'] = df_jobs['id'].map(status_map).fillna('New')
-df_jobs['is_saved'] = df_jobs['id'].map(saved_map).fillna(False)
-df_jobs['cv_status'] = df_jobs['id'].map(cv_status_map).fillna('Generic')
-df_jobs['resume'] = df_jobs['id'].map(resume_map).fillna('')
-
-# --- Prettify Title ---
-# --- Prettify Title (Vectorized) ---
-# Initialize with original title
-df_jobs['display_title'] = df_jobs['title']
-
-# 1. Prepend star if saved
-saved_mask = df_jobs['is_saved'] == True
-df_jobs.loc[saved_mask, 'display_title'] = "⭐ " + df_jobs.loc[saved_mask, 'display_title']
-
-# 2. Prepend Status Emojis
-interview_mask = df_jobs['Status'] == 'Interviewing'
-offer_mask = df_jobs['Status'] == 'Offer'
-
-df_jobs.loc[interview_mask, 'display_title'] = "🎤 " + df_jobs.loc[interview_mask, 'display_title']
-df_jobs.loc[offer_mask, 'display_title'] = "🎉 " + df_jobs.loc[offer_mask, 'display_title']
-
-# Update the main title column
-df_jobs['title'] = df_jobs['display_title']
-
 # --- Sidebar ---
 with st.sidebar:
     # --- Quick Stats ---
     st.header("📊 Overview")
 
-    total_jobs = len(df_jobs)
-    num_companies = df_jobs['company'].nunique()
-    num_saved = int(df_jobs['is_saved'].sum())
-    num_applied = len([v for v in tracking_data.values() if v.get('status') == 'Applied'])
-    num_interviewing = len([v for v in tracking_data.values() if v.get('status') == 'Interviewing'])
-    num_offers = len([v for v in tracking_data.values() if v.get('status') == 'Offer'])
-    num_rejected = len([v for v in tracking_data.values() if v.get('status') == 'Rejected'])
-    num_saved_unapplied = int((df_jobs['is_saved'] & (df_jobs['Status'] != 'Applied')).sum())
-    avg_score = df_jobs['score'].mean()
+    facets = view_index.facet_counts()
+    total_jobs = facets['total']
+    num_companies = facets['companies']
+    num_saved = facets['saved']
+    num_applied = facets['applied']
+    num_interviewing = facets['interviewing']
+    num_offers = facets['offers']
+    num_rejected = facets['rejected']
+    num_saved_unapplied = facets['saved_unapplied']
+    avg_score = view_index.score.mean()
 
     col_a, col_b = st.columns(2)
     col_a.metric("Total Jobs", total_jobs)
@@ -202,8 +278,8 @@ with st.sidebar:
 
     st.metric("Avg Score", f"{avg_score:.1f}")
 
-    if 'date_posted' in df_jobs.columns:
-        dates = pd.to_datetime(df_jobs['date_posted'], errors='coerce', format='ISO8601').dropna()
+    if 'date_parsed' in df_jobs.columns:
+        dates = df_jobs['date_parsed'].dropna()
         if not dates.empty:
             st.caption(f"📅 {dates.min().strftime('%b %d')} – {dates.max().strftime('%b %d, %Y')}")
 
@@ -263,6 +339,16 @@ with st.sidebar:
     if "table_version" not in st.session_state:
         st.session_state.table_version = 0
 
+    # Table page/sort: URL (deep link) on first load, then session state
+    if "table_page" not in st.session_state:
+        try:
+            st.session_state.table_page = max(0, int(get_query_param("page", 1)) - 1)
+        except (TypeError, ValueError):
+            st.session_state.table_page = 0
+    if "table_sort" not in st.session_state:
+        sort_param = get_query_param("sort", "Default")
+        st.session_state.table_sort = sort_param if sort_param in SORT_MODES else "Default"
+
 
     def update_view_param():
         view = st.session_state.main_view_filter
@@ -309,23 +395,24 @@ with st.sidebar:
     st.subheader("Refine", divider="gray")
 
     # Status multi-select
-    all_statuses = sorted(df_jobs['Status'].unique().tolist())
+    all_statuses = sorted(s for s, bits in view_index.status_bits.items() if bits.any())
     sel_statuses = st.multiselect("Status", all_statuses, default=[], key="filter_status",
                                    help="Leave empty to show all statuses")
 
     show_saved = False # implicitly handled by views, but keep valid for logic below if needed
-    companies = ["All"] + sorted(df_jobs['company'].unique().tolist())
+    companies = ["All"] + list(view_index.company_bits)
     sel_company = st.selectbox("Company", companies, key="filter_company")
     min_score = st.slider("Min Score", 0, int(df_jobs['score'].max()), 0, key="filter_min_score")
 
     # Title keyword search
-    search_query = st.text_input("🔍 Search Title", key="filter_search",
-                                  placeholder="e.g. intern, frontend, data...")
+    search_query = st.text_input("🔍 Search", key="filter_search",
+                                  placeholder="e.g. intern, react OR vue, data...",
+                                  help="Title, company, location and description. Words are prefixes and all must match; OR separates alternatives.")
 
     # Date range filter
     date_range = None  # Initialize safely
-    if 'date_posted' in df_jobs.columns:
-        dates = pd.to_datetime(df_jobs['date_posted'], errors='coerce', format='ISO8601').dropna()
+    if 'date_parsed' in df_jobs.columns:
+        dates = df_jobs['date_parsed'].dropna()
         if not dates.empty:
             min_date = dates.min().date()
             max_date = dates.max().date()
@@ -334,84 +421,107 @@ with st.sidebar:
                                         key="filter_date_range")
 
 # --- Apply Filters ---
-filtered_df = df_jobs.copy()
-
-# 1. VIEW LOGIC (The Core "Inbox Zero" Flow)
-if selected_view == "Feed":
-    # Feed = New AND Not Saved AND Not Rejected AND Not Hidden
-    # "Inbox Zero" - as soon as you save or apply, it leaves the feed.
-    filtered_df = filtered_df[
-        (filtered_df['Status'] == 'New') & 
-        (filtered_df['is_saved'] == False) &
-        (filtered_df['Status'] != 'Rejected') &
-        (filtered_df['Status'] != 'Hidden')
-    ]
-
-elif selected_view == "Shortlist":
-    # Shortlist = Saved AND Not Applied/Interviewing/Offer
-    # We want to see what we saved but haven't acted on yet.
-    # We generaly exclude 'Rejected' here unless explicitly desired, but standard flow implies Shortlist is for "To Apply"
-    active_statuses = ['New', 'Saved'] 
-    filtered_df = filtered_df[
-        (filtered_df['is_saved'] == True) & 
-        (filtered_df['Status'].isin(active_statuses))
-    ]
-
-elif selected_view == "Tracking":
-    # Tracking = Applied, Interviewing, Offer
-    tracking_statuses = ['Applied', 'Interviewing', 'Offer']
-    filtered_df = filtered_df[filtered_df['Status'].isin(tracking_statuses) & (filtered_df['Status'] != 'Hidden')]
-
-elif selected_view == "All":
-    # All = Everything (optionally hide rejected/hidden)
-    if hide_rejected:
-        filtered_df = filtered_df[filtered_df['Status'] != 'Rejected']
-    if hide_hidden:
-        filtered_df = filtered_df[filtered_df['Status'] != 'Hidden']
-
+perf.start()
+# 1. VIEW LOGIC (The Core "Inbox Zero" Flow) - precomputed bitsets:
+#   Feed = New AND Not Saved; Shortlist = Saved AND New/Saved;
+#   Tracking = Applied/Interviewing/Offer; All = optionally hide rejected/hidden
+mask = view_index.view_mask(selected_view, hide_rejected, hide_hidden)
 
 # 2. Refine Filters (Company, Score, etc. apply on top of the View)
 
 # Score filter
-filtered_df = filtered_df[filtered_df['score'] >= min_score]
+mask = mask & (view_index.score >= min_score)
 
 # Company filter
 if sel_company != "All":
-    filtered_df = filtered_df[filtered_df['company'] == sel_company]
+    mask &= view_index.company_mask(sel_company)
 
 # Status multi-select (allows further drilling down within a view)
 if sel_statuses:
-    filtered_df = filtered_df[filtered_df['Status'].isin(sel_statuses)]
+    mask &= view_index.statuses_mask(sel_statuses)
 
-# Title search
+# Full-text search (prebuilt index; ranked by score). Falls back to a title scan.
+search_rows = None
 if search_query:
-    filtered_df = filtered_df[filtered_df['title'].str.contains(search_query, case=False, na=False)]
+    search_index = load_search_index(file_version(SEARCH_INDEX_FILE))
+    if search_index is not None:
+        search_rows = view_index.rows_for_ids(search_index.search(search_query))
+    else:
+        mask &= df_jobs['title'].str.contains(search_query, case=False, na=False).to_numpy()
 
 # Date range filter
-if 'date_posted' in df_jobs.columns and date_range is not None:
-    dates_parsed = pd.to_datetime(filtered_df['date_posted'], errors='coerce', format='ISO8601')
+if 'posted_day' in df_jobs.columns and date_range is not None:
     if isinstance(date_range, tuple) and len(date_range) == 2:
         start_date, end_date = date_range
-        mask = (dates_parsed.dt.date >= start_date) & (dates_parsed.dt.date <= end_date)
-        filtered_df = filtered_df[mask | dates_parsed.isna()]
+        days = df_jobs['posted_day']
+        in_range = (days >= start_date) & (days <= end_date)
+        mask &= (in_range | df_jobs['date_parsed'].isna()).to_numpy()
 
-# Sort: Saved/Special Status first, then Date, then Score
-# We create a simple priority map for sorting
-status_priority = {"Offer": 5, "Interviewing": 4, "Applied": 3, "New": 1, "Rejected": 0, "Hidden": -1}
-filtered_df['status_prio'] = filtered_df['Status'].map(status_priority).fillna(1)
-filtered_df = filtered_df.sort_values(by=["status_prio", "is_saved", "date_posted", "score"], ascending=[False, False, False, False]).reset_index(drop=True)
+perf.mark("filters")
+
+# Sort: search hits by relevance score; otherwise Saved/Special Status first,
+# then Date, then Score (pre-sorted order). Table sort modes re-sort on top.
+if search_rows is not None:
+    matched_rows = search_rows[mask[search_rows]]
+else:
+    matched_rows = view_index.ordered(mask)
+matched_rows = view_index.sort_rows(matched_rows, st.session_state.table_sort)
+perf.mark("sort")
+
+# --- Pagination ---
+# Any filter change starts again from the first page
+filter_signature = (selected_view, hide_rejected, hide_hidden, tuple(sel_statuses), sel_company,
+                    min_score, search_query, str(date_range), st.session_state.table_sort)
+if st.session_state.get("_filter_signature", filter_signature) != filter_signature:
+    st.session_state.table_page = 0
+    set_query_param("page", "1")
+st.session_state._filter_signature = filter_signature
+
+def go_to_page(page):
+    st.session_state.table_page = page
+    set_query_param("page", str(page + 1))
+
+def update_sort_param():
+    st.session_state.table_page = 0
+    set_query_param("sort", st.session_state.table_sort)
+    set_query_param("page", "1")
+
+page_size = st.session_state.get("table_page_size", PAGE_SIZES[1])
+num_pages = max(1, -(-len(matched_rows) // page_size))
+page = min(st.session_state.table_page, num_pages - 1)
+st.session_state.table_page = page
+page_start = page * page_size
+page_rows = matched_rows[page_start:page_start + page_size]
+
+# Only the visible page is materialized and sent to the browser
+perf.start()
+filtered_df = view_index.materialize(page_rows)
+perf.mark("prettify")
 
 # --- TABLE ---
-st.caption(f"Showing **{len(filtered_df)}** of {len(df_jobs)} jobs")
+col_info, col_sort, col_size = st.columns([4, 1.2, 1], vertical_alignment="bottom")
+with col_info:
+    if len(matched_rows):
+        st.caption(f"Showing **{page_start + 1}–{page_start + len(page_rows)}** of **{len(matched_rows)}** "
+                   f"matching ({len(df_jobs)} jobs)")
+    else:
+        st.caption(f"Showing **0** of {len(df_jobs)} jobs")
+with col_sort:
+    st.selectbox("Sort", SORT_MODES, key="table_sort", on_change=update_sort_param)
+with col_size:
+    st.selectbox("Rows per page", PAGE_SIZES, key="table_page_size", index=1,
+                 on_change=go_to_page, args=(0,))
 
 display_cols = ['Status', 'score', 'date_posted', 'company', 'title', 'location', 'url', 'id']
 final_cols = [c for c in display_cols if c in filtered_df.columns]
 
+perf.start()
 event = st.dataframe(
     filtered_df[final_cols],
     on_select="rerun",
     selection_mode=["multi-row", "single-cell"],
-    key=f"job_dashboard_table_{st.session_state.table_version}",
+    # Page in the key: selection indices are relative to the visible page
+    key=f"job_dashboard_table_{st.session_state.table_version}_{page}",
     column_config={
         "Status": st.column_config.TextColumn("Status"),
         "url": st.column_config.LinkColumn("Link", display_text="Open"),
@@ -422,8 +532,35 @@ event = st.dataframe(
     hide_index=True,
     height=530
 )
+perf.mark("dataframe")
+
+if num_pages > 1:
+    col_prev, col_page, col_next = st.columns([1, 2, 1], vertical_alignment="center")
+    with col_prev:
+        st.button("◀ Prev", width="stretch", disabled=page == 0,
+                  on_click=go_to_page, args=(page - 1,), key="page_prev")
+    with col_page:
+        st.markdown(f"<div style='text-align:center'>Page <b>{page + 1}</b> of {num_pages}</div>",
+                    unsafe_allow_html=True)
+    with col_next:
+        st.button("Next ▶", width="stretch", disabled=page >= num_pages - 1,
+                  on_click=go_to_page, args=(page + 1,), key="page_next")
 
 # --- ACTION TOOLBAR ---
+# Button callbacks run before the next rerun, so the table already shows the
+# optimistic change; the write reaches tracking.json in the background.
+def apply_tracking_action(changes):
+    get_tracking_store().apply(changes)
+    # Clear selection after action
+    st.session_state.table_version += 1
+
+def apply_status_action(job_ids):
+    new_status = st.session_state.status_selector
+    fields = {'status': new_status}
+    if new_status in ["Applied", "Interviewing", "Offer"]:
+        fields['saved'] = True
+    apply_tracking_action({job_id: dict(fields) for job_id in job_ids})
+
 # Extract selected row from either row selection OR cell click
 selected_indices = []
 if event.selection:
@@ -434,7 +571,7 @@ if event.selection:
         selected_indices = list(set(cell[0] for cell in event.selection.cells))
 
 if selected_indices:
-    # [FIX] Filter out indices that are no longer valid for the current filtered dataframe
+    # [FIX] Filter out indices that are no longer valid for the current page
     valid_indices = [i for i in selected_indices if i < len(filtered_df)]
     
     if valid_indices:
@@ -458,27 +595,21 @@ if selected_indices:
             st.markdown(f"**{num_selected}** Selected")
 
         with col_save:
-            if st.button("⭐ Save", width="stretch", help="Toggle Save"):
-                for job_id in selected_ids:
-                    if job_id not in tracking_data: tracking_data[job_id] = {}
-                    current = tracking_data[job_id].get('saved', False)
-                    tracking_data[job_id]['saved'] = not current
-                save_tracking(tracking_data)
-                st.session_state.table_version += 1
-                st.rerun()
+            st.button("⭐ Save", width="stretch", help="Toggle Save",
+                      on_click=apply_tracking_action, args=({
+                          job_id: {'saved': not saved}
+                          for job_id, saved in zip(selected_ids, filtered_df.iloc[valid_indices]['is_saved'])
+                      },))
 
         with col_hide:
-            if st.button("🚫 Hide", width="stretch", help="Hide from Feed"):
-                for job_id in selected_ids:
-                    if job_id not in tracking_data: tracking_data[job_id] = {}
-                    tracking_data[job_id]['status'] = 'Hidden'
-                    tracking_data[job_id]['saved'] = False # Usually if hiding, we don't want it saved
-                save_tracking(tracking_data)
-                st.session_state.table_version += 1
-                st.rerun()
+            # Usually if hiding, we don't want it saved
+            st.button("🚫 Hide", width="stretch", help="Hide from Feed",
+                      on_click=apply_tracking_action, args=({
+                          job_id: {'status': 'Hidden', 'saved': False} for job_id in selected_ids
+                      },))
 
         with col3:
-            new_status = st.selectbox(
+            st.selectbox(
                 "Status",
                 ["Applied", "Interviewing", "Offer", "Rejected", "New", "Hidden"],
                 label_visibility="collapsed",
@@ -486,19 +617,8 @@ if selected_indices:
             )
 
         with col4:
-            if st.button("Update Status", type="primary", width="stretch"):
-                for job_id in selected_ids:
-                    if job_id not in tracking_data: tracking_data[job_id] = {}
-                    tracking_data[job_id]['status'] = new_status
-                    if new_status in ["Applied", "Interviewing", "Offer"]:
-                        tracking_data[job_id]['saved'] = True
-                save_tracking(tracking_data)
-                
-                save_tracking(tracking_data)
-                
-                # Clear selection after action
-                st.session_state.table_version += 1
-                st.rerun()
+            st.button("Update Status", type="primary", width="stretch",
+                      on_click=apply_status_action, args=(selected_ids,))
 
     # --- CV Editor / Resume Navigation ---
     if num_selected == 1:
@@ -515,6 +635,10 @@ if selected_indices:
                     st.markdown(f"📄 **Resume**: `{resume_file}`  |  {company} — {title}")
                 else:
                     st.markdown(f"📝 **No Resume Yet** |  {company} — {title}")
+                description = get_description_store().resolve(selected_job_row.to_dict())
+                if description:
+                    with st.expander("📄 Description"):
+                        st.write(description)
             with col_cv2:
                 btn_label = "📄 View Resume" if has_resume else "📝 Create Resume"
                 if st.button(btn_label, type="primary", width="stretch"):
@@ -551,3 +675,25 @@ else:
             st.markdown("<span style='color:#bbb'>📝 Select a job to view or create a resume</span>", unsafe_allow_html=True)
         with col_cv2:
             st.button("📝 Create Resume", type="primary", width="stretch", disabled=True, key="ghost_cv")
+
+# --- Perf Panel (?perf=1) ---
+if PERF_ENABLED:
+    perf_stats = st.session_state.setdefault("_perf_stats", RollingStats())
+    last_run = dict(perf.timings, total=perf.total())
+    perf_stats.add(last_run)
+
+    def export_perf_stats():
+        path = export_stats(perf_stats, PERF_LOG_DIR, extra={"jobs": len(df_jobs), "streamlit": st.__version__})
+        st.session_state["_perf_export"] = path
+
+    with st.sidebar:
+        with st.expander("⏱️ Performance", expanded=True):
+            rows = [
+                {"phase": phase, "last_ms": round(1000 * last_run.get(phase, 0), 2),
+                 **{k: round(v, 2) for k, v in stats.items()}}
+                for phase, stats in perf_stats.summary().items()
+            ]
+            st.dataframe(pd.DataFrame(rows), hide_index=True, width="stretch")
+            st.button("💾 Export JSON", on_click=export_perf_stats, key="perf_export")
+            if st.session_state.get("_perf_export"):
+                st.caption(f"Saved {st.session_state['_perf_export']}")
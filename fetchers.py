@@ -9,6 +9,7 @@ from typing import List, Dict, Any, Optional
 from utils.network import SafeSession
 from utils.smart_filter import job_filter
 from utils.schemas import JobListing
+from utils.blob_store import description_store
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ class GreenhouseFetcher:
             })
             
             # 3. Sanitize and Validate
-            job_obj.sanitize()
+            job_obj.sanitize(store=description_store)
             if job_obj.is_valid():
                 normalized_jobs.append(job_obj.to_dict())
         
@@ -128,7 +129,7 @@ class LeverFetcher:
             })
             
             # 3. Sanitize & Validate
-            job_obj.sanitize()
+            job_obj.sanitize(store=description_store)
             if job_obj.is_valid():
                 normalized_jobs.append(job_obj.to_dict())
         
@@ -196,7 +197,7 @@ class AshbyFetcher:
             })
             
             # 3. Sanitize & Validate
-            job_obj.sanitize()
+            job_obj.sanitize(store=description_store)
             if job_obj.is_valid():
                 normalized_jobs.append(job_obj.to_dict())
         
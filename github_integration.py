@@ -1,6 +1,7 @@
 """
 GitHub integration for committing reports and managing issues
 """
+import io
 import os
 import logging
 import subprocess
@@ -8,6 +9,8 @@ from typing import Optional
 from datetime import datetime
 import requests
 
+from utils.job_summary import JobSummary, summarize_jobs
+
 logger = logging.getLogger(__name__)
 
 
@@ -140,38 +143,42 @@ class GitHubIntegration:
             logger.error(f"Error creating/updating issue: {e}")
             return False
     
-    def create_daily_digest_issue(self, jobs: list, report_path: str) -> bool:
+    def create_daily_digest_issue(self, jobs: list, report_path: str,
+                                  summary: Optional[JobSummary] = None) -> bool:
         """Create or update the Daily Roles Digest issue"""
-        today = datetime.now().strftime('%Y-%m-%d')
+        if summary is None:
+            summary = summarize_jobs(jobs, top_k=10)
         title = "Daily Roles Digest"
+        body = self.render_digest_body(summary, report_path)
+        return self.create_or_update_issue(title, body, labels=['job-digest', 'automated'])
+
+    def render_digest_body(self, summary: JobSummary, report_path: str) -> str:
+        """Render the digest issue body from a precomputed summary"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        out = io.StringIO()
+        w = out.write
         
         # Create issue body
-        body = f"# Daily Job Scraping Digest - {today}\n\n"
-        body += f"## Summary\n\n"
-        body += f"- **Total Jobs**: {len(jobs)}\n"
-        body += f"- **Report Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        body += f"- **Full Report**: [View Report]({report_path})\n\n"
+        w(f"# Daily Job Scraping Digest - {today}\n\n")
+        w(f"## Summary\n\n")
+        w(f"- **Total Jobs**: {summary.total}\n")
+        w(f"- **Report Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(f"- **Full Report**: [View Report]({report_path})\n\n")
         
         # Top companies
-        companies = {}
-        for job in jobs:
-            company = job.get('company', 'Unknown')
-            companies[company] = companies.get(company, 0) + 1
-        
-        body += "## Top Companies\n\n"
-        for company, count in sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10]:
-            body += f"- **{company}**: {count} jobs\n"
+        w("## Top Companies\n\n")
+        for company, count in summary.top_companies(10):
+            w(f"- **{company}**: {count} jobs\n")
         
-        body += "\n## Top 10 Job Opportunities\n\n"
+        w("\n## Top 10 Job Opportunities\n\n")
         
-        top_jobs = jobs[:10]
-        for idx, job in enumerate(top_jobs, 1):
-            body += f"### {idx}. {job.get('title', 'N/A')} at {job.get('company', 'N/A')}\n"
-            body += f"- **Location**: {job.get('location', 'N/A')}\n"
-            body += f"- **Score**: {job.get('score', 0):.1f}\n"
-            body += f"- **Apply**: {job.get('url', 'N/A')}\n\n"
+        for idx, job in enumerate(summary.top_jobs[:10], 1):
+            w(f"### {idx}. {job.get('title', 'N/A')} at {job.get('company', 'N/A')}\n")
+            w(f"- **Location**: {job.get('location', 'N/A')}\n")
+            w(f"- **Score**: {job.get('score', 0):.1f}\n")
+            w(f"- **Apply**: {job.get('url', 'N/A')}\n\n")
         
-        body += "---\n\n"
-        body += f"*This issue is automatically updated daily. Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+        w("---\n\n")
+        w(f"*This issue is automatically updated daily. Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
         
-        return self.create_or_update_issue(title, body, labels=['job-digest', 'automated'])
+        return out.getvalue()
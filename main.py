@@ -15,6 +15,8 @@ from processor import JobProcessor
 from reporter import JobReporter
 from github_integration import GitHubIntegration
 from ai_assistant import AIAssistant
+from utils.blob_store import description_store
+from utils.tracking_store import open_tracking_store
 
 
 def setup_logging():
@@ -93,8 +95,9 @@ async def main():
         # Initialize components
         logger.info("Initializing components...")
         fetcher_manager = JobFetcherManager()
-        processor = JobProcessor(keywords_config)
-        reporter = JobReporter()
+        processor = JobProcessor(keywords_config, description_store=description_store,
+                                 state_store=open_tracking_store())
+        reporter = JobReporter(description_store=description_store)
         github = GitHubIntegration()
         ai_assistant = AIAssistant()
         
@@ -128,18 +131,20 @@ async def main():
         # AI Analysis (DISABLED)
         logger.info("Skipping AI analysis (disabled)...")
         ai_results = {'enabled': False}
-        # ai_results = ai_assistant.analyze_top_jobs(processed_jobs, top_n=5)
+        # ai_results = await ai_assistant.analyze_top_jobs_async(processed_jobs, top_n=5)
         
         # GitHub Integration (DISABLED)
         # logger.info("Committing and pushing reports to GitHub...")
-        # files_to_commit = []
+        # # Commit the line-per-job snapshot, not the score-ordered jobs_agg.json,
+        # # so each commit only carries the postings that actually changed.
+        # files_to_commit = [report_files[k] for k in ('snapshot', 'volatile', 'markdown') if k in report_files]
         # if 'ai_insights' in report_files:
         #     files_to_commit.append(report_files['ai_insights'])
         # github.commit_and_push_reports(files_to_commit)
         
         # Create/Update GitHub Issue (DISABLED)
         # logger.info("Creating/updating Daily Roles Digest issue...")
-        # github.create_daily_digest_issue(processed_jobs, report_files.get('markdown', ''))
+        # github.create_daily_digest_issue(processed_jobs, report_files.get('markdown', ''), summary=reporter.last_summary)
         
         # Summary
         logger.info("=" * 80)
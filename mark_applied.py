@@ -10,9 +10,12 @@ import os
 import argparse
 from datetime import datetime
 
+from utils.job_lookup import get_job_lookup
+from utils.tracking_store import TrackingStore, canonical_url, job_snapshot
+
 DATA_DIR = 'data'
 JOBS_FILE = os.path.join(DATA_DIR, 'jobs_agg.json')
-APPLIED_FILE = os.path.join(DATA_DIR, 'applied_jobs.json')
+TRACKING_FILE = os.path.join(DATA_DIR, 'tracking.json')
 
 def load_json(filepath):
     if not os.path.exists(filepath):
@@ -28,13 +31,13 @@ def load_json(filepath):
         print(f"Error loading {filepath}: {e}")
         return []
 
-def save_json(filepath, data):
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"Saved to {filepath}")
-    except Exception as e:
-        print(f"Error saving {filepath}: {e}")
+def find_job(jobs, identifier):
+    """Single pass that matches on id or canonical URL (fallback when the index is stale)."""
+    target_url = canonical_url(identifier)
+    for job in jobs:
+        if str(job['id']) == identifier or canonical_url(job.get('url', '')) == target_url:
+            return job
+    return None
 
 def main():
     parser = argparse.ArgumentParser(description='Mark a job as applied.')
@@ -43,20 +46,25 @@ def main():
     args = parser.parse_args()
 
     identifier = args.identifier.strip()
-    
-    # 1. Load latest scrape
-    latest_jobs = load_json(JOBS_FILE)
-    if not latest_jobs:
-        print("No job data found. Run the scraper first.")
+    store = TrackingStore(TRACKING_FILE)
+
+    # 1. Already applied? O(1) lookup by id or canonical URL
+    known_id = store.find(identifier)
+    if known_id and store.is_applied(store.get(known_id)):
+        print("Job is already marked as applied.")
         return
 
-    # 2. Find the job
-    target_job = None
-    for job in latest_jobs:
-        if str(job['id']) == identifier or job['url'] == identifier:
-            target_job = job
-            break
-    
+    # 2. Find the job in the latest scrape: id / URL -> byte offset index, one job parsed
+    lookup = get_job_lookup(JOBS_FILE)
+    if lookup.is_current():
+        job_id = lookup.find(known_id or identifier)
+        target_job = lookup.get(job_id) if job_id else None
+    else:
+        latest_jobs = load_json(JOBS_FILE)
+        if not latest_jobs:
+            print("No job data found. Run the scraper first.")
+            return
+        target_job = find_job(latest_jobs, known_id or identifier)
     if not target_job:
         print(f"Job not found in {JOBS_FILE} matching '{identifier}'")
         # Optional: Ask user if they want to enter details manually? 
@@ -65,28 +73,19 @@ def main():
 
     print(f"Found job: {target_job['title']} at {target_job['company']}")
 
-    # 3. Load applied file
-    applied_jobs = load_json(APPLIED_FILE)
-    if isinstance(applied_jobs, dict): # Should be list, but just in case
-        applied_jobs = []
-
-    # 4. Check if already exists
-    for job in applied_jobs:
-        if job['id'] == target_job['id']:
-            print("Job is already marked as applied.")
-            return
-
-    # 5. Add to applied list
-    # Add metadata about when we applied
-    target_job['applied_at'] = datetime.now().isoformat()
-    target_job['applied'] = True
-    
-    applied_jobs.append(target_job)
-    save_json(APPLIED_FILE, applied_jobs)
+    # 3. Record it in the shared state store (same data the dashboard shows)
+    store.update(
+        target_job['id'],
+        status='Applied',
+        saved=True,
+        applied_at=datetime.now().isoformat(),
+        job=job_snapshot(target_job)
+    )
     print(f"Successfully marked '{target_job['title']}' as applied!")
 
-    # 6. Git Automation
-    print("\nIMPORTANT: To persist this on the remote scraper, you must push this file.")
+    # 4. Git Automation
+    state_files = [f for f in (TRACKING_FILE, store.journal_path) if os.path.exists(f)]
+    print("\nIMPORTANT: To persist this on the remote scraper, you must push these files.")
     try:
         import subprocess
         # Check if we should auto-push (could be an arg, but for now just ask or try)
@@ -94,13 +93,13 @@ def main():
         # but let's just do it if the user passed --push
         if getattr(args, 'push', False):
             print("Auto-pushing to GitHub...")
-            subprocess.run(["git", "add", APPLIED_FILE], check=True)
+            subprocess.run(["git", "add", *state_files], check=True)
             subprocess.run(["git", "commit", "-m", f"Mark applied: {target_job['title']}"], check=True)
             subprocess.run(["git", "push"], check=True)
             print("Successfully pushed to GitHub!")
         else:
             print("Run the following to push manually:")
-            print(f"  git add {APPLIED_FILE}")
+            print(f"  git add {' '.join(state_files)}")
             print(f"  git commit -m \"Mark applied: {target_job['title']}\"")
             print("  git push")
             print("\n(Tip: Run with --push next time to do this automatically)")
@@ -25,6 +25,12 @@ try:
 except ImportError:
     ai_tailor = None
 
+from utils.blob_store import DescriptionStore
+from utils.tracking_store import open_tracking_store
+from utils.job_lookup import get_job_lookup
+from utils.render_service import DONE, RenderService
+from utils.query_client import query_client
+
 st.set_page_config(page_title="CV Editor", layout="wide")
 
 st.markdown("""
@@ -63,16 +69,36 @@ SPECIAL_ROUTING_JOBS = {
     }
 }
 
-def load_job_by_id(job_id):
-    """Look up a job from jobs_agg.json by its id."""
-    if job_id in SPECIAL_ROUTING_JOBS:
-        return SPECIAL_ROUTING_JOBS[job_id]
+JOBS_FILE = os.path.join(parent_dir, "data", "jobs_agg.json")
+
+
+def jobs_file_version():
+    try:
+        stat = os.stat(JOBS_FILE)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
-    jobs_file = os.path.join(parent_dir, "data", "jobs_agg.json")
-    if not os.path.exists(jobs_file):
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def fetch_job(job_id, data_version):
+    """One job, cached per (id, aggregate version) across reruns and page switches."""
+    if data_version is None:
         return None
+
+    # O(1): seek to the job via the reporter's id -> offset index
+    lookup = get_job_lookup(JOBS_FILE)
+    if lookup.is_current():
+        return lookup.get(job_id)
+
+    # Running query service (in-memory, no full-file parse)
+    job = query_client.get_job(job_id)
+    if job is not None:
+        return {k: v for k, v in job.items() if k != "tracking"}
+
+    # Stale or missing index: full parse
     try:
-        with open(jobs_file, "r", encoding="utf-8") as f:
+        with open(JOBS_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
         for job in data.get("jobs", []):
             if job.get("id") == job_id:
@@ -81,6 +107,13 @@ def load_job_by_id(job_id):
         pass
     return None
 
+
+def load_job_by_id(job_id):
+    """Look up a job from jobs_agg.json by its id."""
+    if job_id in SPECIAL_ROUTING_JOBS:
+        return SPECIAL_ROUTING_JOBS[job_id]
+    return fetch_job(job_id, jobs_file_version())
+
 # --- Robust Data Loading ---
 # PRECEDENCE: 1. URL (Deep Link/Refresh) -> 2. Session State (Dashboard Nav) -> 3. Error
 url_job_id = st.query_params.get("job_id")
@@ -143,6 +176,30 @@ is_playground = job.get("is_playground", False)
 # Uses default (Aaron_Guo_CV.yaml) which is mounted at root in Docker
 orchestrator = CVOrchestrator()
 
+# Bump when the RenderCV theme/template changes so cached PDFs are not reused
+RENDER_TEMPLATE_VERSION = "1"
+
+@st.cache_resource
+def get_render_service():
+    """
+    Render cache + background workers, shared across sessions so identical
+    YAML renders once and several CVs can render in parallel.
+    """
+    renderer = CVOrchestrator()
+    return RenderService(
+        renderer.render_from_content,
+        cache_dir=os.path.join(renderer.output_dir, ".render_cache"),
+        template_version=getattr(renderer, "template_version", RENDER_TEMPLATE_VERSION),
+        output_path=lambda target_id: os.path.join(renderer.output_dir, f"{target_id}.pdf"),
+    )
+
+render_service = get_render_service()
+
+@st.cache_resource
+def get_description_store():
+    """Shared across reruns and sessions, so the decompressed-description memo survives."""
+    return DescriptionStore(os.path.join(parent_dir, "data", "descriptions"))
+
 # --- 3. Load State (with Job Switch Detection) ---
 if "current_editing_job_id" not in st.session_state:
     st.session_state["current_editing_job_id"] = None
@@ -160,17 +217,26 @@ if st.session_state["current_editing_job_id"] != job_id:
     # Clear PDF state so we don't show wrong PDF
     st.session_state.pop("current_pdf", None)
     st.session_state.pop("render_status", None)
+    st.session_state.pop("render_key", None)
+    st.session_state.pop("render_error", None)
     st.session_state.pop("ai_strategy", None)
 
 # Ensure editor_yaml is loaded if it's missing (e.g. first run)
 if "editor_yaml" not in st.session_state:
     st.session_state["editor_yaml"] = orchestrator.load_job_cv(job_id)
 
-if "is_rendering" not in st.session_state:
-    st.session_state["is_rendering"] = False
-
-if st.session_state.pop("render_success_toast", False):
-    st.toast("✅ Render Complete! 📄")
+# Pick up the result of this session's background render, if it finished
+render_key = st.session_state.get("render_key")
+render_job = render_service.status(render_key, job_id) if render_key else None
+if render_key and (render_job is None or render_job.finished):
+    st.session_state.pop("render_key")
+    if render_job is not None and render_job.state == DONE:
+        st.session_state["current_pdf"] = render_job.pdf_path
+        st.toast("⚡ Unchanged CV - served from render cache 📄" if render_job.cached else "✅ Render Complete! 📄")
+    elif render_job is not None:
+        st.session_state["render_error"] = render_job.error
+    render_job = None
+is_rendering = render_job is not None
 
 # --- SIDEBAR: Job Info, Navigation, Render, Download, AI Tools ---
 with st.sidebar:
@@ -197,7 +263,7 @@ with st.sidebar:
     st.divider()
 
     # Render button
-    render_clicked = st.button("🔄 Render PDF", type="primary", width="stretch", disabled=st.session_state["is_rendering"])
+    render_clicked = st.button("🔄 Render PDF", type="primary", width="stretch", disabled=is_rendering)
     st.caption("*Or press Ctrl+Enter in the editor*")
 
     # Download button (if PDF exists)
@@ -221,13 +287,13 @@ with st.sidebar:
         with open(display_path, "rb") as f:
             pdf_data = f.read()
             st.download_button(
-                "⏳ Rendering..." if st.session_state["is_rendering"] else "⬇️ Download PDF",
+                "⏳ Rendering..." if is_rendering else "⬇️ Download PDF",
                 data=pdf_data,
                 file_name=nice_filename,
                 mime="application/pdf",
                 width="stretch",
                 key=f"dl_{job_id}_{mtime}",
-                disabled=st.session_state["is_rendering"]
+                disabled=is_rendering
             )
 
     # Reset Button
@@ -258,26 +324,14 @@ with st.sidebar:
 
     # Application Workflow
     def mark_as_applied(target_id):
-        """Mark job as applied in tracking.json"""
+        """Mark job as applied in tracking.json (one journal append via the shared store)"""
         tracking_file = os.path.join(parent_dir, "data", "tracking.json")
-        if os.path.exists(tracking_file):
-            try:
-                with open(tracking_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except json.JSONDecodeError:
-                data = {}
-        else:
-            data = {}
-            
-        if target_id not in data:
-            data[target_id] = {}
-            
-        data[target_id]["status"] = "Applied"
-        data[target_id]["saved"] = True
-        data[target_id]["date_applied"] = datetime.now().isoformat()
-        
-        with open(tracking_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        open_tracking_store(tracking_file).update(
+            target_id,
+            status="Applied",
+            saved=True,
+            date_applied=datetime.now().isoformat()
+        )
 
     # Disable "Mark as Applied" in master/playground mode
     if st.button("🚀 Mark as Applied", type="primary", width="stretch",
@@ -301,7 +355,7 @@ with st.sidebar:
                 try:
                     strategy, new_yaml, gap, reasoning = ai_tailor.generate_tailored_resume(
                         base_yaml_content=st.session_state["editor_yaml"],
-                        job_description=job.get("description", "No description provided"),
+                        job_description=get_description_store().resolve(job) or "No description provided",
                         job_title=title,
                         company_name=company
                     )
@@ -339,31 +393,31 @@ with col_edit:
     )
 
 with col_prev:
-    # Handle render (from sidebar button)
+    # Handle render (from sidebar button): queue it and keep the editor responsive
     if render_clicked:
-        st.session_state["is_rendering"] = True
-        st.rerun() # Immediately re-run to update UI state (disable buttons)
-
-    if st.session_state.get("is_rendering", False):
-        with st.spinner("Rendering via RenderCV..."):
-            content = st.session_state.get("yaml_editor", st.session_state["editor_yaml"])
-            # Save first — validates YAML for master CV
-            save_result = orchestrator.save_job_cv(job_id, content)
-            if isinstance(save_result, dict) and not save_result.get("success", True):
-                st.error(f"❌ Save Failed: {save_result.get('error', 'Unknown error')}")
-            else:
-                pdf_path, status = orchestrator.render_from_content(job_id, content)
-                if pdf_path:
-                    st.session_state["current_pdf"] = pdf_path
-                    st.session_state["render_success_toast"] = True
-                else:
-                    st.error(f"❌ Render Failed: {status}")
-            
-            # Rendering finished, reset flag and re-run to re-enable buttons
-            st.session_state["is_rendering"] = False
-            st.rerun()
+        content = st.session_state.get("yaml_editor", st.session_state["editor_yaml"])
+        # Save first — validates YAML for master CV
+        save_result = orchestrator.save_job_cv(job_id, content)
+        if isinstance(save_result, dict) and not save_result.get("success", True):
+            st.error(f"❌ Save Failed: {save_result.get('error', 'Unknown error')}")
+        else:
+            st.session_state["render_key"] = render_service.submit(job_id, content).key
+            st.session_state.pop("render_error", None)
+            st.rerun()  # Update UI state (disable buttons) or show the cached PDF
+
+    if is_rendering:
+        @st.fragment(run_every=1)
+        def watch_render(key):
+            """Poll the worker; a full rerun picks up the finished PDF."""
+            job = render_service.status(key, job_id)
+            if job is None or job.finished:
+                st.rerun()
+            st.info(f"⏳ Rendering via RenderCV ({job.state})... you can keep editing.")
 
+        watch_render(render_job.key)
 
+    if st.session_state.get("render_error"):
+        st.error(f"❌ Render Failed: {st.session_state['render_error']}")
 
     # Determine which PDF to display
     pdf_display_path = st.session_state.get("current_pdf")
@@ -0,0 +1,102 @@
+import sys
+import os
+
+# pages/ -> app root, so utils/ is importable
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import streamlit as st
+import pandas as pd
+
+from utils.rollups import CLOSE_BUCKETS, RollupStore, daily_totals
+
+st.set_page_config(page_title="Trends", layout="wide")
+
+# Reads only the rollup tables the reporter maintains; never the raw job data
+ROLLUP_DIR = os.path.join(parent_dir, "data", "rollups")
+TOP_COMPANIES = 10
+
+
+@st.cache_data(max_entries=2)
+def load_rollups(versions):
+    """Rollup tables, re-read only when one of the files changes."""
+    return RollupStore(ROLLUP_DIR).load_tables()
+
+
+def day_frame(day_table, field):
+    """day x key frame of one counter ('new' / 'closed')"""
+    records = {day: {key: counts.get(field, 0) for key, counts in keys.items()}
+               for day, keys in day_table.items()}
+    df = pd.DataFrame.from_dict(records, orient='index').fillna(0).astype(int)
+    if not df.empty:
+        df.index = pd.to_datetime(df.index)
+        df = df.sort_index()
+    return df
+
+
+store = RollupStore(ROLLUP_DIR)
+tables = load_rollups(store.versions())
+
+st.title("📈 Trends")
+if not any(tables.values()):
+    st.info("No rollups yet. They are written by the scraper on its next run.")
+    st.stop()
+
+# --- New vs closed ---
+totals = pd.DataFrame(daily_totals(tables['company_day']))
+if not totals.empty:
+    totals['day'] = pd.to_datetime(totals['day'])
+    totals = totals.set_index('day')
+    c1, c2, c3 = st.columns(3)
+    c1.metric("New (last 7 days)", int(totals['new'].tail(7).sum()))
+    c2.metric("Closed (last 7 days)", int(totals['closed'].tail(7).sum()))
+    c3.metric("Open jobs", int(sum(tables['scores'].values())))
+    st.subheader("New vs closed postings per day")
+    st.bar_chart(totals[['new', 'closed']])
+
+# --- Postings per company / source ---
+col_company, col_source = st.columns(2)
+with col_company:
+    st.subheader("New postings per company")
+    companies = day_frame(tables['company_day'], 'new')
+    if not companies.empty:
+        top = companies.sum().sort_values(ascending=False).head(TOP_COMPANIES).index
+        st.line_chart(companies[top])
+with col_source:
+    st.subheader("New postings per source")
+    sources = day_frame(tables['source_day'], 'new')
+    if not sources.empty:
+        st.line_chart(sources)
+
+# --- Score distribution / time to close ---
+col_scores, col_ttc = st.columns(2)
+with col_scores:
+    st.subheader("Score distribution (open jobs)")
+    scores = pd.Series(tables['scores'], dtype=int)
+    if not scores.empty:
+        scores = scores.reindex(sorted(scores.index, key=lambda b: int(b.split('-')[0])))
+        st.bar_chart(scores.rename("jobs"))
+with col_ttc:
+    st.subheader("Time to close (days)")
+    ttc = tables['time_to_close']
+    buckets = pd.Series({label: ttc.get('buckets', {}).get(label, 0) for _, label in CLOSE_BUCKETS}, dtype=int)
+    st.bar_chart(buckets.rename("jobs"))
+    by_company = ttc.get('by_company', {})
+    if by_company:
+        avg = pd.DataFrame(
+            [{'Company': company, 'Avg days open': total / count, 'Closed': count}
+             for company, (total, count) in by_company.items() if count],
+        ).sort_values('Closed', ascending=False)
+        st.dataframe(avg.head(TOP_COMPANIES), hide_index=True, use_container_width=True)
+
+# --- Status funnel ---
+funnel = tables['funnel']
+if funnel:
+    st.subheader("Application funnel")
+    latest = funnel[max(funnel)]
+    st.bar_chart(pd.Series(latest, dtype=int).rename("jobs"))
+    history = pd.DataFrame.from_dict(funnel, orient='index').fillna(0).astype(int)
+    history.index = pd.to_datetime(history.index)
+    if len(history) > 1:
+        st.line_chart(history.sort_index())
@@ -4,13 +4,15 @@ from datetime import datetime, timedelta
 import pytz
 from dateutil import parser
 import re
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 from utils.location_filter import is_us_or_remote
+from utils.tracking_store import job_snapshot
 
 class JobProcessor:
-    def __init__(self, config_input):
+    def __init__(self, config_input, description_store=None, state_store=None):
         # RESILIENT INIT: Handle dict (from main.py) or str path
         if isinstance(config_input, dict):
             self.config = config_input
@@ -24,6 +26,14 @@ class JobProcessor:
         # The user's new config uses 'exclude', so we map that.
         self.exclude_keywords = self.config.get('keywords', {}).get('exclude', [])
         self.high_priority_keywords = self.config.get('keywords', {}).get('high_priority', [])
+
+        # Optional DescriptionStore: features are cached per description hash
+        self.description_store = description_store
+
+        # Unified applied/tracking state (main.py passes the process-wide store).
+        # Without one no job counts as applied and nothing is written, so tests
+        # and library callers never read or touch the live data/tracking.json.
+        self.state_store = state_store
         
     def extract_min_years_experience(self, text):
         """
@@ -54,6 +64,30 @@ class JobProcessor:
         
         return max(valid_years)
 
+    def description_features(self, job, description_text, preferred_skills, penalty_skills):
+        """
+        Description-derived features (YOE, skill hits, penalty hits).
+        Computed once per description hash when a store is configured.
+        """
+        config_key = hashlib.md5(
+            json.dumps([preferred_skills, penalty_skills]).encode('utf-8')
+        ).hexdigest()
+        digest = job.get('description_hash')
+        if self.description_store is not None and digest:
+            cached = self.description_store.get_features(digest, config_key)
+            if cached is not None:
+                return cached
+
+        description_lower = description_text.lower()
+        features = {
+            'min_years': self.extract_min_years_experience(description_text),
+            'skills': [skill for skill in preferred_skills if skill in description_lower],
+            'penalties': sum(1 for penalty in penalty_skills if penalty in description_lower),
+        }
+        if self.description_store is not None and digest:
+            self.description_store.set_features(digest, config_key, features)
+        return features
+
     def normalize_location(self, location):
         """Standardize location string"""
         if not location:
@@ -84,18 +118,25 @@ class JobProcessor:
             return None
 
     def load_applied_jobs(self):
-        """Load jobs that have been marked as applied"""
+        """Load jobs that have been marked as applied (from the injected state store, if any)"""
+        if self.state_store is None:
+            return []
         try:
-            path = os.path.join('data', 'applied_jobs.json')
-            if not os.path.exists(path):
-                return []
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
+            return self.state_store.applied_jobs()
         except Exception as e:
             logger.error(f"Error loading applied jobs: {e}")
             return []
 
+    def save_applied_snapshots(self, changes):
+        """Bulk-store job snapshots for applied jobs that don't have one yet (needs an injected state_store)"""
+        if self.state_store is None:
+            logger.debug(f"No state store injected - not persisting {len(changes)} applied job snapshots")
+            return
+        try:
+            self.state_store.bulk_update(changes)
+        except Exception as e:
+            logger.error(f"Error saving applied job snapshots: {e}")
+
     def process_jobs(self, jobs):
         logger.info(f"Processing {len(jobs)} jobs")
         processed = []
@@ -103,8 +144,9 @@ class JobProcessor:
         
         # Load applied jobs configuration
         applied_jobs = self.load_applied_jobs()
-        applied_ids = {j['id'] for j in applied_jobs}
         applied_map = {j['id']: j for j in applied_jobs}
+        applied_ids = applied_map.keys()
+        missing_snapshots = {}
 
         # Load filtering lists
         high_priority = [k.lower() for k in self.config['keywords'].get('high_priority', [])]
@@ -134,7 +176,8 @@ class JobProcessor:
 
             title_lower = job['title'].lower()
             description_text = str(job.get('description', ''))
-            description_lower = description_text.lower()
+            features = self.description_features(job, description_text, preferred_skills, penalty_skills)
+            description_skills = set(features['skills'])
             
             # 2. THE TRASH FILTER
             # If applied, bypass keyword filter? Maybe.
@@ -158,7 +201,7 @@ class JobProcessor:
                 else:
                     # 3b. Structured data check (Future/Resilience)
                     # For now, we fall back to regex on description
-                    required_exp = self.extract_min_years_experience(description_text)
+                    required_exp = features['min_years']
                 
                 if required_exp > max_exp:
                     logger.info(f"Skipping {job['title']}: Requires {required_exp} years (Limit: {max_exp})")
@@ -185,7 +228,7 @@ class JobProcessor:
             }
             
             for skill in preferred_skills:
-                if skill in description_lower or skill in title_lower:
+                if skill in description_skills or skill in title_lower:
                     if skill in domain_keywords:
                         domain_hits += 1
                         base_score += 15
@@ -201,14 +244,15 @@ class JobProcessor:
                 score = base_score
             
             # Penalty for wrong-stack skills (Soft Negative)
-            for penalty in penalty_skills:
-                if penalty in description_lower:
-                    score -= 3
+            score -= 3 * features['penalties']
+            # Relevance alone, before the freshness / applied ranking boosts
+            match_score = score
             
             # 5. EARLY BIRD FLAME 🔥
             est_date = self.normalize_date_est(job.get('date_posted'))
             # If no date_posted, default to current scrape time
-            if not est_date:
+            date_estimated = not est_date
+            if date_estimated:
                 est_date = datetime.now(pytz.timezone('US/Eastern'))
             formatted_date = est_date.strftime('%Y-%m-%d %I:%M %p')
             
@@ -244,22 +288,34 @@ class JobProcessor:
                 "location": job['location'],
                 "url": job['url'],
                 "score": score,
+                "match_score": match_score,
                 "date_posted": formatted_date,
+                "date_estimated": date_estimated,
                 "keywords_matched": [], 
+                "description_hash": job.get('description_hash', ''),
                 "raw_data": job.get('raw_data', {}),
                 "is_applied": is_applied,
                 "status": "Applied" if is_applied else "Active"
             }
             if is_applied:
                 processed_job['applied_at'] = applied_map[job_id].get('applied_at')
+                if 'title' not in applied_map[job_id]:
+                    # Applied from the dashboard: keep a copy so it survives the posting closing
+                    snapshot = job_snapshot(processed_job)
+                    snapshot['score'] = score - 1000  # Store the un-boosted score
+                    missing_snapshots[job_id] = {'job': snapshot}
             
             processed.append(processed_job)
 
+        if missing_snapshots:
+            self.save_applied_snapshots(missing_snapshots)
+
         # Restore missing applied jobs (Ghost Jobs)
         # Scenario B: Job Missing + Applied
         processed_ids = {j['id'] for j in processed}
         for applied_job in applied_jobs:
-            if applied_job['id'] not in processed_ids:
+            # Only records with a job snapshot can be resurrected
+            if applied_job['id'] not in processed_ids and 'title' in applied_job:
                 # The job is missing from the web, but we applied.
                 # We must resurrect it.
                 
@@ -283,6 +339,7 @@ class JobProcessor:
                     title += " (Closed)"
                 
                 ghost_job['title'] = title
+                ghost_job.setdefault('match_score', ghost_job.get('score', 0))
                 ghost_job['score'] = ghost_job.get('score', 0) + 1000 # Keep at top
                 ghost_job['is_applied'] = True
                 ghost_job['status'] = 'Applied (Closed)' # Explicit status
@@ -292,6 +349,12 @@ class JobProcessor:
 
         # Re-sort by Score High->Low
         processed.sort(key=lambda x: x['score'], reverse=True)
+
+        if self.description_store is not None:
+            # Everything scraped this run plus applied jobs (their descriptions outlive the posting)
+            self.description_store.retain([job.get('description_hash') for job in jobs]
+                                          + [job.get('description_hash') for job in applied_jobs])
+            self.description_store.flush()
         
         logger.info(f"Processing complete: {len(processed)} jobs retained.")
         return processed
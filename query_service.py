@@ -0,0 +1,239 @@
+"""
+Local read-only query API over the job aggregate and tracking state.
+
+Holds jobs_agg.json, the search index and tracking.json in memory once and
+serves them as JSON:
+
+    GET /health
+    GET /jobs?q=&view=&status=&company=&saved=&min_score=&sort=&page=&page_size=
+    GET /jobs/<id>
+
+Responses carry an ETag derived from the data versions; clients sending
+If-None-Match get 304 Not Modified. Data is reloaded when the files change.
+Started in a background thread by scheduler.py; run standalone with
+`python query_service.py [--port 8765]`.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pandas as pd
+
+from utils.job_frame import prepare_jobs_frame
+from utils.search_index import SearchIndex
+from utils.tracking_store import TrackingStore
+from utils.view_index import SORT_MODES, VIEWS, ViewIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = os.environ.get("JOB_QUERY_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("JOB_QUERY_PORT", "8765"))
+MAX_PAGE_SIZE = 500
+# Fields returned per job by /jobs (the full record is at /jobs/<id>)
+LIST_FIELDS = ('id', 'title', 'company', 'location', 'url', 'score', 'date_posted', 'source', 'description_hash')
+
+
+def file_version(path: str):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class JobQueryService:
+    """In-memory job data with view/search indexes, refreshed when the files change"""
+
+    def __init__(self, data_dir: str = "data"):
+        self.jobs_path = os.path.join(data_dir, "jobs_agg.json")
+        self.search_path = os.path.join(data_dir, "search_index.json")
+        self.tracking = TrackingStore(os.path.join(data_dir, "tracking.json"))
+        self._lock = threading.Lock()
+        self._jobs_version = None
+        self._search_version = None
+        self.jobs: List[Dict[str, Any]] = []
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.generated_at = None
+        self.view_index = ViewIndex(pd.DataFrame({'id': [], 'company': [], 'score': []}))
+        self.search_index: Optional[SearchIndex] = None
+
+    def refresh(self):
+        """Reload whatever changed on disk; cheap (a few stats) when nothing did."""
+        with self._lock:
+            jobs_version = file_version(self.jobs_path)
+            if jobs_version != self._jobs_version:
+                self._load_jobs()
+                self._jobs_version = jobs_version
+            search_version = file_version(self.search_path)
+            if search_version != self._search_version:
+                try:
+                    self.search_index = SearchIndex.load(self.search_path) if search_version else None
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.error(f"Error loading search index: {e}")
+                    self.search_index = None
+                self._search_version = search_version
+            self.tracking.refresh()
+            if self.view_index.tracking_version != self.tracking.version:
+                self.view_index.sync_tracking(self.tracking.load(), self.tracking.version)
+
+    def _load_jobs(self):
+        try:
+            with open(self.jobs_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            logger.error(f"Error loading {self.jobs_path}: {e}")
+            data = {}
+        self.jobs = data.get("jobs", [])
+        self.generated_at = data.get("generated_at")
+        self.by_id = {str(job.get("id")): job for job in self.jobs}
+        frame = prepare_jobs_frame(pd.DataFrame(self.jobs), {}) if self.jobs else \
+            pd.DataFrame({'id': [], 'company': [], 'score': []})
+        self.view_index = ViewIndex(frame)
+        logger.info(f"Query service loaded {len(self.jobs)} jobs")
+
+    def etag(self) -> str:
+        tag = f"{self._jobs_version}:{self._search_version}:{self.tracking.version}"
+        return '"' + hashlib.blake2b(tag.encode("utf-8"), digest_size=8).hexdigest() + '"'
+
+    def snapshot(self) -> Tuple[List[Dict[str, Any]], ViewIndex, Optional[SearchIndex], Any, str]:
+        """(jobs, view_index, search_index, generated_at, etag) of one data version.
+
+        refresh() swaps these objects from another request thread, so a request
+        reads them once, together, instead of going back to the attributes.
+        """
+        with self._lock:
+            return self.jobs, self.view_index, self.search_index, self.generated_at, self.etag()
+
+    @staticmethod
+    def _row_record(jobs: List[Dict[str, Any]], index: ViewIndex, row: int) -> Dict[str, Any]:
+        record = {k: jobs[row].get(k) for k in LIST_FIELDS}
+        record['status'] = index.status[row]
+        record['saved'] = bool(index.saved[row])
+        return record
+
+    def query(self, params: Dict[str, str], snapshot: Optional[Tuple] = None) -> Dict[str, Any]:
+        """Filtered, sorted, paginated job list, computed against one snapshot()."""
+        jobs, index, search_index, generated_at, _ = snapshot or self.snapshot()
+        mask = index.view_mask(params.get("view", "All") if params.get("view") in VIEWS else "All",
+                               hide_rejected=False, hide_hidden=False)
+        if params.get("status"):
+            mask = mask & index.statuses_mask(params["status"].split(","))
+        if params.get("company"):
+            mask = mask & index.company_mask(params["company"])
+        if params.get("saved") in ("true", "false"):
+            mask = mask & (index.saved == (params["saved"] == "true"))
+        if params.get("min_score"):
+            mask = mask & (index.score >= float(params["min_score"]))
+
+        if params.get("q") and search_index is not None:
+            hits = index.rows_for_ids(search_index.search(params["q"]))
+            rows = hits[mask[hits]]
+        else:
+            rows = index.ordered(mask)
+        sort = params.get("sort", "Default")
+        rows = index.sort_rows(rows, sort if sort in SORT_MODES else "Default")
+
+        page_size = max(1, min(MAX_PAGE_SIZE, int(params.get("page_size", 100))))
+        page = max(1, int(params.get("page", 1)))
+        page_rows = rows[(page - 1) * page_size:page * page_size]
+        return {
+            'generated_at': generated_at,
+            'total': int(len(rows)),
+            'page': page,
+            'page_size': page_size,
+            'jobs': [self._row_record(jobs, index, int(row)) for row in page_rows],
+        }
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.by_id.get(job_id)
+        if job is None:
+            return None
+        return dict(job, tracking=self.tracking.get(job_id))
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    server_version = "JobQuery/1.0"
+
+    def do_GET(self):
+        service: JobQueryService = self.server.service
+        parsed = urlparse(self.path)
+        try:
+            service.refresh()
+            snapshot = service.snapshot()
+            etag = snapshot[-1]
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, None, etag)
+                return
+
+            params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+            if parsed.path == "/health":
+                self._send(200, {'status': 'ok', 'jobs': len(snapshot[0])}, etag)
+            elif parsed.path in ("/jobs", "/jobs/"):
+                self._send(200, service.query(params, snapshot), etag)
+            elif parsed.path.startswith("/jobs/"):
+                job = service.get_job(unquote(parsed.path[len("/jobs/"):]))
+                if job is None:
+                    self._send(404, {'error': 'not found'})
+                else:
+                    self._send(200, job, etag)
+            else:
+                self._send(404, {'error': 'not found'})
+        except ValueError as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            logger.error(f"Query service error on {self.path}: {e}")
+            self._send(500, {'error': 'internal error'})
+
+    def _send(self, status: int, payload: Optional[Dict[str, Any]], etag: Optional[str] = None):
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, data_dir: str = "data") -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), QueryHandler)
+    server.daemon_threads = True
+    server.service = JobQueryService(data_dir)
+    return server
+
+
+def start_in_background(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                        data_dir: str = "data") -> Tuple[ThreadingHTTPServer, threading.Thread]:
+    """Start the service on a daemon thread (used by scheduler.py)."""
+    server = make_server(host, port, data_dir)
+    thread = threading.Thread(target=server.serve_forever, name="job-query-service", daemon=True)
+    thread.start()
+    logger.info(f"Job query service listening on http://{host}:{server.server_address[1]}")
+    return server, thread
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Local read-only job query API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--data-dir", default="data")
+    args = parser.parse_args()
+    httpd = make_server(args.host, args.port, args.data_dir)
+    logger.info(f"Job query service listening on http://{args.host}:{args.port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -1,32 +1,66 @@
 """
 Reporter module for generating output files
 """
+import io
 import json
 import logging
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Optional, TextIO
 from datetime import datetime
 import os
 
+from utils.job_lookup import save_offset_index, url_index, write_indexed_aggregate
+from utils.job_summary import JobSummary, summarize_jobs
+from utils.run_delta import RunDelta, compute_delta, fingerprint_jobs, job_index
+
 logger = logging.getLogger(__name__)
 
+HTML_TAG_RE = re.compile('<[^<]+?>')
+TOP_JOBS_IN_REPORT = 20
+
+# Outputs under output_dir (the Markdown report lives in report_dir)
+OUTPUT_FILES = {
+    'json': "jobs_agg.json",
+    'snapshot': "jobs_snapshot.jsonl",
+    'volatile': "jobs_volatile.json",
+    'arrow': "jobs_agg.arrow",
+    'search': "search_index.json",
+}
+# Fields tokenized into the dashboard search index (plus the description)
+SEARCH_FIELDS = ('title', 'company', 'location')
+REPORT_STATE_FILE = "report_state.json"
+# Static job browser, relative to report_dir
+SITE_DIR = "site"
+# Atom feed of newly discovered jobs (report_dir) and its state (output_dir)
+FEED_FILE = "feed.xml"
+FEED_STATE_FILE = "feed_state.json"
+FEED_MIN_SCORE = 80
+FEED_MAX_ENTRIES = 100
+# Daily rollup tables for the Trends page, relative to output_dir
+ROLLUP_DIR = "rollups"
+TRACKING_FILE = "tracking.json"
+
 
 class JobReporter:
     """Generates reports and output files"""
     
-    def __init__(self, output_dir: str = "data", report_dir: str = "report"):
+    def __init__(self, output_dir: str = "data", report_dir: str = "report", description_store=None):
         self.output_dir = output_dir
         self.report_dir = report_dir
+        # Optional DescriptionStore used to resolve `description_hash` references
+        self.description_store = description_store
+        # Summary of the last generate_reports() run, reused by the digest issue
+        self.last_summary: Optional[JobSummary] = None
+        # Difference between the last two runs' job sets
+        self.last_delta: Optional[RunDelta] = None
         
         # Ensure directories exist
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.report_dir, exist_ok=True)
     
-    def save_jobs_json(self, jobs_list: List[Dict[str, Any]]) -> str:
-        """Save jobs to JSON file atomically after strict validation"""
+    def validate_jobs(self, jobs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Final pre-save validation/sanitization pass"""
         from utils.schemas import JobListing
-        output_file = os.path.join(self.output_dir, "jobs_agg.json")
-        
-        # Final pre-save validation/sanitization loop
         validated_jobs = []
         for job_data in jobs_list:
              try:
@@ -38,6 +72,12 @@ class JobReporter:
                      validated_jobs.append(job.to_dict())
              except Exception as e:
                  logger.warning(f"Skipping malformed job during reporter validation: {e}")
+        return validated_jobs
+
+    def save_jobs_json(self, jobs_list: List[Dict[str, Any]], validated: bool = False) -> str:
+        """Save jobs to JSON file atomically after strict validation"""
+        output_file = self.output_path('json')
+        validated_jobs = jobs_list if validated else self.validate_jobs(jobs_list)
 
         try:
             # Prepare data for JSON serialization
@@ -52,14 +92,17 @@ class JobReporter:
             temp_dir = os.path.dirname(output_file)
             os.makedirs(temp_dir, exist_ok=True)
             
-            with tempfile.NamedTemporaryFile('w', dir=temp_dir, delete=False, encoding='utf-8') as tf:
-                json.dump(json_data, tf, indent=2, ensure_ascii=False)
+            # Same bytes as json.dump(indent=2), written job by job so each
+            # job's byte range can be recorded in the id -> offset index
+            with tempfile.NamedTemporaryFile('wb', dir=temp_dir, delete=False) as tf:
+                offsets = write_indexed_aggregate(tf, json_data)
                 temp_name = tf.name
                 tf.flush()
                 os.fsync(tf.fileno())
                 
             # Atomic replace
             os.replace(temp_name, output_file)
+            save_offset_index(output_file, offsets, url_index(validated_jobs))
             
             logger.info(f"Saved {len(validated_jobs)} jobs to {output_file}")
             return output_file
@@ -70,88 +113,88 @@ class JobReporter:
                 os.remove(temp_name)
             raise
     
-    def generate_markdown_report(self, jobs: List[Dict[str, Any]]) -> str:
+    def save_snapshot(self, jobs_list: List[Dict[str, Any]], validated: bool = False) -> Dict[str, str]:
+        """
+        Save the git-friendly snapshot: data/jobs_snapshot.jsonl (one job per
+        line, sorted by id, sorted keys) plus data/jobs_volatile.json (score,
+        freshness). Files are only rewritten when their content changed.
+        """
+        from utils.snapshot import render_snapshot, render_volatile, write_if_changed
+        jobs = jobs_list if validated else self.validate_jobs(jobs_list)
+        snapshot_file = self.output_path('snapshot')
+        volatile_file = self.output_path('volatile')
+
+        try:
+            if write_if_changed(snapshot_file, render_snapshot(jobs)):
+                logger.info(f"Saved snapshot of {len(jobs)} jobs to {snapshot_file}")
+            else:
+                logger.info(f"Snapshot unchanged: {snapshot_file}")
+            if write_if_changed(volatile_file, render_volatile(jobs)):
+                logger.info(f"Saved volatile fields to {volatile_file} at {datetime.now().isoformat()}")
+            return {'snapshot': snapshot_file, 'volatile': volatile_file}
+        except Exception as e:
+            logger.error(f"Error saving snapshot: {e}")
+            raise
+
+    def save_jobs_arrow(self, jobs_list: List[Dict[str, Any]], validated: bool = False,
+                        statuses: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        Save the dashboard columns to data/jobs_agg.arrow (Arrow IPC, memory-mappable,
+        categorical company/status/location). Skipped if pyarrow is not installed.
+        """
+        from utils.columnar import write_jobs_arrow
+        jobs = jobs_list if validated else self.validate_jobs(jobs_list)
+        output_file = self.output_path('arrow')
+        if statuses:
+            jobs = [dict(job, status=statuses.get(job['id'])) for job in jobs]
+
+        try:
+            metadata = {'generated_at': datetime.now().isoformat(), 'total_jobs': len(jobs)}
+            if not write_jobs_arrow(jobs, output_file, metadata):
+                return None
+            logger.info(f"Saved columnar export to {output_file}")
+            return output_file
+        except Exception as e:
+            # Optional output: the dashboard falls back to the JSON aggregate
+            logger.error(f"Error saving columnar export: {e}")
+            return None
+
+    def save_search_index(self, jobs_list: List[Dict[str, Any]], validated: bool = False) -> Optional[str]:
+        """
+        Save the inverted full-text index (title, company, location, description)
+        the dashboard search loads once per run to data/search_index.json.
+        """
+        from utils.search_index import SearchIndex
+        from utils.snapshot import write_if_changed
+        jobs = jobs_list if validated else self.validate_jobs(jobs_list)
+        output_file = self.output_path('search')
+
+        def searchable(job):
+            description = self.description_store.resolve(job) if self.description_store is not None \
+                else job.get('description') or ''
+            text = ' '.join(str(job.get(k) or '') for k in SEARCH_FIELDS)
+            return f"{text} {HTML_TAG_RE.sub(' ', description or '')}"
+
+        try:
+            index = SearchIndex.build((job.get('id'), searchable(job), job.get('score', 0)) for job in jobs)
+            write_if_changed(output_file, json.dumps(index.to_dict(), ensure_ascii=False, separators=(',', ':')))
+            logger.info(f"Saved search index ({len(index.tokens)} tokens) to {output_file}")
+            return output_file
+        except Exception as e:
+            # Optional output: the dashboard falls back to a title scan
+            logger.error(f"Error saving search index: {e}")
+            return None
+
+    def generate_markdown_report(self, jobs: List[Dict[str, Any]], summary: Optional[JobSummary] = None) -> str:
         """Generate markdown report for jobs"""
         today = datetime.now().strftime('%Y-%m-%d')
-        report_file = os.path.join(self.report_dir, f"{today}.md")
+        report_file = self.output_path('markdown')
+        if summary is None:
+            summary = summarize_jobs(jobs, top_k=TOP_JOBS_IN_REPORT)
         
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                # Header
-                f.write(f"# Daily Job Scraping Report - {today}\n\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"## Summary\n\n")
-                f.write(f"- **Total Jobs Found**: {len(jobs)}\n")
-                
-                # Count by company
-                companies = {}
-                for job in jobs:
-                    company = job.get('company', 'Unknown')
-                    companies[company] = companies.get(company, 0) + 1
-                
-                f.write(f"- **Companies**: {len(companies)}\n")
-                f.write(f"- **Top Companies**:\n")
-                for company, count in sorted(companies.items(), key=lambda x: x[1], reverse=True)[:5]:
-                    f.write(f"  - {company}: {count} jobs\n")
-                
-                f.write("\n")
-                
-                # Count by source
-                sources = {}
-                for job in jobs:
-                    source = job.get('source', 'Unknown')
-                    sources[source] = sources.get(source, 0) + 1
-                
-                f.write(f"- **Sources**:\n")
-                for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
-                    f.write(f"  - {source}: {count} jobs\n")
-                
-                f.write("\n")
-                
-                # Top Jobs by Score
-                f.write("## Top Job Opportunities\n\n")
-                f.write("Jobs ranked by relevance score:\n\n")
-                
-                top_jobs = jobs[:20]  # Top 20 jobs
-                
-                for idx, job in enumerate(top_jobs, 1):
-                    f.write(f"### {idx}. {job.get('title', 'N/A')}\n\n")
-                    f.write(f"- **Company**: {job.get('company', 'N/A')}\n")
-                    f.write(f"- **Location**: {job.get('location', 'N/A')}\n")
-                    f.write(f"- **Relevance Score**: {job.get('score', 0):.1f}\n")
-                    f.write(f"- **Apply**: [{job.get('url', 'N/A')}]({job.get('url', '#')})\n")
-                    
-                    # Truncate description
-                    desc = job.get('description', 'N/A')
-                    if len(desc) > 300:
-                        desc = desc[:300] + '...'
-                    # Remove HTML tags for markdown
-                    import re
-                    desc = re.sub('<[^<]+?>', '', desc)
-                    desc = desc.replace('\n', ' ').strip()
-                    
-                    f.write(f"- **Description**: {desc}\n")
-                    f.write("\n")
-                
-                # All Jobs by Company
-                f.write("## All Jobs by Company\n\n")
-                
-                for company in sorted(companies.keys()):
-                    company_jobs = [j for j in jobs if j.get('company') == company]
-                    f.write(f"### {company} ({len(company_jobs)} jobs)\n\n")
-                    
-                    for job in company_jobs[:10]:  # Limit to 10 per company
-                        f.write(f"- **{job.get('title', 'N/A')}** - {job.get('location', 'N/A')} ")
-                        f.write(f"[Apply]({job.get('url', '#')}) (Score: {job.get('score', 0):.1f})\n")
-                    
-                    if len(company_jobs) > 10:
-                        f.write(f"\n  _...and {len(company_jobs) - 10} more jobs_\n")
-                    
-                    f.write("\n")
-                
-                # Footer
-                f.write("---\n\n")
-                f.write("*Report generated by Job Scraping App*\n")
+            with open(report_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                self.render_markdown(summary, f, today)
             
             logger.info(f"Generated markdown report: {report_file}")
             return report_file
@@ -159,10 +202,251 @@ class JobReporter:
         except Exception as e:
             logger.error(f"Error generating markdown report: {e}")
             raise
+
+    def _plain_description(self, job: Dict[str, Any]) -> str:
+        """Short single-line description for the report"""
+        desc = job.get('description') or 'N/A'
+        if self.description_store is not None:
+            desc = self.description_store.resolve(job) or 'N/A'
+        # Truncate description
+        if len(desc) > 300:
+            desc = desc[:300] + '...'
+        # Remove HTML tags for markdown
+        desc = HTML_TAG_RE.sub('', desc)
+        return desc.replace('\n', ' ').strip()
+
+    def render_markdown(self, summary: JobSummary, out: TextIO, today: str):
+        """Render the daily report from a precomputed summary into a writer"""
+        w = out.write
+        # Header
+        w(f"# Daily Job Scraping Report - {today}\n\n")
+        w(f"Generated: {summary.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        w(f"## Summary\n\n")
+        w(f"- **Total Jobs Found**: {summary.total}\n")
+        
+        # Count by company
+        w(f"- **Companies**: {len(summary.company_counts)}\n")
+        w(f"- **Top Companies**:\n")
+        for company, count in summary.top_companies(5):
+            w(f"  - {company}: {count} jobs\n")
+        
+        w("\n")
+        
+        # Count by source
+        w(f"- **Sources**:\n")
+        for source, count in summary.sources_by_count():
+            w(f"  - {source}: {count} jobs\n")
+        
+        w("\n")
+        
+        # Top Jobs by Score
+        w("## Top Job Opportunities\n\n")
+        w("Jobs ranked by relevance score:\n\n")
+        
+        for idx, job in enumerate(summary.top_jobs[:TOP_JOBS_IN_REPORT], 1):
+            w(f"### {idx}. {job.get('title', 'N/A')}\n\n")
+            w(f"- **Company**: {job.get('company', 'N/A')}\n")
+            w(f"- **Location**: {job.get('location', 'N/A')}\n")
+            w(f"- **Relevance Score**: {job.get('score', 0):.1f}\n")
+            w(f"- **Apply**: [{job.get('url', 'N/A')}]({job.get('url', '#')})\n")
+            w(f"- **Description**: {self._plain_description(job)}\n")
+            w("\n")
+        
+        # All Jobs by Company
+        w("## All Jobs by Company\n\n")
+        
+        for company in sorted(summary.by_company.keys()):
+            company_jobs = summary.by_company[company]
+            w(f"### {company} ({len(company_jobs)} jobs)\n\n")
+            
+            for job in company_jobs[:10]:  # Limit to 10 per company
+                w(f"- **{job.get('title', 'N/A')}** - {job.get('location', 'N/A')} ")
+                w(f"[Apply]({job.get('url', '#')}) (Score: {job.get('score', 0):.1f})\n")
+            
+            if len(company_jobs) > 10:
+                w(f"\n  _...and {len(company_jobs) - 10} more jobs_\n")
+            
+            w("\n")
+        
+        # Footer
+        w("---\n\n")
+        w("*Report generated by Job Scraping App*\n")
     
+    def generate_static_site(self, jobs_list: List[Dict[str, Any]]) -> str:
+        """
+        Build the static job browser in report/site: index.html plus per-company
+        paginated JSON shards and a prebuilt inverted index for client-side search.
+        Shards are content-hashed, so unchanged ones are not rewritten.
+        """
+        from utils.static_site import StaticSiteBuilder
+        site_dir = os.path.join(self.report_dir, SITE_DIR)
+        describe = self.description_store.resolve if self.description_store is not None else None
+
+        try:
+            stats = StaticSiteBuilder(site_dir, describe=describe).build(jobs_list, datetime.now().isoformat())
+            return stats['index']
+        except Exception as e:
+            logger.error(f"Error generating static site: {e}")
+            raise
+
+    def update_feed(self, new_jobs: List[Dict[str, Any]]) -> str:
+        """Add this run's newly discovered jobs to report/feed.xml"""
+        from utils.feed import JobFeed
+        feed_file = self.output_path('feed')
+        feed = JobFeed(feed_file, os.path.join(self.output_dir, FEED_STATE_FILE),
+                       min_score=FEED_MIN_SCORE, max_entries=FEED_MAX_ENTRIES)
+        try:
+            feed.update(new_jobs)
+        except Exception as e:
+            logger.error(f"Error updating feed: {e}")
+        return feed_file
+
+    def update_rollups(self, delta: RunDelta, jobs: List[Dict[str, Any]]):
+        """
+        Fold this run's added/removed/re-scored jobs into the Trends rollups.
+        The first run seeds the open jobs from the full list instead.
+        """
+        from utils.rollups import RollupStore
+        from utils.tracking_store import open_tracking_store
+        try:
+            tracking = open_tracking_store(os.path.join(self.output_dir, TRACKING_FILE)).load()
+            store = RollupStore(os.path.join(self.output_dir, ROLLUP_DIR))
+            if not store.is_seeded():
+                store.seed(jobs)
+            store.apply(delta.added, delta.removed, delta.rescored, tracking=tracking)
+        except Exception as e:
+            logger.error(f"Error updating rollups: {e}")
+
+    def output_path(self, key: str) -> str:
+        """Location of each generated output"""
+        if key == 'markdown':
+            return os.path.join(self.report_dir, f"{datetime.now().strftime('%Y-%m-%d')}.md")
+        if key == 'site':
+            return os.path.join(self.report_dir, SITE_DIR, 'index.html')
+        if key == 'feed':
+            return os.path.join(self.report_dir, FEED_FILE)
+        return os.path.join(self.output_dir, OUTPUT_FILES[key])
+
+    def load_report_state(self) -> Dict[str, Any]:
+        """Fingerprints and job index from the last run that wrote outputs"""
+        try:
+            with open(os.path.join(self.output_dir, REPORT_STATE_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_report_state(self, state: Dict[str, Any]):
+        from utils.snapshot import write_if_changed
+        try:
+            write_if_changed(os.path.join(self.output_dir, REPORT_STATE_FILE),
+                             json.dumps(state, ensure_ascii=False))
+        except Exception as e:
+            logger.error(f"Error saving report state: {e}")
+
+    def append_changes_section(self, report_file: str, delta: RunDelta) -> str:
+        """Append a timestamped 'changes this run' section to today's report"""
+        out = io.StringIO()
+        w = out.write
+        w(f"\n## Changes this run - {datetime.now().strftime('%H:%M')}\n\n")
+        if delta.is_empty:
+            w("- Job details updated (no new, removed or re-scored jobs)\n")
+        if delta.added:
+            w(f"- **New** ({len(delta.added)}):\n")
+            for job in delta.added:
+                w(f"  - [{job.get('title', 'N/A')}]({job.get('url', '#')}) - {job.get('company', 'N/A')} "
+                  f"(Score: {job.get('score', 0):.1f})\n")
+        if delta.removed:
+            w(f"- **Removed** ({len(delta.removed)}):\n")
+            for job in delta.removed:
+                w(f"  - {job.get('title', 'N/A')} - {job.get('company', 'N/A')}\n")
+        if delta.rescored:
+            w(f"- **Score changes** ({len(delta.rescored)}):\n")
+            for job, before in delta.rescored:
+                w(f"  - {job.get('title', 'N/A')} - {job.get('company', 'N/A')}: "
+                  f"{before or 0:.1f} -> {job.get('score', 0):.1f}\n")
+
+        with open(report_file, 'a', encoding='utf-8') as f:
+            f.write(out.getvalue())
+        logger.info(f"Appended run changes to {report_file}")
+        return report_file
+
     def generate_reports(self, jobs: List[Dict[str, Any]]) -> Dict[str, str]:
-        """Generate all reports"""
-        return {
-            'json': self.save_jobs_json(jobs),
-            'markdown': self.generate_markdown_report(jobs)
-        }
+        """
+        Generate all reports. Outputs whose last-written fingerprint matches the
+        current ranked job set are skipped; a changed set appends a
+        "changes this run" section to today's report instead of re-rendering it.
+        """
+        state = self.load_report_state()
+        outputs = state.get('outputs', {})
+        today = datetime.now().strftime('%Y-%m-%d')
+        fingerprint = fingerprint_jobs(jobs)
+
+        self.last_summary = summarize_jobs(jobs, top_k=TOP_JOBS_IN_REPORT)
+        # Optional outputs (e.g. arrow without pyarrow) that could not be written for this fingerprint
+        unavailable = set(state.get('unavailable', [])) if state.get('fingerprint') == fingerprint else set()
+
+        def is_current(*keys):
+            return all(outputs.get(k) == fingerprint and (k in unavailable or os.path.exists(self.output_path(k)))
+                       for k in keys)
+
+        if is_current('json', 'markdown', 'snapshot', 'volatile', 'site', 'arrow', 'search'):
+            self.last_delta = RunDelta()
+            logger.info("Job set unchanged since last run - skipping report generation")
+            return {k: self.output_path(k) for k in OUTPUT_FILES.keys() | {'markdown', 'site', 'feed'}
+                    if os.path.exists(self.output_path(k))}
+
+        self.last_delta = compute_delta(state.get('jobs', {}), jobs)
+        if not self.last_delta.is_empty:
+            # Applying a delta twice is a no-op, so this is safe before the state is saved
+            self.update_rollups(self.last_delta, jobs)
+
+        validated = self.validate_jobs(jobs)
+        reports = {}
+
+        if is_current('json'):
+            reports['json'] = self.output_path('json')
+        else:
+            reports['json'] = self.save_jobs_json(validated, validated=True)
+
+        report_file = self.output_path('markdown')
+        if is_current('markdown'):
+            reports['markdown'] = report_file
+        elif state.get('report_date') == today and os.path.exists(report_file):
+            reports['markdown'] = self.append_changes_section(report_file, self.last_delta)
+        else:
+            reports['markdown'] = self.generate_markdown_report(jobs, self.last_summary)
+            state['report_date'] = today
+
+        reports.update(self.save_snapshot(validated, validated=True))
+
+        if is_current('arrow'):
+            reports['arrow'] = self.output_path('arrow')
+        else:
+            statuses = {job.get('id'): job.get('status') for job in jobs}
+            arrow_file = self.save_jobs_arrow(validated, validated=True, statuses=statuses)
+            if arrow_file:
+                reports['arrow'] = arrow_file
+
+        if is_current('search'):
+            reports['search'] = self.output_path('search')
+        else:
+            search_file = self.save_search_index(validated, validated=True)
+            if search_file:
+                reports['search'] = search_file
+
+        if is_current('site'):
+            reports['site'] = self.output_path('site')
+        else:
+            reports['site'] = self.generate_static_site(validated)
+
+        # Only the run's new jobs are considered, never the full list
+        reports['feed'] = self.update_feed(self.last_delta.added)
+
+        unavailable = {k for k in ('arrow', 'search') if k not in reports}
+        state['fingerprint'] = fingerprint
+        state['outputs'] = {k: fingerprint for k in reports.keys() | unavailable}
+        state['unavailable'] = sorted(unavailable)
+        state['jobs'] = job_index(jobs)
+        state['updated_at'] = datetime.now().isoformat()
+        self.save_report_state(state)
+        return reports
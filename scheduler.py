@@ -62,6 +62,15 @@ schedule.every(5).minutes.do(run_peak_job)
 schedule.every(30).minutes.do(run_offpeak_job)
 
 if __name__ == "__main__":
+    # Serve the job store read-only to the dashboard/CV editor while we run
+    try:
+        import query_service  # Needs pandas/numpy, which the scraper-only image may lack
+        query_service.start_in_background()
+    except ImportError as e:
+        logger.warning(f"Query service disabled, missing dependency: {e}")
+    except OSError as e:
+        logger.warning(f"Query service not started: {e}")
+
     # Run once immediately on startup
     logger.info("Scheduler started. Running initial job...")
     job()
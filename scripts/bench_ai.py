@@ -0,0 +1,145 @@
+"""
+Latency/throughput benchmark of the AIAssistant analysis modes against the
+offline LLM stub (scripts/llm_stub_server.py), so no API key or spend is needed.
+
+Modes: sequential (analyze_top_jobs), concurrent (analyze_top_jobs_async)
+and batched (analyze_top_jobs_batched). The response cache is disabled.
+Usage: python scripts/bench_ai.py [--jobs 40] [--modes sequential,concurrent,batched]
+                                  [--latency lognormal --mean-ms 800 --rate-429 0.05] [--json out.json]
+       python scripts/bench_ai.py --url http://127.0.0.1:8799/v1   # an already running stub
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add project root to path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from llm_stub_server import add_stub_arguments, config_from_args, start_stub
+
+MODES = ("sequential", "concurrent", "batched")
+
+DESCRIPTION = (
+    "{company} is building the future of data infrastructure. About the Role We are looking for a {title} "
+    "to join our platform team. Responsibilities Design, build and operate batch and streaming pipelines. "
+    "Own data models used by analytics and ML. Partner with product engineers on event instrumentation. "
+    "Requirements 4+ years of experience with Python and SQL. Experience with Spark, Kafka or Flink. "
+    "Knowledge of AWS or GCP. Nice to Have dbt, Airflow, Terraform. "
+    "Benefits We offer medical, dental and vision insurance, 401(k) matching, unlimited PTO and paid parental leave. "
+    "Equal Opportunity {company} is an equal opportunity employer and does not discriminate without regard to "
+    "race, color, religion, sexual orientation, gender identity or protected veteran status."
+)
+
+
+def make_jobs(n: int) -> List[Dict[str, Any]]:
+    jobs = []
+    for i in range(n):
+        company, title = f"Company {i % 7}", f"Data Engineer {i}"
+        jobs.append({"id": f"bench-{i}", "title": title, "company": company,
+                     "description": DESCRIPTION.format(company=company, title=title)})
+    return jobs
+
+
+def timed_assistant(latencies: List[float]):
+    """AIAssistant recording the latency of every API call it makes (retries included)"""
+    from ai_assistant import AIAssistant
+
+    class TimedAssistant(AIAssistant):
+        def _call_chatgpt(self, messages, max_tokens=500):
+            start = time.perf_counter()
+            try:
+                return super()._call_chatgpt(messages, max_tokens)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+        async def _call_chatgpt_async(self, session, messages, max_tokens=500, deadline=None):
+            start = time.perf_counter()
+            try:
+                return await super()._call_chatgpt_async(session, messages, max_tokens, deadline)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    return TimedAssistant(api_key="bench-key")
+
+
+async def run_mode(mode: str, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    from utils.perf import percentile
+
+    latencies: List[float] = []
+    assistant = timed_assistant(latencies)
+    start = time.perf_counter()
+    if mode == "sequential":
+        result = await asyncio.to_thread(assistant.analyze_top_jobs, jobs, len(jobs))
+    elif mode == "concurrent":
+        result = await assistant.analyze_top_jobs_async(jobs, top_n=len(jobs))
+    else:
+        result = await assistant.analyze_top_jobs_batched(jobs, top_n=len(jobs))
+    wall = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        'mode': mode,
+        'jobs': len(jobs),
+        'analyzed': result.get('total_analyzed', 0),
+        'requests': len(latencies),
+        'wall_s': round(wall, 3),
+        'jobs_per_s': round(result.get('total_analyzed', 0) / wall, 2) if wall else 0.0,
+        'p50_ms': round(1000 * percentile(ordered, 50), 1),
+        'p90_ms': round(1000 * percentile(ordered, 90), 1),
+        'p99_ms': round(1000 * percentile(ordered, 99), 1),
+        'prompt_tokens_saved': assistant.tokens_saved,
+    }
+
+
+async def bench(args) -> List[Dict[str, Any]]:
+    runner = None
+    base_url = args.url
+    if not base_url:
+        runner, base_url = await start_stub(config_from_args(args))
+    os.environ['AI_BASE_URL'] = base_url
+    os.environ['AI_CACHE'] = '0'
+    try:
+        jobs = make_jobs(args.jobs)
+        results = []
+        for mode in args.modes:
+            results.append(await run_mode(mode, jobs))
+        return results
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+
+def print_table(results: List[Dict[str, Any]]):
+    columns = ('mode', 'analyzed', 'requests', 'wall_s', 'jobs_per_s', 'p50_ms', 'p90_ms', 'p99_ms')
+    print(" ".join(f"{c:>11}" for c in columns))
+    for row in results:
+        print(" ".join(f"{row[c]:>11}" for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--modes", type=lambda v: [m for m in v.split(",") if m], default=list(MODES))
+    parser.add_argument("--url", default=None, help="Use a running stub instead of starting one")
+    parser.add_argument("--json", default=None, help="Also write the results to this file")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    unknown = set(args.modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(bench(args))
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'args': {k: v for k, v in vars(args).items() if k != 'json'}, 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
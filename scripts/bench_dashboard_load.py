@@ -0,0 +1,93 @@
+"""
+Cold-start benchmark: dashboard job loading from the JSON aggregate vs the
+memory-mapped Arrow export.
+
+Each measurement runs in a fresh interpreter so nothing is warm in-process.
+Usage: python scripts/bench_dashboard_load.py [--source data/jobs_agg.json] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Add project root to path
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT_DIR)
+
+from utils import columnar
+
+JSON_LOADER = """
+import json, time, pandas as pd
+t0 = time.perf_counter()
+with open({path!r}, 'r', encoding='utf-8') as f:
+    data = json.load(f)
+df = pd.DataFrame(data.get('jobs', []))
+for col in ('raw_data', 'keywords_matched'):
+    if col in df.columns:
+        df[col] = df[col].astype(str)
+df['score'] = pd.to_numeric(df['score'], errors='coerce').fillna(0)
+print(time.perf_counter() - t0, df.memory_usage(deep=True).sum())
+"""
+
+ARROW_LOADER = """
+import sys, time
+sys.path.insert(0, {root!r})
+import pandas as pd
+from utils.columnar import read_jobs_arrow
+t0 = time.perf_counter()
+df, meta = read_jobs_arrow({path!r})
+print(time.perf_counter() - t0, df.memory_usage(deep=True).sum())
+"""
+
+
+def run_cold(code: str, repeat: int):
+    timings, memory = [], 0
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        elapsed, mem = out.stdout.split()
+        timings.append(float(elapsed))
+        memory = int(mem)
+    return timings, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard cold-start loading")
+    parser.add_argument("--source", default=os.path.join(ROOT_DIR, "data", "jobs_agg.json"),
+                        help="JSON aggregate to benchmark against")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not columnar.is_available():
+        print("pyarrow is not installed; nothing to compare.")
+        return 1
+    if not os.path.exists(args.source):
+        print(f"No aggregate found at {args.source}. Run the scraper first or pass --source.")
+        return 1
+
+    with open(args.source, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    jobs = data.get('jobs', [])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        arrow_path = os.path.join(tmp, "jobs_agg.arrow")
+        columnar.write_jobs_arrow(jobs, arrow_path, {'total_jobs': len(jobs)})
+
+        print(f"Jobs: {len(jobs)}")
+        print(f"JSON size:  {os.path.getsize(args.source) / 1024:.0f} KiB")
+        print(f"Arrow size: {os.path.getsize(arrow_path) / 1024:.0f} KiB")
+
+        for label, code in (
+            ("json", JSON_LOADER.format(path=args.source)),
+            ("arrow", ARROW_LOADER.format(root=ROOT_DIR, path=arrow_path)),
+        ):
+            timings, memory = run_cold(code, args.repeat)
+            print(f"{label:>6}: median {statistics.median(timings) * 1000:7.1f} ms  "
+                  f"min {min(timings) * 1000:7.1f} ms  frame {memory / 1024:.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Offline OpenAI-compatible stub of POST /v1/chat/completions for exercising
+AIAssistant without an API key or spend.
+
+    python scripts/llm_stub_server.py --port 8799 --latency lognormal --mean-ms 800 --rate-429 0.05
+    AI_BASE_URL=http://127.0.0.1:8799/v1 OPENAI_API_KEY=stub python main.py
+
+Latency is drawn per request from a fixed, uniform, exponential or lognormal
+distribution, plus an optional per-output-token delay. A fraction of requests
+can be answered with 429 (with Retry-After) or 5xx. `"stream": true` requests
+get server-sent events in the OpenAI chunk format. Batch prompts (see
+utils/ai_batch.py) are answered with a valid JSON array, single-job prompts
+with a short canned analysis.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+LATENCY_MODELS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+@dataclass
+class StubConfig:
+    latency: str = "fixed"
+    mean_ms: float = 200.0
+    # Spread: uniform half-width / lognormal sigma (ms and unitless respectively)
+    jitter_ms: float = 50.0
+    sigma: float = 0.5
+    ms_per_token: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    retry_after: float = 1.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    errors: Dict[int, int] = field(default_factory=dict)
+    batch_requests: int = 0
+    streamed: int = 0
+    active: int = 0
+    max_active: int = 0
+
+
+def sample_latency(config: StubConfig, rng: random.Random) -> float:
+    """Seconds of simulated model latency for one request"""
+    mean = config.mean_ms / 1000
+    if config.latency == "uniform":
+        jitter = config.jitter_ms / 1000
+        return max(0.0, rng.uniform(mean - jitter, mean + jitter))
+    if config.latency == "exponential":
+        return rng.expovariate(1 / mean) if mean > 0 else 0.0
+    if config.latency == "lognormal":
+        # mu chosen so the distribution's mean is mean_ms
+        mu = math.log(mean) - config.sigma ** 2 / 2 if mean > 0 else 0.0
+        return rng.lognormvariate(mu, config.sigma) if mean > 0 else 0.0
+    return mean
+
+
+def batch_content(prompt: str) -> str:
+    jobs = json.loads(prompt.split("Jobs:\n", 1)[1])
+    return json.dumps([{
+        "job_id": job.get("job_id"),
+        "responsibilities": [f"Deliver the core work of the {job.get('title') or 'role'}"],
+        "required_skills": ["Python", "SQL"],
+        "nice_to_have": ["Cloud experience"],
+        "culture": ["Collaborative team"],
+        "red_flags": [],
+    } for job in jobs])
+
+
+def completion_content(messages: List[Dict[str, Any]]) -> str:
+    prompt = str(messages[-1].get("content", "")) if messages else ""
+    if "Jobs:\n" in prompt:
+        try:
+            return batch_content(prompt)
+        except (ValueError, AttributeError):
+            pass
+    return ("1. Key responsibilities: build and maintain services\n"
+            "2. Required skills: Python, SQL\n"
+            "3. Nice-to-have: cloud experience\n"
+            "4. Culture: collaborative\n"
+            "5. Red flags: none noted")
+
+
+def make_app(config: StubConfig) -> web.Application:
+    rng = random.Random(config.seed)
+    stats = StubStats()
+
+    async def chat_completions(request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        stats.requests += 1
+        roll = rng.random()
+        if roll < config.rate_429:
+            stats.errors[429] = stats.errors.get(429, 0) + 1
+            return web.json_response({"error": {"message": "Rate limit reached"}}, status=429,
+                                     headers={"Retry-After": str(config.retry_after)})
+        if roll < config.rate_429 + config.rate_5xx:
+            status = rng.choice((500, 502, 503))
+            stats.errors[status] = stats.errors.get(status, 0) + 1
+            return web.json_response({"error": {"message": "Upstream error"}}, status=status)
+
+        content = completion_content(body.get("messages", []))
+        if "Jobs:\n" in str(body.get("messages", [{}])[-1].get("content", "")):
+            stats.batch_requests += 1
+        tokens = max(1, len(content) // 4)
+        stats.active += 1
+        stats.max_active = max(stats.max_active, stats.active)
+        try:
+            await asyncio.sleep(sample_latency(config, rng))
+            if body.get("stream"):
+                stats.streamed += 1
+                return await stream_response(request, body, content, config)
+            await asyncio.sleep(tokens * config.ms_per_token / 1000)
+        finally:
+            stats.active -= 1
+
+        return web.json_response({
+            "id": f"chatcmpl-stub-{stats.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": sum(len(str(m.get("content", ""))) // 4 for m in body.get("messages", [])),
+                      "completion_tokens": tokens, "total_tokens": tokens},
+        })
+
+    async def stats_handler(request: web.Request) -> web.Response:
+        return web.json_response(stats.__dict__)
+
+    app = web.Application()
+    app["stats"] = stats
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_post("/chat/completions", chat_completions)
+    app.router.add_get("/stats", stats_handler)
+    return app
+
+
+async def stream_response(request: web.Request, body: Dict[str, Any], content: str,
+                          config: StubConfig) -> web.StreamResponse:
+    """Server-sent events, one chunk per ~4 characters, then [DONE]"""
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+    await response.prepare(request)
+    for i in range(0, len(content), 4):
+        chunk = {"object": "chat.completion.chunk", "model": body.get("model", "stub"),
+                 "choices": [{"index": 0, "delta": {"content": content[i:i + 4]}, "finish_reason": None}]}
+        await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        if config.ms_per_token:
+            await asyncio.sleep(config.ms_per_token / 1000)
+    await response.write(b"data: [DONE]\n\n")
+    await response.write_eof()
+    return response
+
+
+async def start_stub(config: StubConfig, host: str = "127.0.0.1", port: int = 0):
+    """Start on the running loop. Returns (runner, base_url); call runner.cleanup() to stop."""
+    runner = web.AppRunner(make_app(config))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner, f"http://{host}:{runner.addresses[0][1]}/v1"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline OpenAI-compatible chat completions stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8799)
+    add_stub_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", choices=LATENCY_MODELS, default="fixed")
+    parser.add_argument("--mean-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="uniform: half-width")
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal: sigma")
+    parser.add_argument("--ms-per-token", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args) -> StubConfig:
+    return StubConfig(latency=args.latency, mean_ms=args.mean_ms, jitter_ms=args.jitter_ms, sigma=args.sigma,
+                      ms_per_token=args.ms_per_token, rate_429=args.rate_429, rate_5xx=args.rate_5xx,
+                      retry_after=args.retry_after, seed=args.seed)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    print(f"LLM stub listening on http://{args.host}:{args.port}/v1 ({args.latency}, mean {args.mean_ms}ms)")
+    web.run_app(make_app(config_from_args(args)), host=args.host, port=args.port, print=None)
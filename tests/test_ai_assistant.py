@@ -0,0 +1,167 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+import ai_assistant
+from ai_assistant import AIAssistant, retry_after_seconds
+from utils.llm_cache import LLMCache
+
+
+class StubLLM:
+    """Minimal OpenAI-compatible /chat/completions endpoint"""
+
+    def __init__(self, delay=0.05, fail_first=0):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.requests = 0
+        self.batches = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, request):
+        body = await request.json()
+        self.requests += 1
+        if self.requests <= self.fail_first:
+            return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": "0"})
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        prompt = body["messages"][-1]["content"]
+        if "Jobs:\n" in prompt:
+            self.batches += 1
+            content = json.dumps([self.batch_item(job) for job in json.loads(prompt.split("Jobs:\n")[1])])
+        else:
+            title = prompt.split("Job Title: ")[1].split("\n")[0]
+            content = f"analysis of {title}"
+        return web.json_response({"choices": [{"message": {"content": content}}]})
+
+    @staticmethod
+    def batch_item(job):
+        if "Broken" in job["title"]:
+            return {"job_id": job["job_id"], "responsibilities": 5}
+        return {"job_id": job["job_id"], "responsibilities": [f"work on {job['title']}"],
+                "required_skills": ["python"], "nice_to_have": [], "culture": [], "red_flags": []}
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}/v1"
+
+
+def make_assistant(base_url, monkeypatch, cache=None):
+    monkeypatch.setenv("AI_BASE_URL", base_url)
+    if cache is None:
+        monkeypatch.setenv("AI_CACHE", "0")
+    return AIAssistant(api_key="test-key", cache=cache)
+
+
+def make_jobs(n):
+    return [{"id": str(i), "title": f"Job {i}", "company": "Acme", "description": "Build things"} for i in range(n)]
+
+
+def test_async_analysis_is_concurrent_bounded_and_ordered(monkeypatch):
+    monkeypatch.setattr(ai_assistant, "AI_CONCURRENCY", 3)
+
+    async def scenario():
+        stub = StubLLM(delay=0.1)
+        assistant = make_assistant(await stub.start(), monkeypatch)
+        try:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await assistant.analyze_top_jobs_async(make_jobs(6), top_n=6)
+            elapsed = loop.time() - started
+        finally:
+            await stub.runner.cleanup()
+        return stub, result, elapsed
+
+    stub, result, elapsed = asyncio.run(scenario())
+    assert [a["analysis"] for a in result["analyses"]] == [f"analysis of Job {i}" for i in range(6)]
+    assert stub.max_active == 3
+    # Two waves of 0.1s rather than six sequential round-trips
+    assert elapsed < 0.5
+
+
+def test_async_analysis_retries_429_and_respects_deadline(monkeypatch):
+    async def scenario():
+        stub = StubLLM(delay=0.01, fail_first=1)
+        assistant = make_assistant(await stub.start(), monkeypatch)
+        try:
+            retried = await assistant.analyze_top_jobs_async(make_jobs(1), top_n=1)
+            stub.delay = 1.0
+            timed_out = await assistant.analyze_top_jobs_async(make_jobs(2), top_n=2, deadline=0.2)
+        finally:
+            await stub.runner.cleanup()
+        return stub, retried, timed_out
+
+    stub, retried, timed_out = asyncio.run(scenario())
+    assert retried["total_analyzed"] == 1 and stub.requests >= 2
+    assert timed_out["enabled"] and timed_out["total_analyzed"] == 0
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds("2") == 2.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert retry_after_seconds("soon") is None
+
+
+def test_repeated_prompts_are_served_from_cache(monkeypatch, tmp_path):
+    cache = LLMCache(str(tmp_path / "llm_cache"))
+
+    async def scenario():
+        stub = StubLLM(delay=0.01)
+        assistant = make_assistant(await stub.start(), monkeypatch, cache=cache)
+        try:
+            first = await assistant.analyze_top_jobs_async(make_jobs(2), top_n=2)
+            jobs = make_jobs(3)
+            jobs[1]["description"] = "Build other things"
+            second = await assistant.analyze_top_jobs_async(jobs, top_n=3)
+        finally:
+            await stub.runner.cleanup()
+        return stub, first, second
+
+    stub, first, second = asyncio.run(scenario())
+    assert first["total_analyzed"] == 2 and second["total_analyzed"] == 3
+    # Only the changed job and the new job reached the API on the second run
+    assert stub.requests == 4
+    assert cache.hits == 1
+
+
+def test_batched_analysis_retries_only_malformed_items(monkeypatch):
+    jobs = make_jobs(5)
+    jobs[2]["title"] = "Broken Job"
+
+    async def scenario():
+        stub = StubLLM(delay=0.01)
+        assistant = make_assistant(await stub.start(), monkeypatch)
+        describe = assistant._description
+
+        def counting_description(job, kind):
+            condensed.append(job["id"])
+            return describe(job, kind)
+
+        monkeypatch.setattr(assistant, "_description", counting_description)
+        try:
+            result = await assistant.analyze_top_jobs_batched(jobs, top_n=5)
+        finally:
+            await stub.runner.cleanup()
+        return stub, result
+
+    condensed = []
+    stub, result = asyncio.run(scenario())
+    # The retry reuses the batch's condensed description
+    assert condensed == ["0", "1", "2", "3", "4"]
+    assert [a["job_id"] for a in result["analyses"]] == ["0", "1", "2", "3", "4"]
+    # One batch request plus one single-job retry for the malformed item
+    assert stub.batches == 1 and stub.requests == 2
+    assert result["analyses"][0]["structured"]["required_skills"] == ["python"]
+    assert result["analyses"][2]["analysis"] == "analysis of Broken Job"
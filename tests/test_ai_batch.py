@@ -0,0 +1,33 @@
+import json
+
+from utils.ai_batch import pack_batches, parse_batch_response, render_analysis
+
+
+def item(job_id, **overrides):
+    data = {"job_id": job_id, "responsibilities": ["ship"], "required_skills": ["python"],
+            "nice_to_have": [], "culture": [], "red_flags": []}
+    data.update(overrides)
+    return data
+
+
+def test_pack_batches_respects_budget_and_order():
+    items = [({"id": str(i), "title": "T"}, "x" * 400) for i in range(10)]
+    batches = pack_batches(items, token_budget=600, max_jobs=8)
+    assert [job["id"] for batch in batches for job, _ in batch] == [str(i) for i in range(10)]
+    assert all(1 <= len(batch) <= 3 for batch in batches)
+    assert len(pack_batches(items, token_budget=10 ** 6, max_jobs=4)) == 3
+
+
+def test_parse_batch_response_validates_and_salvages():
+    text = "```json\n" + json.dumps([item("a"), item("b", required_skills="SQL"), item("c", culture=[1]),
+                                    item("zzz"), item("a", responsibilities=["dup"])]) + "\n```"
+    parsed = parse_batch_response(text, ["a", "b", "c"])
+    assert set(parsed) == {"a", "b"}
+    assert parsed["a"]["responsibilities"] == ["ship"]
+    assert parsed["b"]["required_skills"] == ["SQL"]
+
+    # Truncated array: complete objects are still used
+    truncated = json.dumps([item("a"), item("b")])[:-40]
+    assert set(parse_batch_response(truncated, ["a", "b"])) == {"a"}
+    assert parse_batch_response("Sorry, I can't help", ["a"]) == {}
+    assert "**Red flags or concerns**\n- None noted" in render_analysis(parsed["a"])
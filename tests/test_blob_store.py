@@ -0,0 +1,85 @@
+import os
+from utils.blob_store import DescriptionStore
+from utils.schemas import JobListing, clean_html
+from processor import JobProcessor
+
+
+def test_intern_sanitizes_once(tmp_path):
+    """A repeated description is served from the store without re-sanitizing."""
+    store = DescriptionStore(str(tmp_path))
+    calls = []
+
+    def sanitizer(text):
+        calls.append(text)
+        return clean_html(text)
+
+    digest1, text1 = store.intern("<p>Build things.</p>", sanitizer)
+    digest2, text2 = store.intern("<p>Build things.</p>", sanitizer)
+
+    assert digest1 == digest2
+    assert text1 == text2 == "Build things."
+    assert len(calls) == 1
+    assert os.path.exists(store.path_for(digest1))
+
+
+def test_blob_survives_new_store_instance(tmp_path):
+    """Blobs are persisted compressed and readable across runs."""
+    digest, _ = DescriptionStore(str(tmp_path)).intern("<b>Python</b> role", clean_html)
+    fresh = DescriptionStore(str(tmp_path))
+    assert fresh.has(digest)
+    assert fresh.get(digest) == "Python role"
+    assert fresh.resolve({"description": "", "description_hash": digest}) == "Python role"
+
+
+def test_sanitize_with_store_sets_hash(tmp_path):
+    store = DescriptionStore(str(tmp_path))
+    job = JobListing(id="1", title="A", company="B", url="C", description="<p>Hello</p>")
+    job.sanitize(store=store)
+    assert job.description == "Hello"
+    assert job.description_hash == store.digest("<p>Hello</p>")
+
+
+def test_processor_caches_features_per_hash(tmp_path):
+    """Feature extraction runs once per description hash and is persisted."""
+    store = DescriptionStore(str(tmp_path))
+    config = {
+        'keywords': {'exclude': [], 'high_priority': []},
+        'preferred_skills': ['python'],
+        'filtering': {'is_enabled': False},
+    }
+    processor = JobProcessor(config, description_store=store)
+    digest, text = store.intern("We use Python. 2 years of experience", clean_html)
+    job = {"id": "1", "title": "Engineer", "company": "X", "url": "u",
+           "location": "Remote", "description": text, "description_hash": digest}
+
+    first = processor.description_features(job, text, ['python'], [])
+    assert first['skills'] == ['python']
+    assert first['min_years'] == 2
+
+    processor.extract_min_years_experience = lambda _text: 99
+    second = processor.description_features(job, text, ['python'], [])
+    assert second['min_years'] == 2
+
+    store.flush()
+    assert os.path.exists(store.features_file)
+
+
+def test_retain_drops_descriptions_unseen_for_the_grace_period(tmp_path):
+    from datetime import date, timedelta
+
+    store = DescriptionStore(str(tmp_path))
+    live, _ = store.intern("<p>Still posted</p>", clean_html)
+    gone, _ = store.intern("<p>Closed posting</p>", clean_html)
+    store.set_features(gone, "cfg", {"skills": []})
+    start = date(2026, 1, 1)
+    assert store.retain([live, gone], today=start) == 0
+
+    # Within the grace period nothing is dropped, even if unreferenced
+    assert store.retain([live], today=start + timedelta(days=DescriptionStore.RETAIN_DAYS)) == 0
+    assert store.retain([live], today=start + timedelta(days=DescriptionStore.RETAIN_DAYS + 1)) == 1
+    store.flush()
+
+    fresh = DescriptionStore(str(tmp_path))
+    assert fresh.get(live) == "Still posted"
+    assert not fresh.has(gone)
+    assert fresh.get_features(gone, "cfg") is None
@@ -0,0 +1,32 @@
+from utils.condense import condense, count_tokens, segment
+
+DESCRIPTION = (
+    "Acme builds rockets for everyone. "
+    "About the Role We are hiring a data engineer to own our pipelines. "
+    "Responsibilities Build and maintain ETL jobs in Airflow. Design data models for analytics. "
+    "Requirements 5+ years of experience with Python and SQL. Experience with Spark or Flink. Knowledge of AWS. "
+    "Benefits We offer medical insurance, dental coverage, 401(k) matching and unlimited PTO. "
+    "Equal Opportunity Acme is an equal opportunity employer and considers applicants without regard to "
+    "race, color, religion, sexual orientation or gender identity."
+)
+
+
+def test_boilerplate_is_dropped_and_order_kept():
+    result = condense(DESCRIPTION, budget=1000)
+    assert result.dropped_boilerplate == 2
+    assert "401(k)" not in result.text and "without regard" not in result.text
+    assert result.text.index("Responsibilities") < result.text.index("Requirements")
+    assert result.saved > 0 and result.tokens == count_tokens(result.text)
+
+
+def test_tight_budget_keeps_most_relevant_sections():
+    result = condense(DESCRIPTION, budget=40)
+    assert result.tokens <= 40
+    assert "5+ years of experience with Python" in result.text
+    assert "Benefits" not in result.text
+
+
+def test_multiline_descriptions_split_on_headings_and_blank_lines():
+    text = "Intro line\n\nRequirements:\n- Python\n- SQL\nBenefits:\n- Dental insurance and 401k"
+    assert segment(text) == ["Intro line", "Requirements:\n- Python\n- SQL", "Benefits:\n- Dental insurance and 401k"]
+    assert "Dental" not in condense(text).text
@@ -0,0 +1,23 @@
+import pandas as pd
+from utils.job_frame import prepare_jobs_frame
+
+
+def test_prepare_jobs_frame_merges_tracking_once():
+    jobs = pd.DataFrame([
+        {"id": "a", "title": "Intern", "company": "Acme", "score": "12", "date_posted": "2026-01-02",
+         "raw_data": {"huge": True}},
+        {"id": "b", "title": "Engineer", "company": "Globex", "score": 5, "date_posted": "not a date"},
+    ])
+    tracking = {"a": {"status": "Offer", "saved": True, "cv_pdf_path": "/tmp/cv/a.pdf"}}
+
+    df = prepare_jobs_frame(jobs, tracking)
+
+    assert "raw_data" not in df.columns
+    assert df["title"].tolist() == ["🎉 ⭐ Intern", "Engineer"]
+    assert df["Status"].tolist() == ["Offer", "New"]
+    assert df["is_saved"].tolist() == [True, False]
+    assert df["resume"].tolist() == ["a.pdf", ""]
+    assert df["status_prio"].tolist() == [5, 1]
+    assert df["score"].tolist() == [12, 5]
+    assert str(df["company"].dtype) == "category"
+    assert df["date_parsed"].isna().tolist() == [False, True]
@@ -0,0 +1,44 @@
+import io
+import json
+import os
+
+from reporter import JobReporter
+from utils.job_lookup import JobLookup, write_indexed_aggregate
+
+
+def test_indexed_writer_matches_json_dump():
+    data = {"generated_at": "2026-01-01T00:00:00", "total_jobs": 2, "jobs": [
+        {"id": "a", "title": "Ingénieur\nlogiciel", "tags": ["x", {"y": 1}], "empty": {}},
+        {"id": "b", "title": "Engineer", "score": 1.5},
+    ]}
+    buf = io.BytesIO()
+    offsets = write_indexed_aggregate(buf, data)
+    raw = buf.getvalue()
+    assert raw.decode("utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+    offset, length = offsets["a"]
+    assert json.loads(raw[offset:offset + length]) == data["jobs"][0]
+
+    empty = io.BytesIO()
+    assert write_indexed_aggregate(empty, {"jobs": []}) == {}
+    assert empty.getvalue().decode("utf-8") == json.dumps({"jobs": []}, indent=2)
+
+
+def test_lookup_reads_single_job_and_detects_stale_index(tmp_path):
+    reporter = JobReporter(output_dir=str(tmp_path / "data"), report_dir=str(tmp_path / "report"))
+    jobs = [{"id": f"job-{i}", "title": f"Engineer {i}", "company": "Acme", "url": f"https://x/{i}"} for i in range(5)]
+    path = reporter.save_jobs_json(jobs, validated=True)
+
+    lookup = JobLookup(path)
+    assert lookup.is_current()
+    assert lookup.get("job-3")["title"] == "Engineer 3"
+    assert lookup.get("missing") is None
+    assert lookup.find("job-2") == "job-2"
+    assert lookup.find("HTTPS://X/4/?utm_source=mail") == "job-4"
+    assert lookup.find("https://x/missing") is None
+
+    # Aggregate rewritten by something other than the reporter: index no longer trusted
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert not lookup.is_current()
+    assert lookup.get("job-3") is None
+    assert os.path.exists(str(tmp_path / "data" / "jobs_agg.idx.json"))
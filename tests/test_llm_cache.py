@@ -0,0 +1,69 @@
+import json
+import os
+import time
+
+from utils.llm_cache import LLMCache
+
+
+def messages(text):
+    return [{"role": "system", "content": "You are helpful."}, {"role": "user", "content": text}]
+
+
+def test_key_normalizes_whitespace_and_includes_model_and_max_tokens():
+    key = LLMCache.key("m", messages("Analyze  this\n job"), 700)
+    assert key == LLMCache.key("m", messages("Analyze this job "), 700)
+    assert key != LLMCache.key("other", messages("Analyze this job"), 700)
+    assert key != LLMCache.key("m", messages("Analyze this job"), 500)
+
+
+def test_ttl_expiry(tmp_path):
+    cache = LLMCache(str(tmp_path), ttl_days=1)
+    key = LLMCache.key("m", messages("a"), 10)
+    cache.put(key, "answer")
+    assert cache.get(key) == "answer"
+
+    cache.ttl = 0.0
+    time.sleep(0.01)
+    assert cache.get(key) is None
+    assert not os.path.exists(cache.path_for(key))
+
+
+def test_size_eviction_drops_least_recently_used(tmp_path):
+    cache = LLMCache(str(tmp_path), max_bytes=10 ** 6)
+    keys = [LLMCache.key("m", messages(str(i)), 10) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, "x" * 100)
+        os.utime(cache.path_for(key), (1000 + i, 1000 + i))
+    cache.ttl = float("inf")
+    # Touch the oldest so the middle one becomes least recently used
+    assert cache.get(keys[0]) is not None
+
+    # Room for exactly two of the three entries
+    cache.max_bytes = os.path.getsize(cache.path_for(keys[0])) + os.path.getsize(cache.path_for(keys[2]))
+    assert cache.prune() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+
+
+def test_replacing_a_key_does_not_double_count_its_size(tmp_path):
+    cache = LLMCache(str(tmp_path))
+    key = LLMCache.key("m", messages("a"), 10)
+    for _ in range(3):
+        cache.put(key, "x" * 100)
+    assert cache._bytes == os.path.getsize(cache.path_for(key)) == cache._measure()
+
+
+def test_prune_expires_by_creation_even_when_recently_read(tmp_path):
+    cache = LLMCache(str(tmp_path), ttl_days=1)
+    key = LLMCache.key("m", messages("a"), 10)
+    cache.put(key, "answer")
+    with open(cache.path_for(key), "r+", encoding="utf-8") as f:
+        entry = json.load(f)
+        entry["created"] -= 2 * 86400
+        f.seek(0)
+        json.dump(entry, f)
+        f.truncate()
+    os.utime(cache.path_for(key))  # Just read: recent mtime
+
+    assert cache.prune() == 1
+    assert not os.path.exists(cache.path_for(key))
@@ -0,0 +1,37 @@
+import json
+
+from utils.perf import PhaseTimer, RollingStats, export_stats, percentile
+
+
+def test_percentile_nearest_rank():
+    values = sorted(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_timer_marks_and_export(tmp_path):
+    timer = PhaseTimer()
+    timer.mark("load")
+    timer.mark("load")
+    timer.mark("render")
+    assert list(timer.timings) == ["load", "render"]
+
+    stats = RollingStats(window=2)
+    for ms in (1, 2, 3):
+        stats.add({"load": ms / 1000})
+    summary = stats.summary()
+    assert summary["load"]["n"] == 2
+    assert round(summary["load"]["p50_ms"]) == 2
+
+    path = export_stats(stats, str(tmp_path), extra={"jobs": 3})
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["samples_ms"]["load"] == [2.0, 3.0]
+    assert data["jobs"] == 3
+
+
+def test_disabled_timer_records_nothing():
+    timer = PhaseTimer(enabled=False)
+    timer.mark("load")
+    assert timer.timings == {}
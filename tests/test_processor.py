@@ -1,9 +1,10 @@
 import pytest
 import logging
 from processor import JobProcessor
+from utils.tracking_store import TrackingStore
 
 @pytest.fixture
-def processor():
+def processor(tmp_path):
     config = {
         'keywords': {
             'exclude': [],
@@ -14,7 +15,8 @@ def processor():
             'max_years_experience': 3
         }
     }
-    return JobProcessor(config)
+    # Isolated state store: applied jobs in the repo's data/ must not leak in
+    return JobProcessor(config, state_store=TrackingStore(str(tmp_path / "tracking.json")))
 
 def test_extract_yoe_valid(processor):
     """Test standard experience extraction."""
@@ -85,3 +87,16 @@ def test_process_jobs_disqualification(processor):
     
     processed = processor.process_jobs(jobs)
     assert len(processed) == 0
+
+def test_applied_state_only_comes_from_injected_store(processor):
+    config = {'keywords': {'exclude': [], 'high_priority': []}}
+    # No store injected: nothing is read or written (in particular not data/tracking.json)
+    storeless = JobProcessor(config)
+    assert storeless.load_applied_jobs() == []
+    storeless.save_applied_snapshots({"j1": {"job": {"id": "j1", "title": "Engineer"}}})
+
+    store = processor.state_store
+    store.update("j1", status="Applied")
+    processor.save_applied_snapshots({"j1": {"job": {"id": "j1", "title": "Engineer"}}})
+    assert store.get("j1")["job"]["title"] == "Engineer"
+    assert [j["id"] for j in processor.load_applied_jobs()] == ["j1"]
@@ -0,0 +1,85 @@
+import json
+import os
+
+from query_service import JobQueryService, start_in_background
+from utils.query_client import QueryClient
+from utils.tracking_store import TrackingStore
+
+
+def write_jobs(data_dir, jobs):
+    with open(data_dir / "jobs_agg.json", "w", encoding="utf-8") as f:
+        json.dump({"generated_at": "2024-01-01T00:00:00", "jobs": jobs}, f)
+
+
+def make_jobs():
+    return [
+        {"id": "1", "title": "Data Engineer", "company": "Acme", "score": 90, "date_posted": "2024-01-02"},
+        {"id": "2", "title": "Analyst", "company": "Beta", "score": 70, "date_posted": "2024-01-03"},
+        {"id": "3", "title": "ML Engineer", "company": "Acme", "score": 80, "date_posted": "2024-01-01"},
+    ]
+
+
+def test_query_filters_and_paginates(tmp_path):
+    write_jobs(tmp_path, make_jobs())
+    TrackingStore(str(tmp_path / "tracking.json")).update("3", saved=True, status="Applied")
+    server, _ = start_in_background(port=0, data_dir=str(tmp_path))
+    try:
+        client = QueryClient(f"http://127.0.0.1:{server.server_address[1]}", timeout=2)
+        assert client.health()["jobs"] == 3
+
+        result = client.list_jobs(company="Acme", sort="Score")
+        assert [j["id"] for j in result["jobs"]] == ["1", "3"]
+        assert result["jobs"][1]["status"] == "Applied" and result["jobs"][1]["saved"] is True
+
+        page = client.list_jobs(page=2, page_size=2)
+        assert page["total"] == 3 and len(page["jobs"]) == 1
+
+        job = client.get_job("3")
+        assert job["title"] == "ML Engineer" and job["tracking"]["status"] == "Applied"
+        assert client.get_job("missing") is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_etag_revalidation_and_reload(tmp_path):
+    write_jobs(tmp_path, make_jobs())
+    server, _ = start_in_background(port=0, data_dir=str(tmp_path))
+    try:
+        client = QueryClient(f"http://127.0.0.1:{server.server_address[1]}", timeout=2)
+        first = client.get_job("1")
+        etag = next(iter(client._cache.values()))[0]
+        # Unchanged data revalidates to the same cached object (304)
+        assert client.get_job("1") is first
+
+        jobs = make_jobs()
+        jobs[0]["title"] = "Senior Data Engineer"
+        write_jobs(tmp_path, jobs + [{"id": "4", "title": "New", "company": "Gamma", "score": 50}])
+        assert client.get_job("1")["title"] == "Senior Data Engineer"
+        assert next(iter(client._cache.values()))[0] != etag
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_query_uses_one_snapshot_across_a_reload(tmp_path):
+    write_jobs(tmp_path, make_jobs())
+    service = JobQueryService(str(tmp_path))
+    service.refresh()
+    snapshot = service.snapshot()
+
+    # Another request thread reloads a shorter job list mid-query
+    write_jobs(tmp_path, [{"id": "9", "title": "Only", "company": "Zeta", "score": 10}])
+    os.utime(tmp_path / "jobs_agg.json", ns=(1, 1))
+    service.refresh()
+    assert len(service.jobs) == 1
+
+    result = service.query({"sort": "Score"}, snapshot)
+    assert [j["id"] for j in result["jobs"]] == ["1", "3", "2"]
+    assert service.snapshot()[-1] != snapshot[-1]
+
+
+def test_client_returns_none_when_service_down():
+    client = QueryClient("http://127.0.0.1:9", timeout=0.2)
+    assert client.get_job("1") is None
+    assert client.list_jobs() is None
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+
+from utils.render_service import DONE, FAILED, RenderService
+
+
+def wait_for(service, job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not service.status(job.key, job.job_id).finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return service.status(job.key, job.job_id)
+
+
+def make_renderer(out_dir, calls):
+    def render(job_id, content):
+        calls.append(job_id)
+        if "broken" in content:
+            return None, "YAML error"
+        path = os.path.join(out_dir, f"{job_id}.pdf")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path, "ok"
+    return render
+
+
+def test_unchanged_content_is_served_from_cache(tmp_path):
+    calls = []
+    service = RenderService(make_renderer(str(tmp_path), calls), str(tmp_path / "cache"),
+                            output_path=lambda job_id: str(tmp_path / f"{job_id}.pdf"))
+    job = service.submit("a", "cv: 1")
+    assert wait_for(service, job).state == DONE and not job.cached
+
+    # Another render of a different version overwrites a.pdf ...
+    wait_for(service, service.submit("a", "cv: 2"))
+    # ... and going back to the first content is an instant cache hit
+    hit = service.submit("a", "cv: 1")
+    assert hit.state == DONE and hit.cached
+    assert calls == ["a", "a"]
+    with open(hit.pdf_path, encoding="utf-8") as f:
+        assert f.read() == "cv: 1"
+
+    # A new template version invalidates the cache
+    service.template_version = "2"
+    assert not service.submit("a", "cv: 1").cached
+    service.shutdown()
+
+
+def test_failures_are_reported_and_not_cached(tmp_path):
+    calls = []
+    service = RenderService(make_renderer(str(tmp_path), calls), str(tmp_path / "cache"))
+    job = wait_for(service, service.submit("a", "broken"))
+    assert job.state == FAILED and job.error == "YAML error"
+    assert os.listdir(tmp_path / "cache") == []
+    service.shutdown()
+
+
+def test_different_cvs_render_in_parallel(tmp_path):
+    barrier = threading.Barrier(2, timeout=2)
+
+    def render(job_id, content):
+        barrier.wait()  # Only passes if both renders run at the same time
+        path = str(tmp_path / f"{job_id}.pdf")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path, "ok"
+
+    service = RenderService(render, str(tmp_path / "cache"), max_workers=2)
+    first, second = service.submit("a", "x"), service.submit("b", "y")
+    assert wait_for(service, first).state == DONE
+    assert wait_for(service, second).state == DONE
+    service.shutdown()
+
+
+def test_same_content_for_two_jobs_publishes_each_jobs_pdf(tmp_path):
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def render(job_id, content):
+        calls.append(job_id)
+        started.set()
+        release.wait(2)
+        path = str(tmp_path / f"{job_id}.pdf")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path, "ok"
+
+    service = RenderService(render, str(tmp_path / "cache"), max_workers=2,
+                            output_path=lambda job_id: str(tmp_path / f"{job_id}.pdf"))
+    first = service.submit("a", "same")
+    started.wait(2)
+    second = service.submit("b", "same")  # While a's render is still running
+    assert second is not first and second.job_id == "b"
+    release.set()
+
+    assert wait_for(service, first).pdf_path == str(tmp_path / "a.pdf")
+    done = wait_for(service, second)
+    assert done.state == DONE and done.cached and done.pdf_path == str(tmp_path / "b.pdf")
+    assert calls == ["a"]
+    with open(tmp_path / "b.pdf", encoding="utf-8") as f:
+        assert f.read() == "same"
+    assert service.status(first.key, "b") is second
+    service.shutdown()
@@ -0,0 +1,233 @@
+import json
+import os
+import pytest
+from reporter import JobReporter
+from utils.snapshot import read_snapshot
+
+
+def make_job(job_id, score, title="Software Engineer", company="Acme"):
+    return {
+        "id": job_id,
+        "title": title,
+        "company": company,
+        "url": f"https://jobs.example.com/{job_id}",
+        "location": "Remote",
+        "score": score,
+        "date_posted": "2026-01-01 09:00 AM",
+        "source": "greenhouse",
+    }
+
+
+@pytest.fixture
+def reporter(tmp_path):
+    return JobReporter(output_dir=str(tmp_path / "data"), report_dir=str(tmp_path / "report"))
+
+
+def test_snapshot_is_sorted_by_id_one_job_per_line(reporter):
+    jobs = [make_job("b", 10), make_job("a", 50, title="🔥 Intern")]
+    paths = reporter.save_snapshot(jobs)
+
+    with open(paths['snapshot'], encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["a", "b"]
+    # Volatile fields live in the side file, not in the snapshot
+    assert "score" not in lines[0]
+    assert json.loads(lines[0])["title"] == "Intern"
+
+    restored = read_snapshot(paths['snapshot'], paths['volatile'])
+    assert [j["id"] for j in restored] == ["a", "b"]
+    assert restored[0]["title"] == "🔥 Intern"
+    assert restored[0]["score"] == 50
+
+
+def test_score_change_only_touches_volatile_file(reporter):
+    paths = reporter.save_snapshot([make_job("a", 10), make_job("b", 20)])
+    mtime = os.stat(paths['snapshot']).st_mtime_ns
+    with open(paths['snapshot'], encoding="utf-8") as f:
+        before = f.read()
+
+    reporter.save_snapshot([make_job("a", 99), make_job("b", 1)])
+
+    with open(paths['snapshot'], encoding="utf-8") as f:
+        assert f.read() == before
+    assert os.stat(paths['snapshot']).st_mtime_ns == mtime
+    with open(paths['volatile'], encoding="utf-8") as f:
+        assert json.load(f)["jobs"]["a"] == {"score": 99}
+
+
+def test_defaulted_date_is_volatile_and_rerun_rewrites_nothing(reporter):
+    dateless = dict(make_job("a", 10), date_estimated=True)
+    paths = reporter.save_snapshot([dateless, make_job("b", 20)])
+    with open(paths['snapshot'], encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert "date_posted" not in json.loads(lines[0])
+    assert "date_posted" in json.loads(lines[1])
+    mtimes = {k: os.stat(p).st_mtime_ns for k, p in paths.items()}
+
+    reporter.save_snapshot([dateless, make_job("b", 20)])
+    assert {k: os.stat(p).st_mtime_ns for k, p in paths.items()} == mtimes
+
+    restored = read_snapshot(paths['snapshot'], paths['volatile'])
+    assert restored[1]["date_posted"] == "2026-01-01 09:00 AM"
+
+
+def test_arrow_export_roundtrip_with_categoricals(reporter):
+    pytest.importorskip("pyarrow")
+    from utils.columnar import read_jobs_arrow
+
+    jobs = [make_job("a", 10, company="Acme"), make_job("b", 20, company="Beta"), make_job("c", 5, company="Acme")]
+    path = reporter.save_jobs_arrow(jobs, statuses={"a": "Applied", "b": "Active", "c": "Active"})
+
+    df, meta = read_jobs_arrow(path)
+    assert meta["total_jobs"] == 3
+    assert list(df["id"]) == ["a", "b", "c"]
+    assert list(df["score"]) == [10.0, 20.0, 5.0]
+    assert str(df["company"].dtype) == "category"
+    assert str(df["status"].dtype) == "category"
+    assert set(df["company"].cat.categories) == {"Acme", "Beta"}
+    assert "raw_data" not in df.columns
+
+
+def test_summary_single_pass_counts_groups_and_top_k():
+    from utils.job_summary import summarize_jobs
+    jobs = [make_job("a", 5, company="Acme"), make_job("b", 50, company="Beta"),
+            make_job("c", 20, company="Acme"), make_job("d", 20, company="Cent")]
+    jobs[1]["source"] = "lever"
+
+    summary = summarize_jobs(jobs, top_k=3)
+
+    assert summary.total == 4
+    assert summary.company_counts == {"Acme": 2, "Beta": 1, "Cent": 1}
+    assert summary.source_counts == {"greenhouse": 3, "lever": 1}
+    assert [j["id"] for j in summary.by_company["Acme"]] == ["a", "c"]
+    # Ties keep input order, matching sorted(..., reverse=True)
+    assert [j["id"] for j in summary.top_jobs] == ["b", "c", "d"]
+    assert summary.top_companies(1) == [("Acme", 2)]
+
+
+def test_markdown_report_renders_from_summary(reporter):
+    jobs = [make_job("a", 50, company="Acme"), make_job("b", 10, company="Beta")]
+    path = reporter.generate_markdown_report(jobs)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert "- **Total Jobs Found**: 2" in text
+    assert "### 1. Software Engineer" in text
+    assert "### Acme (1 jobs)" in text
+
+
+def test_unchanged_job_set_skips_all_writes(reporter):
+    jobs = [make_job("a", 10), make_job("b", 20)]
+    first = reporter.generate_reports(jobs)
+    mtimes = {k: os.stat(p).st_mtime_ns for k, p in first.items()}
+
+    second = reporter.generate_reports([dict(j) for j in jobs])
+
+    assert second.keys() == first.keys()
+    assert {k: os.stat(p).st_mtime_ns for k, p in second.items()} == mtimes
+
+
+def test_missing_search_index_is_regenerated_for_an_unchanged_job_set(reporter):
+    jobs = [make_job("a", 10), make_job("b", 20)]
+    first = reporter.generate_reports(jobs)
+    os.remove(first['search'])
+    rollup_dir = os.path.join(reporter.output_dir, "rollups")
+    rollups = {e.name: e.stat().st_mtime_ns for e in os.scandir(rollup_dir) if e.is_file()}
+
+    second = reporter.generate_reports([dict(j) for j in jobs])
+
+    assert os.path.exists(second['search'])
+    assert reporter.last_delta.is_empty
+    # Nothing changed, so the rollups were not rewritten
+    assert {e.name: e.stat().st_mtime_ns for e in os.scandir(rollup_dir) if e.is_file()} == rollups
+
+
+def test_defaulted_date_posted_does_not_change_the_fingerprint(reporter):
+    dateless = dict(make_job("a", 60), date_posted="2026-01-01 09:00 AM", date_estimated=True)
+    first = reporter.generate_reports([dateless, make_job("b", 20)])
+    mtimes = {k: os.stat(p).st_mtime_ns for k, p in first.items()}
+
+    # The next run stamps the job with a new scrape time
+    reporter.generate_reports([dict(dateless, date_posted="2026-01-01 09:05 AM"), make_job("b", 20)])
+
+    assert {k: os.stat(p).st_mtime_ns for k, p in first.items()} == mtimes
+
+
+def test_changed_job_set_appends_changes_section(reporter):
+    reporter.generate_reports([make_job("a", 10), make_job("b", 20)])
+    reports = reporter.generate_reports([make_job("a", 35), make_job("c", 5, title="Data Intern")])
+
+    delta = reporter.last_delta
+    assert [j["id"] for j in delta.added] == ["c"]
+    assert [j["id"] for j in delta.removed] == ["b"]
+    assert [(j["id"], before) for j, before in delta.rescored] == [("a", 10)]
+
+    with open(reports['markdown'], encoding="utf-8") as f:
+        text = f.read()
+    assert text.count("# Daily Job Scraping Report") == 1
+    assert "## Changes this run" in text
+    assert "Data Intern" in text
+    assert "10.0 -> 35.0" in text
+
+
+def test_static_site_shards_are_content_hashed(reporter):
+    from utils.search_index import tokenize
+
+    jobs = [make_job("a", 50, title="Backend Intern", company="Acme"),
+            make_job("b", 20, title="Data Engineer", company="Globex")]
+    index_file = reporter.generate_static_site(jobs)
+    data_dir = os.path.join(os.path.dirname(index_file), "data")
+
+    with open(os.path.join(data_dir, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert [c["name"] for c in manifest["companies"]] == ["Acme", "Globex"]
+    with open(os.path.join(data_dir, manifest["search"]), encoding="utf-8") as f:
+        search = json.load(f)
+    assert search["index"]["intern"] == [0]
+    assert tokenize("C++ and Node.js.") == ["c++", "node.js"]
+
+    acme_shard = manifest["shards"][0]
+    mtime = os.stat(os.path.join(data_dir, acme_shard)).st_mtime_ns
+    old_globex = manifest["shards"][1]
+
+    reporter.generate_static_site([jobs[0], make_job("b", 25, title="Data Engineer", company="Globex")])
+
+    with open(os.path.join(data_dir, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    # Untouched company keeps its file; the changed shard is replaced and the stale one removed
+    assert manifest["shards"][0] == acme_shard
+    assert os.stat(os.path.join(data_dir, acme_shard)).st_mtime_ns == mtime
+    assert manifest["shards"][1] != old_globex
+    assert not os.path.exists(os.path.join(data_dir, old_globex))
+
+
+def test_feed_only_adds_first_seen_jobs_above_threshold(tmp_path):
+    from utils.feed import JobFeed
+
+    feed = JobFeed(str(tmp_path / "feed.xml"), str(tmp_path / "feed_state.json"), min_score=50, max_entries=2)
+    assert feed.update([make_job("a", 90), make_job("low", 10)]) == 1
+    # Already seen: not announced again, even if it drops out and comes back
+    assert feed.update([make_job("a", 95)]) == 0
+    assert feed.update([make_job("b", 60), make_job("c", 70, title="R&D <Intern>")]) == 2
+
+    with open(tmp_path / "feed.xml", encoding="utf-8") as f:
+        xml = f.read()
+    # Capped to the newest two entries, escaped
+    assert xml.count("<entry>") == 2
+    assert "R&amp;D &lt;Intern&gt;" in xml
+    assert "job:a<" not in xml
+
+
+def test_truncated_static_shard_is_rewritten(reporter):
+    jobs = [make_job("a", 50, company="Acme")]
+    index_file = reporter.generate_static_site(jobs)
+    data_dir = os.path.join(os.path.dirname(index_file), "data")
+    with open(os.path.join(data_dir, "manifest.json"), encoding="utf-8") as f:
+        shard = os.path.join(data_dir, json.load(f)["shards"][0])
+    with open(shard, encoding="utf-8") as f:
+        content = f.read()
+    with open(shard, "w", encoding="utf-8") as f:
+        f.write(content[:10])  # A crash mid-write
+
+    reporter.generate_static_site(jobs)
+    with open(shard, encoding="utf-8") as f:
+        assert f.read() == content
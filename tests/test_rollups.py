@@ -0,0 +1,83 @@
+import os
+from datetime import date
+
+from utils.rollups import RollupStore, daily_totals, score_bucket, shard_of
+
+
+def test_rollups_track_new_closed_and_scores(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups"))
+    a = {"id": "a", "company": "Acme", "source": "greenhouse", "score": 85}
+    b = {"id": "b", "company": "Beta", "source": "lever", "score": 42}
+
+    store.apply([a, b], [], today=date(2024, 1, 1))
+    # Re-applying the same delta (e.g. after a crash) changes nothing
+    store.apply([a, b], [], today=date(2024, 1, 1))
+    store.apply([], [{"id": "a"}], [(dict(b, score=95), 42)], today=date(2024, 1, 11))
+
+    tables = store.load_tables()
+    assert tables['company_day']['2024-01-01'] == {"Acme": {"new": 1, "closed": 0}, "Beta": {"new": 1, "closed": 0}}
+    assert tables['source_day']['2024-01-11'] == {"greenhouse": {"new": 0, "closed": 1}}
+    assert tables['scores'] == {"80-90": 0, "40-50": 0, "90-100": 1}
+    assert tables['time_to_close']['buckets'] == {"8-14": 1}
+    assert tables['time_to_close']['by_company'] == {"Acme": [10, 1]}
+    assert daily_totals(tables['company_day']) == [
+        {'day': '2024-01-01', 'new': 2, 'closed': 0},
+        {'day': '2024-01-11', 'new': 0, 'closed': 1},
+    ]
+    assert score_bucket(100) == "90-100" and score_bucket(None) == "0-10"
+
+
+def test_funnel_snapshot_from_tracking(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups"))
+    tracking = {
+        "a": {"saved": True, "status": "Applied"},
+        "b": {"status": "Interviewing"},
+        "c": {"saved": True},
+    }
+    store.apply([], [], tracking=tracking, today=date(2024, 2, 1))
+    funnel = store.load('funnel')
+    assert funnel['2024-02-01'] == {'Saved': 2, 'Applied': 1, 'Interviewing': 1, 'Offer': 0, 'Rejected': 0}
+
+
+def test_first_run_is_a_baseline_not_new_postings(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups"))
+    existing = [{"id": str(i), "company": "Acme", "source": "greenhouse", "score": 55} for i in range(5)]
+
+    assert store.seed(existing, today=date(2024, 3, 1)) == 5
+    assert store.seed(existing, today=date(2024, 3, 1)) == 0
+    # The first delta lists every job as added; seeded ones are already open
+    stats = store.apply(existing + [{"id": "new", "company": "Beta", "score": 10}], [], today=date(2024, 3, 1))
+
+    assert stats['added'] == 1
+    tables = store.load_tables()
+    assert tables['company_day'] == {'2024-03-01': {"Beta": {"new": 1, "closed": 0}}}
+    assert tables['scores'] == {"50-60": 5, "10-20": 1}
+
+
+def test_apply_only_rewrites_touched_shards_and_days(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups"))
+    jobs = [{"id": f"job-{i}", "company": "Acme", "score": 50} for i in range(200)]
+    store.seed(jobs, today=date(2024, 4, 1))
+    store.apply([], [], today=date(2024, 4, 1))
+    shard_dir = tmp_path / "rollups" / "open_jobs"
+    before = {e.name: e.stat().st_mtime_ns for e in os.scandir(shard_dir)}
+
+    store.apply([], [{"id": "job-7"}], today=date(2024, 4, 2))
+
+    after = {e.name: e.stat().st_mtime_ns for e in os.scandir(shard_dir)}
+    changed = [name for name in after if after[name] != before[name]]
+    assert len(before) > 1 and changed == [shard_of("job-7") + ".json"]
+    assert store.load('company_day') == {'2024-04-02': {"Acme": {"new": 0, "closed": 1}}}
+
+
+def test_boosted_jobs_are_bucketed_by_match_score(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups"))
+    applied = {"id": "a", "company": "Acme", "score": 1042, "match_score": 42}
+    fresh = {"id": "f", "company": "Acme", "score": 95, "match_score": 45}
+    store.apply([applied, fresh], [], today=date(2024, 5, 1))
+    assert store.load('scores') == {"40-50": 2}
+
+    # The freshness boost expiring the next day is not a bucket change
+    stats = store.apply([], [], [(dict(fresh, score=45), 95)], today=date(2024, 5, 2))
+    assert stats['rescored'] == 0
+    assert store.load('scores') == {"40-50": 2}
@@ -0,0 +1,34 @@
+from utils.search_index import SearchIndex, tokenize
+
+
+def make_index():
+    return SearchIndex.build([
+        ("a", "Frontend Intern React Acme Remote", 10),
+        ("b", "Backend Engineer Python Globex New York", 50),
+        ("c", "Data Intern Python Acme", 30),
+        ("d", "Vue developer", 5),
+    ])
+
+
+def test_tokenize_keeps_tech_tokens():
+    assert tokenize("C++ and Node.js, for the C# team.") == ["c++", "node.js", "c#", "team"]
+
+
+def test_prefix_and_ranking_by_score():
+    index = make_index()
+    assert index.search("intern") == ["c", "a"]
+    assert index.search("pyth") == ["b", "c"]
+    assert index.search("xyz") == []
+    assert index.search("") == []
+
+
+def test_and_or_queries():
+    index = make_index()
+    assert index.search("python intern") == ["c"]
+    assert index.search("react OR vue") == ["a", "d"]
+    assert index.search("acme intern OR backend") == ["b", "c", "a"]
+
+
+def test_roundtrip_through_dict():
+    index = SearchIndex.from_dict(make_index().to_dict())
+    assert index.search("data OR front") == ["c", "a"]
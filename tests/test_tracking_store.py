@@ -0,0 +1,115 @@
+import json
+import os
+from utils.tracking_store import TrackingStore, canonical_url
+
+
+def test_apply_is_journaled_and_replayed(tmp_path):
+    """Changes append to the journal and are visible to a fresh store."""
+    path = str(tmp_path / "tracking.json")
+    store = TrackingStore(path)
+    store.update("job_1", status="Applied", saved=True)
+    store.apply({"job_2": {"saved": True}, "job_1": {"cv_status": "Tailored"}})
+
+    assert not os.path.exists(path)  # Nothing compacted yet
+    with open(store.journal_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+
+    view = TrackingStore(path).load()
+    assert view["job_1"] == {"status": "Applied", "saved": True, "cv_status": "Tailored"}
+    assert view["job_2"] == {"saved": True}
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    """Two store instances (e.g. dashboard + CV editor) interleave safely."""
+    path = str(tmp_path / "tracking.json")
+    dashboard = TrackingStore(path)
+    editor = TrackingStore(path)
+
+    dashboard.update("job_1", saved=True)
+    editor.update("job_2", status="Applied")
+    dashboard.update("job_3", status="Hidden")
+
+    assert set(editor.load()) == {"job_1", "job_2", "job_3"}
+    assert set(dashboard.load()) == {"job_1", "job_2", "job_3"}
+
+
+def test_compaction_writes_snapshot_and_truncates_journal(tmp_path):
+    path = str(tmp_path / "tracking.json")
+    store = TrackingStore(path, compact_every=3)
+    reader = TrackingStore(path)
+    assert reader.load() == {}
+
+    for i in range(3):
+        store.update(f"job_{i}", saved=True)
+
+    assert os.path.getsize(store.journal_path) == 0
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)) == 3
+
+    # A reader that was behind picks up the compacted snapshot
+    assert len(reader.load()) == 3
+
+
+def test_existing_tracking_file_is_loaded(tmp_path):
+    path = tmp_path / "tracking.json"
+    path.write_text(json.dumps({"job_1": {"status": "Offer"}}), encoding="utf-8")
+    store = TrackingStore(str(path))
+    store.update("job_1", saved=True)
+    assert TrackingStore(str(path)).get("job_1") == {"status": "Offer", "saved": True}
+
+
+def test_canonical_url_lookup(tmp_path):
+    """Records with a job snapshot are found by id or by canonical URL."""
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    store.bulk_update({
+        "gh_1": {"status": "Applied", "job": {"title": "SWE", "url": "https://Boards.io/acme/jobs/1/?utm_source=x#apply"}},
+        "gh_2": {"saved": True},
+    })
+    assert canonical_url("https://boards.io/acme/jobs/1") == canonical_url("https://Boards.io/acme/jobs/1/?utm_source=x")
+    assert store.find("https://boards.io/acme/jobs/1?gh_src=abc") == "gh_1"
+    assert store.find("gh_2") == "gh_2"
+    assert store.find("https://boards.io/acme/jobs/404") is None
+
+
+def test_applied_jobs_merges_legacy_file_and_statuses(tmp_path):
+    """applied_jobs.json and dashboard statuses feed one applied list."""
+    legacy = [{"id": "gh_old", "title": "🔥 Intern", "company": "A", "url": "https://a.io/1",
+               "score": 40, "applied_at": "2025-01-01T00:00:00"}]
+    (tmp_path / "applied_jobs.json").write_text(json.dumps(legacy), encoding="utf-8")
+    (tmp_path / "tracking.json").write_text(json.dumps({
+        "gh_dash": {"status": "Interviewing", "saved": True},
+        "gh_new": {"status": "New"},
+    }), encoding="utf-8")
+
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    applied = {j["id"]: j for j in store.applied_jobs()}
+
+    assert set(applied) == {"gh_old", "gh_dash"}
+    assert applied["gh_old"]["title"] == "Intern"
+    assert applied["gh_old"]["applied_at"] == "2025-01-01T00:00:00"
+    assert store.find("https://a.io/1") == "gh_old"
+    # Cached until the view changes
+    assert store.applied_jobs() is store.applied_jobs()
+
+
+def test_load_and_get_return_copies(tmp_path):
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    store.update("a", status="Applied", job={"title": "Engineer"})
+    version = store.version
+
+    store.load()["a"]["status"] = "Rejected"
+    store.get("a")["job"]["title"] = "Changed"
+
+    assert store.get("a") == {"status": "Applied", "job": {"title": "Engineer"}}
+    assert store.version == version
+
+
+def test_status_change_overrides_applied_timestamp(tmp_path):
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    store.update("a", status="Applied", applied_at="2025-01-01T00:00:00", job={"title": "Engineer"})
+    store.update("b", date_applied="2025-01-02")  # Legacy record without a status
+    assert {j["id"] for j in store.applied_jobs()} == {"a", "b"}
+
+    store.update("a", status="Rejected")
+    assert not store.is_applied(store.get("a"))
+    assert {j["id"] for j in store.applied_jobs()} == {"b"}
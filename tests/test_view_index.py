@@ -0,0 +1,56 @@
+import pandas as pd
+from utils.job_frame import prepare_jobs_frame
+from utils.view_index import ViewIndex
+
+
+def make_index():
+    jobs = pd.DataFrame([
+        {"id": "a", "title": "Intern", "company": "Acme", "score": 10, "date_posted": "2026-01-01"},
+        {"id": "b", "title": "Engineer", "company": "Globex", "score": 30, "date_posted": "2026-01-03"},
+        {"id": "c", "title": "Analyst", "company": "Acme", "score": 20, "date_posted": "2026-01-02"},
+    ])
+    return ViewIndex(prepare_jobs_frame(jobs, {}))
+
+
+def ids(index, mask):
+    return index.materialize(index.ordered(mask))["id"].tolist()
+
+
+def test_views_and_default_order():
+    index = make_index()
+    index.sync_tracking({"a": {"status": "Applied", "saved": True}, "c": {"saved": True}}, version=1)
+
+    assert ids(index, index.view_mask("Feed")) == ["b"]
+    assert ids(index, index.view_mask("Shortlist")) == ["c"]
+    assert ids(index, index.view_mask("Tracking")) == ["a"]
+    # Status priority, then saved, then newest date
+    assert ids(index, index.view_mask("All")) == ["a", "c", "b"]
+    assert ids(index, index.view_mask("All") & index.company_mask("Acme")) == ["a", "c"]
+
+    counts = index.facet_counts()
+    assert (counts["saved"], counts["applied"], counts["saved_unapplied"], counts["companies"]) == (2, 1, 1, 2)
+
+
+def test_sync_only_touches_changed_rows():
+    index = make_index()
+    tracking = {"a": {"status": "Hidden"}, "b": {"status": "Offer", "saved": True}}
+    assert index.sync_tracking(tracking, version=1) == 2
+    # Same version: nothing to do
+    assert index.sync_tracking(tracking, version=1) == 0
+
+    tracking = dict(tracking, c={"status": "Rejected"})
+    del tracking["a"]
+    assert index.sync_tracking(tracking, version=2) == 2
+
+    assert ids(index, index.view_mask("All", hide_rejected=False, hide_hidden=True)) == ["b", "a", "c"]
+    assert index.materialize(index.ordered(index.view_mask("Tracking")))["title"].tolist() == ["🎉 ⭐ Engineer"]
+
+
+def test_sort_modes_and_page_slices():
+    index = make_index()
+    rows = index.ordered(index.view_mask("All"))
+    assert [index.ids[r] for r in index.sort_rows(rows, "Score")] == ["b", "c", "a"]
+    assert [index.ids[r] for r in index.sort_rows(rows, "Company")] == ["c", "a", "b"]
+    # A page is materialized on its own and keeps job ids aligned with positions
+    page = index.materialize(index.sort_rows(rows, "Score")[1:3])
+    assert page["id"].tolist() == ["c", "a"]
@@ -0,0 +1,47 @@
+import json
+import time
+
+from utils.tracking_store import TrackingStore
+from utils.write_behind import WriteBehindTracker
+
+
+def test_changes_are_visible_immediately_and_coalesced(tmp_path):
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    writer = WriteBehindTracker(store, delay=60, max_delay=60)
+
+    writer.apply({"a": {"saved": True}})
+    writer.apply({"a": {"status": "Applied"}, "b": {"status": "Hidden"}})
+
+    # Optimistic view, nothing in the store yet
+    assert writer.get("a") == {"saved": True, "status": "Applied"}
+    assert store.load() == {}
+
+    writer.flush()
+    assert store.load() == {"a": {"saved": True, "status": "Applied"}, "b": {"status": "Hidden"}}
+    # One coalesced journal entry, pending log cleared
+    with open(store.journal_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+    assert not (tmp_path / "tracking.pending.jsonl").exists()
+
+
+def test_background_flush_within_delay(tmp_path):
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    writer = WriteBehindTracker(store, delay=0.05, max_delay=0.2)
+    writer.update("a", saved=True)
+    deadline = time.monotonic() + 2
+    while store.load().get("a") != {"saved": True} and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert store.load()["a"] == {"saved": True}
+
+
+def test_pending_log_is_replayed_after_crash(tmp_path):
+    pending = tmp_path / "tracking.pending.jsonl"
+    with open(pending, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"changes": {"a": {"status": "Offer"}}}) + "\n")
+        f.write('{"changes": {"b": ')  # torn last line
+
+    store = TrackingStore(str(tmp_path / "tracking.json"))
+    WriteBehindTracker(store, delay=60, max_delay=60)
+
+    assert store.load() == {"a": {"status": "Offer"}}
+    assert not pending.exists()
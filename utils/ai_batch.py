@@ -0,0 +1,156 @@
+"""
+Batched job analysis: pack several jobs into one chat completion and parse
+the strict JSON array that comes back.
+
+Each item must be an object with the job's id and the ANALYSIS_FIELDS as
+lists of strings. Items that are missing, malformed or for unknown ids are
+simply absent from parse_batch_response()'s result, so the caller can retry
+just those jobs one by one.
+"""
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.condense import count_tokens
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_FIELDS = ('responsibilities', 'required_skills', 'nice_to_have', 'culture', 'red_flags')
+FIELD_TITLES = {
+    'responsibilities': 'Key responsibilities',
+    'required_skills': 'Required skills and qualifications',
+    'nice_to_have': 'Nice-to-have skills',
+    'culture': 'Company culture indicators',
+    'red_flags': 'Red flags or concerns',
+}
+# Prompt tokens per request and the output allowance per job
+BATCH_TOKEN_BUDGET = 6000
+BATCH_MAX_JOBS = 8
+OUTPUT_TOKENS_PER_JOB = 350
+MAX_OUTPUT_TOKENS = 4000
+# Instructions + JSON framing around the jobs
+PROMPT_OVERHEAD_TOKENS = 250
+
+CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
+SYSTEM_PROMPT = ('You are a career advisor analyzing job postings. Respond with a JSON array only, '
+                 'no prose and no code fences.')
+
+
+def job_payload(job: Dict[str, Any], description: str) -> Dict[str, str]:
+    return {
+        'job_id': str(job.get('id')),
+        'title': job.get('title', ''),
+        'company': job.get('company', ''),
+        'description': description,
+    }
+
+
+def pack_batches(items: Sequence[Tuple[Dict[str, Any], str]], token_budget: int = BATCH_TOKEN_BUDGET,
+                 max_jobs: int = BATCH_MAX_JOBS) -> List[List[Tuple[Dict[str, Any], str]]]:
+    """Greedily group (job, description) pairs, in order, under the prompt token budget."""
+    batches, current, used = [], [], PROMPT_OVERHEAD_TOKENS
+    for job, description in items:
+        cost = count_tokens(json.dumps(job_payload(job, description), ensure_ascii=False))
+        if current and (used + cost > token_budget or len(current) >= max_jobs):
+            batches.append(current)
+            current, used = [], PROMPT_OVERHEAD_TOKENS
+        current.append((job, description))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_messages(batch: Sequence[Tuple[Dict[str, Any], str]]) -> List[Dict[str, str]]:
+    jobs = [job_payload(job, description) for job, description in batch]
+    schema = ", ".join(f'"{field}": [string, ...]' for field in ANALYSIS_FIELDS)
+    return [
+        {'role': 'system', 'content': SYSTEM_PROMPT},
+        {
+            'role': 'user',
+            'content': f"""Analyze each of these {len(jobs)} job postings.
+
+Return a JSON array with exactly one object per job, in the same order:
+{{"job_id": string, {schema}}}
+Use 3-5 short bullet strings for responsibilities and an empty list when nothing applies.
+
+Jobs:
+{json.dumps(jobs, ensure_ascii=False)}"""
+        },
+    ]
+
+
+def output_budget(batch_size: int) -> int:
+    return min(MAX_OUTPUT_TOKENS, OUTPUT_TOKENS_PER_JOB * batch_size)
+
+
+def _candidate_items(text: str) -> List[Any]:
+    """The array if the whole response parses, else every top-level object that does."""
+    text = CODE_FENCE_RE.sub("", text.strip())
+    start, end = text.find('['), text.rfind(']')
+    if start != -1 and end > start:
+        try:
+            parsed = json.loads(text[start:end + 1])
+            if isinstance(parsed, list):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+    # Truncated or otherwise broken array: salvage the objects that are complete
+    decoder = json.JSONDecoder()
+    items, pos = [], 0
+    while True:
+        pos = text.find('{', pos)
+        if pos == -1:
+            return items
+        try:
+            item, end_pos = decoder.raw_decode(text, pos)
+            items.append(item)
+            pos = end_pos
+        except json.JSONDecodeError:
+            pos += 1
+
+
+def validate_item(item: Any) -> Optional[Dict[str, List[str]]]:
+    """Normalized analysis fields, or None if the item does not match the schema"""
+    if not isinstance(item, dict):
+        return None
+    result = {}
+    for field in ANALYSIS_FIELDS:
+        value = item.get(field, [])
+        if isinstance(value, str):
+            value = [value] if value.strip() else []
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            return None
+        result[field] = [v.strip() for v in value if v.strip()]
+    if not result['responsibilities'] and not result['required_skills']:
+        return None
+    return result
+
+
+def parse_batch_response(text: Optional[str], expected_ids: Sequence[str]) -> Dict[str, Dict[str, List[str]]]:
+    """job id -> validated analysis fields, for the items that parsed"""
+    if not text:
+        return {}
+    expected = set(expected_ids)
+    parsed = {}
+    for item in _candidate_items(text):
+        job_id = str(item.get('job_id')) if isinstance(item, dict) else None
+        if job_id not in expected or job_id in parsed:
+            continue
+        fields = validate_item(item)
+        if fields is not None:
+            parsed[job_id] = fields
+        else:
+            logger.debug(f"Discarding malformed batch item for job {job_id}")
+    return parsed
+
+
+def render_analysis(fields: Dict[str, List[str]]) -> str:
+    """Structured fields as the same kind of text the single-job prompt returns"""
+    sections = []
+    for field in ANALYSIS_FIELDS:
+        bullets = fields.get(field) or ['None noted']
+        sections.append(f"**{FIELD_TITLES[field]}**\n" + "\n".join(f"- {b}" for b in bullets))
+    return "\n\n".join(sections)
@@ -0,0 +1,194 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DescriptionStore:
+    """
+    Content-addressed store for sanitized job descriptions.
+
+    Each unique raw description is keyed by its hash and stored once, gzip
+    compressed, under ``root/<2-char prefix>/<hash>.txt.gz``. Job records only
+    carry the ``description_hash``. Derived features (YOE, skill hits) are kept in
+    a small JSON index next to the blobs so they are computed once per hash.
+    retain() drops blobs and features of hashes not seen for RETAIN_DAYS.
+    """
+
+    MEMO_SIZE = 4096
+    # Grace period, so runs limited to a few companies don't drop everyone else's blobs
+    RETAIN_DAYS = 14
+
+    def __init__(self, root: str = os.path.join("data", "descriptions")):
+        self.root = root
+        self.features_file = os.path.join(self.root, "features.json")
+        # hash -> ISO date it was last referenced by a run
+        self.seen_file = os.path.join(self.root, "last_seen.json")
+        self._memo: "OrderedDict[str, str]" = OrderedDict()
+        self._features: Optional[Dict[str, Dict[str, Any]]] = None
+        self._features_dirty = False
+        self._seen: Optional[Dict[str, str]] = None
+        self._seen_dirty = False
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """Stable content hash for a raw description."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.txt.gz")
+
+    def has(self, digest: str) -> bool:
+        return digest in self._memo or os.path.exists(self.path_for(digest))
+
+    def _remember(self, digest: str, text: str):
+        self._memo[digest] = text
+        self._memo.move_to_end(digest)
+        if len(self._memo) > self.MEMO_SIZE:
+            self._memo.popitem(last=False)
+
+    def get(self, digest: str) -> Optional[str]:
+        """Return the sanitized text for a hash, or None if unknown."""
+        if not digest:
+            return None
+        if digest in self._memo:
+            self._memo.move_to_end(digest)
+            return self._memo[digest]
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                text = f.read()
+        except Exception as e:
+            logger.warning(f"Could not read description blob {digest}: {e}")
+            return None
+        self._remember(digest, text)
+        return text
+
+    def intern(self, raw_text: str, sanitizer: Callable[[str], str]) -> Tuple[str, str]:
+        """
+        Store a raw description and return (hash, sanitized_text).
+        The sanitizer only runs for hashes never seen before.
+        """
+        digest = self.digest(raw_text)
+        cached = self.get(digest)
+        if cached is not None:
+            return digest, cached
+
+        text = sanitizer(raw_text)
+        path = self.path_for(digest)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(path), delete=False) as tf:
+                tf.write(gzip.compress(text.encode("utf-8"), mtime=0))
+                temp_name = tf.name
+            os.replace(temp_name, path)
+        except Exception as e:
+            logger.warning(f"Could not write description blob {digest}: {e}")
+        self._remember(digest, text)
+        return digest, text
+
+    def resolve(self, job: Dict[str, Any]) -> str:
+        """Description text for a job record, inline or via its hash."""
+        return job.get("description") or self.get(job.get("description_hash", "")) or ""
+
+    # --- Derived features ---
+    def _load_features(self) -> Dict[str, Dict[str, Any]]:
+        if self._features is None:
+            try:
+                with open(self.features_file, "r", encoding="utf-8") as f:
+                    self._features = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._features = {}
+        return self._features
+
+    def get_features(self, digest: str, config_key: str) -> Optional[Dict[str, Any]]:
+        """Cached features for a hash, if computed under the same config."""
+        entry = self._load_features().get(digest)
+        if entry and entry.get("config_key") == config_key:
+            return entry
+        return None
+
+    def set_features(self, digest: str, config_key: str, features: Dict[str, Any]):
+        self._load_features()[digest] = dict(features, config_key=config_key)
+        self._features_dirty = True
+
+    # --- Retention ---
+    def _blob_digests(self) -> Iterable[str]:
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".txt.gz"):
+                    yield name[:-len(".txt.gz")]
+
+    def _load_seen(self, today: str) -> Dict[str, str]:
+        if self._seen is None:
+            try:
+                with open(self.seen_file, "r", encoding="utf-8") as f:
+                    self._seen = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                # First retain(): start every existing blob's grace period today (one directory scan)
+                self._seen = {digest: today for digest in self._blob_digests()}
+                self._seen_dirty = True
+        return self._seen
+
+    def retain(self, live_hashes: Iterable[str], today: Optional[date] = None) -> int:
+        """
+        Mark the hashes referenced by this run as seen and delete the blobs and
+        features of hashes unseen for RETAIN_DAYS. Returns how many were dropped.
+        Persisted by flush().
+        """
+        today = today or date.today()
+        day = today.isoformat()
+        seen = self._load_seen(day)
+        for digest in live_hashes:
+            if digest and seen.get(digest) != day:
+                seen[digest] = day
+                self._seen_dirty = True
+
+        cutoff = (today - timedelta(days=self.RETAIN_DAYS)).isoformat()
+        expired = [digest for digest, last in seen.items() if last < cutoff]
+        features = self._load_features()
+        for digest in expired:
+            del seen[digest]
+            self._memo.pop(digest, None)
+            if features.pop(digest, None) is not None:
+                self._features_dirty = True
+            try:
+                os.remove(self.path_for(digest))
+            except FileNotFoundError:
+                pass
+        if expired:
+            self._seen_dirty = True
+            logger.info(f"Dropped {len(expired)} descriptions unseen for {self.RETAIN_DAYS} days")
+        return len(expired)
+
+    def _write_json(self, path: str, data: Dict[str, Any]):
+        os.makedirs(self.root, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.root, delete=False, encoding="utf-8") as tf:
+            json.dump(data, tf, sort_keys=True)
+            temp_name = tf.name
+        os.replace(temp_name, path)
+
+    def flush(self):
+        """Persist the feature and last-seen indexes atomically if they changed."""
+        try:
+            if self._features_dirty:
+                self._write_json(self.features_file, self._features)
+                self._features_dirty = False
+            if self._seen_dirty:
+                self._write_json(self.seen_file, self._seen)
+                self._seen_dirty = False
+        except Exception as e:
+            logger.error(f"Error saving description indexes: {e}")
+
+
+# Singleton Export
+description_store = DescriptionStore()
@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:
+    pa = None
+    ipc = None
+
+logger = logging.getLogger(__name__)
+
+# Columns the dashboard needs; raw_data and friends stay in the JSON aggregate
+DASHBOARD_COLUMNS = ('id', 'title', 'company', 'location', 'url', 'score',
+                     'date_posted', 'source', 'status', 'description_hash')
+
+# Low-cardinality columns stored dictionary-encoded (-> pandas categoricals)
+CATEGORICAL_COLUMNS = ('company', 'status', 'location', 'source')
+
+
+def is_available() -> bool:
+    return pa is not None
+
+
+def write_jobs_arrow(jobs: List[Dict[str, Any]], path: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Write the dashboard columns as an uncompressed Arrow IPC (Feather v2) file.
+    Uncompressed so readers can memory-map it without copying.
+    """
+    if pa is None:
+        logger.info("pyarrow not installed - skipping columnar export")
+        return False
+
+    arrays = []
+    for col in DASHBOARD_COLUMNS:
+        if col == 'score':
+            arrays.append(pa.array([float(j.get(col) or 0) for j in jobs], type=pa.float64()))
+            continue
+        values = [None if j.get(col) is None else str(j.get(col)) for j in jobs]
+        array = pa.array(values, type=pa.string())
+        if col in CATEGORICAL_COLUMNS:
+            array = array.dictionary_encode()
+        arrays.append(array)
+
+    table = pa.Table.from_arrays(list(arrays), names=list(DASHBOARD_COLUMNS))
+    if metadata:
+        table = table.replace_schema_metadata({k: json.dumps(v) for k, v in metadata.items()})
+
+    temp_dir = os.path.dirname(path) or "."
+    os.makedirs(temp_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=temp_dir, delete=False) as tf:
+        temp_name = tf.name
+    try:
+        with pa.OSFile(temp_name, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temp_name, path)
+    except Exception:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+    return True
+
+
+def read_jobs_arrow(path: str) -> Tuple[Any, Dict[str, Any]]:
+    """Memory-map an Arrow jobs file. Returns (DataFrame, metadata)."""
+    if pa is None:
+        raise ImportError("pyarrow is required to read columnar job data")
+    with pa.memory_map(path, 'r') as source:
+        table = ipc.open_file(source).read_all()
+    metadata = {
+        k.decode('utf-8'): json.loads(v.decode('utf-8'))
+        for k, v in (table.schema.metadata or {}).items()
+    }
+    return table.to_pandas(), metadata
@@ -0,0 +1,186 @@
+"""
+Token-budgeted condensing of job descriptions before they go into a prompt.
+
+The description is split into sections (headings, paragraphs, bullet runs).
+EEO / benefits / legal boilerplate is dropped with precompiled patterns, the
+remaining sections are ranked by relevance to the prompt type, and the best
+ones are packed into the token budget. Kept sections stay in their original
+order. Token counts come from a cheap local approximation, not a real
+tokenizer, which is close enough for budgeting.
+"""
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Roughly what the old description[:2000] slice cost
+DEFAULT_TOKEN_BUDGET = 500
+
+WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+HEADING_RE = re.compile(r"^\s*(#{1,6}\s+.+|[A-Z][A-Za-z0-9 ,/&'()-]{2,60}:|[A-Z0-9 ,/&'()-]{4,60})\s*$")
+BULLET_RE = re.compile(r"^\s*([-*•·▪●]|\d+[.)])\s+")
+# Sanitized descriptions are usually one line: split before inline section titles and between sentences
+INLINE_HEADING_RE = re.compile(
+    r"\s+(?=(?:About (?:Us|You|the (?:Role|Team|Company|Job))|Responsibilities|Key Responsibilities|"
+    r"Requirements|(?:Minimum |Basic |Preferred )?Qualifications|What You(?:'ll| Will) (?:Do|Bring|Need)|"
+    r"What We(?:'re| Are) Looking For|Who You Are|Nice[- ]to[- ]Have|Bonus Points|What We Offer|"
+    r"Benefits|Perks|Compensation|Equal (?:Employment )?Opportunity)\b)")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+# Sections longer than this are regrouped sentence by sentence
+MAX_SECTION_TOKENS = 120
+
+BOILERPLATE_PATTERNS: List[Pattern] = [re.compile(p, re.IGNORECASE) for p in (
+    r"equal (employment )?opportunity",
+    r"without regard to",
+    r"race,? (color|colour|religion)",
+    r"sexual orientation|gender identity",
+    r"protected (veteran|characteristic|class)",
+    r"reasonable accommodation",
+    r"e-verify",
+    r"(applicant|candidate) privacy",
+    r"privacy (notice|policy)",
+    r"401\(?k\)?",
+    r"(medical|dental|vision) (insurance|coverage|plans?)",
+    r"paid (time off|parental leave|holidays)",
+    r"\bpto\b|unlimited vacation",
+    r"(our |the )?(benefits|perks) (include|package)",
+    r"recruit(ment|ing) (agencies|agency)",
+)]
+# Boilerplate sections usually start with one of these headings
+BOILERPLATE_HEADING_RE = re.compile(
+    r"^\s*(#{1,6}\s*)?(benefits|perks|what we offer|eeo|equal (employment )?opportunity|diversity"
+    r"|privacy|accommodations?)\b", re.IGNORECASE)
+
+_COMMON = (r"requirement", r"qualification", r"responsib", r"must[- ]have", r"experience (with|in)",
+           r"\d\+? years", r"you (will|'ll)", r"what you('ll)? do", r"skills?", r"proficien", r"knowledge of")
+PROMPT_KEYWORDS: Dict[str, List[Pattern]] = {
+    prompt_type: [re.compile(p, re.IGNORECASE) for p in _COMMON + extra]
+    for prompt_type, extra in {
+        'analysis': (r"nice[- ]to[- ]have", r"preferred", r"bonus", r"culture", r"team"),
+        'resume': (r"preferred", r"nice[- ]to[- ]have", r"degree", r"certif", r"tools?", r"stack"),
+        'cover_letter': (r"mission", r"values?", r"about (us|the (team|role))", r"culture", r"impact"),
+        'interview': (r"technical", r"design", r"team", r"collaborat", r"stack", r"on[- ]call"),
+    }.items()
+}
+
+
+def count_tokens(text: str) -> int:
+    """Approximate BPE token count: words cost ~1 token per 4 characters, punctuation 1"""
+    return sum(math.ceil(len(tok) / 4) if tok[0].isalnum() or tok[0] == "_" else 1 for tok in WORD_RE.findall(text))
+
+
+def _split_long(section: str) -> List[str]:
+    """Regroup an over-long section into runs of whole sentences"""
+    groups, current, used = [], [], 0
+    for sentence in SENTENCE_RE.split(section):
+        cost = count_tokens(sentence)
+        if current and used + cost > MAX_SECTION_TOKENS:
+            groups.append(" ".join(current))
+            current, used = [], 0
+        current.append(sentence)
+        used += cost
+    if current:
+        groups.append(" ".join(current))
+    return groups
+
+
+def segment(text: str) -> List[str]:
+    """
+    Split into sections: a heading (own line or inline title) starts a new
+    one, a blank line ends one, and long sections are cut at sentence ends.
+    """
+    sections = []
+    for block in _segment_lines(text):
+        for part in INLINE_HEADING_RE.split(block):
+            part = part.strip()
+            if not part:
+                continue
+            sections.extend(_split_long(part) if count_tokens(part) > MAX_SECTION_TOKENS else [part])
+    return sections
+
+
+def _segment_lines(text: str) -> List[str]:
+    sections, current = [], []
+    for line in text.splitlines():
+        if not line.strip():
+            if current:
+                sections.append("\n".join(current))
+                current = []
+            continue
+        if HEADING_RE.match(line) and not BULLET_RE.match(line) and current:
+            sections.append("\n".join(current))
+            current = []
+        current.append(line.rstrip())
+    if current:
+        sections.append("\n".join(current))
+    return sections
+
+
+def is_boilerplate(section: str) -> bool:
+    if BOILERPLATE_HEADING_RE.match(section):
+        return True
+    hits = sum(1 for pattern in BOILERPLATE_PATTERNS if pattern.search(section))
+    # One hit in a long section may be incidental ("we offer great benefits")
+    return hits >= 2 or (hits == 1 and count_tokens(section) < 80)
+
+
+def relevance(section: str, prompt_type: str) -> float:
+    patterns = PROMPT_KEYWORDS.get(prompt_type, PROMPT_KEYWORDS['analysis'])
+    hits = sum(len(pattern.findall(section)) for pattern in patterns)
+    bullets = sum(1 for line in section.splitlines() if BULLET_RE.match(line))
+    # Density, so one long marketing paragraph does not beat a tight requirements list
+    return (hits * 4 + bullets) / math.sqrt(count_tokens(section) + 1)
+
+
+def _truncate(section: str, budget: int) -> str:
+    """Longest whole-word prefix of the section within budget tokens"""
+    words, used, kept = section.split(" "), 0, []
+    for word in words:
+        cost = count_tokens(word)
+        if used + cost > budget:
+            break
+        kept.append(word)
+        used += cost
+    return " ".join(kept)
+
+
+@dataclass
+class Condensed:
+    text: str
+    original_tokens: int
+    tokens: int
+    dropped_boilerplate: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+def condense(text: str, budget: int = DEFAULT_TOKEN_BUDGET, prompt_type: str = 'analysis') -> Condensed:
+    """Description reduced to the most relevant sections within `budget` tokens."""
+    original_tokens = count_tokens(text)
+    sections = segment(text)
+    kept = [(i, s) for i, s in enumerate(sections) if not is_boilerplate(s)]
+    dropped = len(sections) - len(kept)
+    costs = {i: count_tokens(s) for i, s in kept}
+
+    if sum(costs.values()) <= budget:
+        chosen: List[Tuple[int, str]] = kept
+    else:
+        ranked = sorted(kept, key=lambda item: (-relevance(item[1], prompt_type), item[0]))
+        chosen, used = [], 0
+        for i, section in ranked:
+            if used + costs[i] <= budget:
+                chosen.append((i, section))
+                used += costs[i]
+            elif not chosen and budget - used > 20:
+                # The most relevant section alone is over budget: keep its start
+                chosen.append((i, _truncate(section, budget - used)))
+                used = budget
+        chosen.sort()
+
+    condensed = "\n\n".join(section for _, section in chosen)
+    return Condensed(condensed, original_tokens, count_tokens(condensed), dropped)
@@ -0,0 +1,112 @@
+"""
+Incremental Atom feed of newly discovered jobs.
+
+The feed keeps its own small state (data/feed_state.json): the last N
+entries and a first-seen map of job ids. Each run only looks at the
+run's new jobs, so updating is O(new items) rather than a rebuild from
+the full job list.
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from xml.sax.saxutils import escape, quoteattr
+
+from utils.snapshot import write_if_changed
+
+logger = logging.getLogger(__name__)
+
+# Forget first-seen ids after this long, so the state file stays small
+SEEN_RETENTION_DAYS = 90
+ENTRY_FIELDS = ('id', 'title', 'company', 'location', 'url', 'score')
+
+
+class JobFeed:
+    """Atom feed of first-seen jobs above a score threshold, capped to max_entries"""
+
+    def __init__(self, feed_path: str, state_path: str, min_score: float = 0, max_entries: int = 100,
+                 title: str = "New job matches"):
+        self.feed_path = feed_path
+        self.state_path = state_path
+        self.min_score = min_score
+        self.max_entries = max_entries
+        self.title = title
+
+    def load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        state.setdefault('entries', [])
+        state.setdefault('seen', {})
+        return state
+
+    def update(self, new_jobs: List[Dict[str, Any]], now: datetime = None) -> int:
+        """
+        Add jobs not seen before (and scoring at least min_score) to the feed.
+        Returns the number of entries added; the feed is not rewritten when it is 0.
+        """
+        now = (now or datetime.now()).astimezone()
+        stamp = now.isoformat(timespec='seconds')
+        state = self.load_state()
+        seen = state['seen']
+
+        fresh = []
+        newly_seen = 0
+        for job in new_jobs:
+            job_id = str(job.get('id'))
+            if job_id in seen:
+                continue
+            seen[job_id] = stamp
+            newly_seen += 1
+            if (job.get('score', 0) or 0) >= self.min_score:
+                entry = {k: job.get(k) for k in ENTRY_FIELDS}
+                entry['id'] = job_id
+                entry['first_seen'] = stamp
+                fresh.append(entry)
+
+        if not fresh and os.path.exists(self.feed_path):
+            if newly_seen:
+                self._save_state(state)
+            return 0
+
+        fresh.sort(key=lambda e: e.get('score', 0) or 0, reverse=True)
+        state['entries'] = (fresh + state['entries'])[:self.max_entries]
+
+        cutoff = (now - timedelta(days=SEEN_RETENTION_DAYS)).isoformat(timespec='seconds')
+        state['seen'] = {k: v for k, v in seen.items() if v >= cutoff}
+        state['updated'] = stamp
+
+        write_if_changed(self.feed_path, self.render(state['entries'], stamp))
+        self._save_state(state)
+        logger.info(f"Feed: {len(fresh)} new entries ({len(state['entries'])} total) in {self.feed_path}")
+        return len(fresh)
+
+    def _save_state(self, state: Dict[str, Any]):
+        write_if_changed(self.state_path, json.dumps(state, ensure_ascii=False))
+
+    def render(self, entries: List[Dict[str, Any]], updated: str) -> str:
+        parts = [
+            '<?xml version="1.0" encoding="utf-8"?>\n',
+            '<feed xmlns="http://www.w3.org/2005/Atom">\n',
+            f'  <title>{escape(self.title)}</title>\n',
+            '  <id>urn:job-scraping-app:feed</id>\n',
+            f'  <updated>{updated}</updated>\n',
+            '  <author><name>Job Scraping App</name></author>\n',
+        ]
+        for entry in entries:
+            title = f"{entry.get('title') or 'N/A'} - {entry.get('company') or 'N/A'}"
+            summary = f"{entry.get('location') or 'N/A'} | Score: {entry.get('score', 0) or 0:.1f}"
+            parts.append(
+                '  <entry>\n'
+                f'    <title>{escape(title)}</title>\n'
+                f'    <id>urn:job-scraping-app:job:{escape(entry["id"])}</id>\n'
+                f'    <link href={quoteattr(entry.get("url") or "")}/>\n'
+                f'    <updated>{entry["first_seen"]}</updated>\n'
+                f'    <summary>{escape(summary)}</summary>\n'
+                '  </entry>\n'
+            )
+        parts.append('</feed>\n')
+        return ''.join(parts)
@@ -0,0 +1,77 @@
+"""
+Display-ready job DataFrame for the dashboard.
+
+Everything here depends only on (jobs data, tracking data), so the result
+can be built once per version pair and shared; reruns only apply filters.
+"""
+import os
+from typing import Any, Dict, Tuple
+
+import pandas as pd
+
+# Never shown in the dashboard; dropped instead of being stringified every rerun
+HEAVY_COLUMNS = ('raw_data', 'keywords_matched')
+CATEGORICAL_COLUMNS = ('company', 'location', 'source', 'Status', 'cv_status')
+STATUS_PRIORITY = {"Offer": 5, "Interviewing": 4, "Applied": 3, "New": 1, "Rejected": 0, "Hidden": -1}
+
+
+def slim_jobs_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Projection without the heavy per-job payload columns."""
+    return df.drop(columns=[c for c in HEAVY_COLUMNS if c in df.columns])
+
+
+def tracking_fields(record: Dict[str, Any]) -> Tuple[str, bool, str, str]:
+    """(status, saved, cv_status, resume file name) of one tracking record."""
+    return (
+        record.get('status') or 'New',
+        bool(record.get('saved', False)),
+        record.get('cv_status') or 'Generic',
+        os.path.basename(record['cv_pdf_path']) if record.get('cv_pdf_path') else '',
+    )
+
+
+def display_titles(title: pd.Series, saved: pd.Series, status: pd.Series) -> pd.Series:
+    """Saved star, then interview/offer emoji in front of the title."""
+    title = title.astype(str)
+    title = title.where(~saved, "⭐ " + title)
+    title = title.where(status != 'Interviewing', "🎤 " + title)
+    return title.where(status != 'Offer', "🎉 " + title)
+
+
+def prepare_jobs_frame(jobs_df: pd.DataFrame, tracking: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Merge tracking state into the jobs frame and precompute everything the
+    views need: Status/is_saved/cv_status/resume, parsed posting dates,
+    prefixed display titles, status priority and categorical columns.
+    """
+    if jobs_df is None or jobs_df.empty:
+        return pd.DataFrame()
+    df = slim_jobs_frame(jobs_df).copy()
+
+    if 'score' in df.columns:
+        df['score'] = pd.to_numeric(df['score'], errors='coerce').fillna(0)
+
+    # One pass over tracking instead of four dict comprehensions
+    status_map, saved_map, cv_status_map, resume_map = {}, {}, {}, {}
+    for job_id, record in tracking.items():
+        status_map[job_id], saved_map[job_id], cv_status_map[job_id], resume_map[job_id] = tracking_fields(record)
+
+    ids = df['id'].astype(str)
+    df['Status'] = ids.map(status_map).fillna('New')
+    df['is_saved'] = ids.map(saved_map).fillna(False).astype(bool)
+    df['cv_status'] = ids.map(cv_status_map).fillna('Generic')
+    df['resume'] = ids.map(resume_map).fillna('')
+
+    if 'date_posted' in df.columns:
+        df['date_parsed'] = pd.to_datetime(df['date_posted'], errors='coerce', format='ISO8601')
+        # Object dtype so comparisons against datetime.date work even when all NaT
+        df['posted_day'] = df['date_parsed'].dt.date.astype(object)
+
+    df['title'] = display_titles(df['title'], df['is_saved'], df['Status'])
+
+    df['status_prio'] = df['Status'].map(STATUS_PRIORITY).fillna(1)
+
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
@@ -0,0 +1,165 @@
+"""
+O(1) single-job reads from jobs_agg.json via an id -> byte range index.
+
+The reporter writes the aggregate job by job (byte-identical to
+json.dump(indent=2)) and records where each job starts and how long it is
+in jobs_agg.idx.json, together with a canonical URL -> id map and the
+aggregate's (mtime_ns, size). A lookup reads the small index once per version, then seeks straight to the
+job instead of parsing the whole aggregate. An index that does not match
+the aggregate on disk is ignored, so callers fall back to a full read.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from utils.snapshot import write_if_changed
+from utils.tracking_store import canonical_url
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx.json"
+
+
+def index_path_for(aggregate_path: str) -> str:
+    base, _ = os.path.splitext(aggregate_path)
+    return base + INDEX_SUFFIX
+
+
+def _indented(value: Any, indent: str) -> str:
+    """json.dumps(indent=2) of a nested value; JSON strings never hold raw newlines"""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + indent)
+
+
+def write_indexed_aggregate(f: BinaryIO, data: Dict[str, Any]) -> Dict[str, List[int]]:
+    """
+    Write `data` (whose 'jobs' is a list) to binary file f exactly as
+    json.dump(data, f, indent=2, ensure_ascii=False) would. Returns
+    {job id: [byte offset, byte length]}.
+    """
+    offsets: Dict[str, List[int]] = {}
+    pos = 0
+
+    def w(text: str):
+        nonlocal pos
+        encoded = text.encode("utf-8")
+        f.write(encoded)
+        pos += len(encoded)
+
+    w("{")
+    for i, (key, value) in enumerate(data.items()):
+        w(("," if i else "") + "\n  " + json.dumps(key, ensure_ascii=False) + ": ")
+        if key != "jobs" or not value:
+            w(_indented(value, "  "))
+            continue
+        w("[")
+        for j, job in enumerate(value):
+            w(("," if j else "") + "\n    ")
+            start = pos
+            w(_indented(job, "    "))
+            offsets[str(job.get("id"))] = [start, pos - start]
+        w("\n  ]")
+    w("\n}" if data else "}")
+    return offsets
+
+
+def url_index(jobs: List[Dict[str, Any]]) -> Dict[str, str]:
+    """{canonical posting URL: job id}"""
+    return {canonical_url(job["url"]): str(job.get("id")) for job in jobs if job.get("url")}
+
+
+def save_offset_index(aggregate_path: str, offsets: Dict[str, List[int]],
+                      urls: Optional[Dict[str, str]] = None) -> str:
+    """Write the index for the aggregate as it now exists on disk."""
+    stat = os.stat(aggregate_path)
+    path = index_path_for(aggregate_path)
+    payload = {
+        "aggregate": os.path.basename(aggregate_path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "offsets": offsets,
+        "urls": urls or {},
+    }
+    write_if_changed(path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+    return path
+
+
+class JobLookup:
+    """Single-job reads from one aggregate file"""
+
+    def __init__(self, aggregate_path: str):
+        self.aggregate_path = aggregate_path
+        self.index_path = index_path_for(aggregate_path)
+        self._lock = threading.Lock()
+        self._index_version = None
+        self._index: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def _signature(path: str):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _current_index(self) -> Optional[Dict[str, Any]]:
+        """Parsed index if it describes the aggregate currently on disk"""
+        version = self._signature(self.index_path)
+        with self._lock:
+            if version != self._index_version:
+                self._index = None
+                if version is not None:
+                    try:
+                        with open(self.index_path, "r", encoding="utf-8") as f:
+                            self._index = json.load(f)
+                    except (OSError, json.JSONDecodeError) as e:
+                        logger.warning(f"Ignoring unreadable job index {self.index_path}: {e}")
+                self._index_version = version
+            index = self._index
+        if index is None:
+            return None
+        if self._signature(self.aggregate_path) != (index.get("mtime_ns"), index.get("size")):
+            return None
+        return index
+
+    def is_current(self) -> bool:
+        return self._current_index() is not None
+
+    def find(self, identifier: str) -> Optional[str]:
+        """Resolve a job id or posting URL to a job id in the aggregate (None if absent or stale)."""
+        index = self._current_index()
+        if index is None:
+            return None
+        if str(identifier) in index["offsets"]:
+            return str(identifier)
+        return index.get("urls", {}).get(canonical_url(identifier))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The job with this id, or None if absent or the index is stale (see is_current())."""
+        index = self._current_index()
+        if index is None:
+            return None
+        entry = index["offsets"].get(str(job_id))
+        if entry is None:
+            return None
+        offset, length = entry
+        try:
+            with open(self.aggregate_path, "rb") as f:
+                f.seek(offset)
+                job = json.loads(f.read(length).decode("utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Indexed read of job {job_id} failed: {e}")
+            return None
+        return job if str(job.get("id")) == str(job_id) else None
+
+
+_lookups: Dict[str, JobLookup] = {}
+
+
+def get_job_lookup(aggregate_path: str) -> JobLookup:
+    """Process-wide lookup per aggregate, so the parsed index is shared."""
+    key = os.path.abspath(aggregate_path)
+    if key not in _lookups:
+        _lookups[key] = JobLookup(aggregate_path)
+    return _lookups[key]
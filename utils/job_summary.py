@@ -0,0 +1,53 @@
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass
+class JobSummary:
+    """Everything the Markdown report and the digest issue need, computed in one pass."""
+    total: int = 0
+    generated_at: datetime = field(default_factory=datetime.now)
+    company_counts: Dict[str, int] = field(default_factory=dict)
+    source_counts: Dict[str, int] = field(default_factory=dict)
+    # Jobs grouped by company, preserving input (score) order
+    by_company: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    # Highest scoring jobs, best first
+    top_jobs: List[Dict[str, Any]] = field(default_factory=list)
+
+    def top_companies(self, n: int) -> List[Tuple[str, int]]:
+        return heapq.nlargest(n, self.company_counts.items(), key=lambda x: x[1])
+
+    def sources_by_count(self) -> List[Tuple[str, int]]:
+        return sorted(self.source_counts.items(), key=lambda x: x[1], reverse=True)
+
+
+def summarize_jobs(jobs: List[Dict[str, Any]], top_k: int = 20) -> JobSummary:
+    """
+    Single pass over the job list: per-company/per-source counts, a group-by
+    company index and a bounded heap for the top-K by score. Ties keep input order.
+    """
+    summary = JobSummary(total=len(jobs))
+    company_counts = summary.company_counts
+    source_counts = summary.source_counts
+    by_company = summary.by_company
+    heap: List[Tuple[float, int]] = []
+
+    for idx, job in enumerate(jobs):
+        company = job.get('company', 'Unknown')
+        company_counts[company] = company_counts.get(company, 0) + 1
+        by_company.setdefault(company, []).append(job)
+
+        source = job.get('source', 'Unknown')
+        source_counts[source] = source_counts.get(source, 0) + 1
+
+        if top_k > 0:
+            entry = (job.get('score', 0) or 0, -idx)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    summary.top_jobs = [jobs[-neg_idx] for _, neg_idx in sorted(heap, reverse=True)]
+    return summary
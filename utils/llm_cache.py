@@ -0,0 +1,148 @@
+"""
+On-disk cache of LLM chat completions.
+
+Responses are keyed by sha256 of (model, normalized messages, max_tokens) and
+stored one file per key under ``root/<2-char prefix>/<key>.json``, like the
+description blobs. Entries expire `ttl_days` after they were created (the
+timestamp stored in the entry); when the cache grows past `max_bytes` the
+least recently used entries (by mtime, refreshed on every hit) are evicted.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_DAYS = float(os.getenv('AI_CACHE_TTL_DAYS', '30'))
+DEFAULT_MAX_BYTES = int(os.getenv('AI_CACHE_MAX_MB', '50')) * 1024 * 1024
+
+
+def normalize_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Role + whitespace-collapsed content, so formatting-only prompt changes still hit"""
+    return [{'role': m.get('role', ''), 'content': " ".join(str(m.get('content', '')).split())} for m in messages]
+
+
+class LLMCache:
+    """TTL + size bounded response cache shared by every AIAssistant prompt"""
+
+    def __init__(self, root: str = os.path.join("data", "llm_cache"), ttl_days: float = DEFAULT_TTL_DAYS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.ttl = ttl_days * 86400
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._bytes: Optional[int] = None  # Lazily measured on first put
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, messages: List[Dict[str, str]], max_tokens: int) -> str:
+        payload = json.dumps([model, normalize_messages(messages), max_tokens], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        if time.time() - entry.get('created', 0) > self.ttl:
+            self._remove(path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # LRU by mtime
+        except OSError:
+            pass
+        self.hits += 1
+        return entry.get('response')
+
+    def put(self, key: str, response: str, model: str = ""):
+        path = self.path_for(key)
+        encoded = json.dumps({'created': time.time(), 'model': model, 'response': response},
+                             ensure_ascii=False).encode("utf-8")
+        try:
+            previous = os.stat(path).st_size
+        except OSError:
+            previous = 0
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(path), delete=False) as tf:
+                tf.write(encoded)
+                temp_name = tf.name
+            os.replace(temp_name, path)
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry {key}: {e}")
+            return
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._measure()
+            else:
+                # A replaced key frees its old entry
+                self._bytes += len(encoded) - previous
+            over = self._bytes > self.max_bytes
+        if over:
+            self.prune()
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".json"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield path, stat
+
+    def _measure(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _created(path: str) -> float:
+        """Creation time stored in the entry (0 if unreadable, i.e. expired)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f).get('created', 0)
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return 0
+
+    def prune(self) -> int:
+        """Drop expired entries, then least recently used ones until under max_bytes. Returns entries removed."""
+        now = time.time()
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for path, stat in entries:
+            # Same TTL rule as get(): age since creation. mtime only orders the LRU eviction.
+            if total <= self.max_bytes and now - self._created(path) <= self.ttl:
+                continue
+            self._remove(path)
+            total -= stat.st_size
+            removed += 1
+        with self._lock:
+            self._bytes = total
+        if removed:
+            logger.info(f"LLM cache: evicted {removed} entries ({total / 1024:.0f} KB kept)")
+        return removed
+
+
+# Module-level singleton
+llm_cache = LLMCache()
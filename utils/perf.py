@@ -0,0 +1,94 @@
+"""
+Lightweight per-run phase timing with rolling percentiles.
+
+    timer = PhaseTimer()
+    ...load...
+    timer.mark("data_load")      # time since start()/previous mark
+    timer.start()                # skip an unrelated stretch
+    ...filter...
+    timer.mark("filters")
+"""
+import json
+import math
+import os
+import tempfile
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Optional
+
+DEFAULT_WINDOW = 200
+PERCENTILES = (50, 90, 99)
+
+
+class PhaseTimer:
+    """Attributes wall time between marks to named phases. Disabled timers cost ~nothing."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.timings: Dict[str, float] = OrderedDict()
+        self._last = time.perf_counter() if enabled else 0.0
+
+    def start(self):
+        if self.enabled:
+            self._last = time.perf_counter()
+
+    def mark(self, phase: str):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+
+def percentile(sorted_values, p: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RollingStats:
+    """Last `window` samples per phase"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self.samples: Dict[str, Deque[float]] = OrderedDict()
+
+    def add(self, timings: Dict[str, float]):
+        for phase, seconds in timings.items():
+            self.samples.setdefault(phase, deque(maxlen=self.window)).append(seconds)
+
+    def summary(self, percentiles: Iterable[float] = PERCENTILES) -> Dict[str, Dict[str, float]]:
+        """phase -> {'n', 'mean_ms', 'p50_ms', ...}"""
+        result = OrderedDict()
+        for phase, values in self.samples.items():
+            ordered = sorted(values)
+            row = {'n': len(ordered), 'mean_ms': 1000 * sum(ordered) / len(ordered) if ordered else 0.0}
+            for p in percentiles:
+                row[f'p{p}_ms'] = 1000 * percentile(ordered, p)
+            result[phase] = row
+        return result
+
+
+def export_stats(stats: RollingStats, directory: str = "logs", label: str = "dashboard",
+                 extra: Optional[Dict[str, Any]] = None) -> str:
+    """Write the summary and raw samples to <directory>/<label>_perf_<timestamp>.json."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{label}_perf_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    payload = {
+        'exported_at': datetime.now().isoformat(),
+        'summary': stats.summary(),
+        'samples_ms': {phase: [round(1000 * v, 3) for v in values] for phase, values in stats.samples.items()},
+    }
+    if extra:
+        payload.update(extra)
+    with tempfile.NamedTemporaryFile('w', dir=directory, delete=False, encoding='utf-8') as tf:
+        json.dump(payload, tf, indent=2)
+        temp_name = tf.name
+    os.replace(temp_name, path)
+    return path
@@ -0,0 +1,74 @@
+"""
+Client for the local job query service (query_service.py).
+
+Every call returns None when the service is unreachable or errors, so callers
+keep their file-based fallback. Responses are cached per URL and revalidated
+with If-None-Match, so unchanged data costs a 304 and no JSON parsing.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_URL = os.environ.get("JOB_QUERY_URL", "http://127.0.0.1:8765")
+DEFAULT_TIMEOUT = 0.5
+MAX_CACHED = 256
+
+
+class QueryClient:
+    """ETag-caching HTTP client for the job query API"""
+
+    def __init__(self, base_url: str = DEFAULT_URL, timeout: float = DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._cache: Dict[str, Tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        url = self.base_url + path
+        if params:
+            url += "?" + urlencode({k: v for k, v in params.items() if v is not None})
+        with self._lock:
+            cached = self._cache.get(url)
+        request = Request(url, headers={"Accept": "application/json"})
+        if cached:
+            request.add_header("If-None-Match", cached[0])
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+                etag = response.headers.get("ETag")
+        except HTTPError as e:
+            if e.code == 304 and cached:
+                return cached[1]
+            if e.code != 404:
+                logger.warning(f"Query service returned {e.code} for {path}")
+            return None
+        except (URLError, OSError, ValueError) as e:
+            logger.debug(f"Query service unavailable: {e}")
+            return None
+        if etag:
+            with self._lock:
+                if len(self._cache) >= MAX_CACHED:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[url] = (etag, payload)
+        return payload
+
+    def health(self) -> Optional[Dict[str, Any]]:
+        return self._get("/health")
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._get("/jobs/" + quote(str(job_id), safe=""))
+
+    def list_jobs(self, **params) -> Optional[Dict[str, Any]]:
+        """Same parameters as GET /jobs (q, view, status, company, saved, min_score, sort, page, page_size)"""
+        return self._get("/jobs", params)
+
+
+# Module-level singleton
+query_client = QueryClient()
@@ -0,0 +1,175 @@
+"""
+PDF render cache and background render worker for the CV editor.
+
+Renders are keyed by sha256(template version + YAML content). A key that has
+been rendered before is served from the cache directory without touching the
+renderer. New keys are rendered on a small thread pool; callers get a
+RenderJob back immediately and poll status(key, job_id). Submitting the same
+content for the same job while it is queued or running returns that job.
+Different jobs with identical content each get their own RenderJob: the
+renders of one key are serialized, so the later one is a cache hit that is
+published to its own job's output file. Renders of the same CV (job id) are
+serialized too, because they write the same output file.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = int(os.environ.get("CV_RENDER_WORKERS", "2"))
+MAX_CACHED_RENDERS = 200
+# Finished jobs kept for status polling
+MAX_FINISHED_JOBS = 500
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+# (job_id, yaml content) -> (pdf_path or None, status message)
+RenderFn = Callable[[str, str], Tuple[Optional[str], str]]
+
+
+def render_key(content: str, template_version: str) -> str:
+    h = hashlib.sha256()
+    h.update(str(template_version).encode("utf-8"))
+    h.update(b"\0")
+    h.update(content.encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclass
+class RenderJob:
+    key: str
+    job_id: str
+    state: str = QUEUED
+    pdf_path: Optional[str] = None
+    error: Optional[str] = None
+    cached: bool = False
+    submitted_at: float = 0.0
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (DONE, FAILED)
+
+
+def _copy_atomic(src: str, dst: str):
+    directory = os.path.dirname(dst) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as tf:
+        temp_name = tf.name
+    shutil.copyfile(src, temp_name)
+    os.replace(temp_name, dst)
+
+
+class RenderService:
+    """Content-addressed render cache in front of a (slow) PDF renderer"""
+
+    def __init__(self, render_fn: RenderFn, cache_dir: str, template_version: str = "1",
+                 output_path: Optional[Callable[[str], str]] = None, max_workers: int = DEFAULT_WORKERS):
+        self.render_fn = render_fn
+        self.cache_dir = cache_dir
+        self.template_version = template_version
+        # Where the editor expects a job's current PDF; cache hits are copied there
+        self.output_path = output_path
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cv-render")
+        self._lock = threading.Lock()
+        # (job_id, key) -> job
+        self._jobs: Dict[Tuple[str, str], RenderJob] = {}
+        self._cv_locks: Dict[str, threading.Lock] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def submit(self, job_id: str, content: str) -> RenderJob:
+        """Cache hit: a finished job. Otherwise the queued/running job for this content."""
+        key = render_key(content, self.template_version)
+        with self._lock:
+            existing = self._jobs.get((job_id, key))
+            if existing is not None and not existing.finished:
+                return existing
+            job = RenderJob(key=key, job_id=job_id, submitted_at=time.time())
+            cached = self.cache_path(key)
+            if os.path.exists(cached):
+                job.state, job.cached, job.finished_at = DONE, True, time.time()
+                job.pdf_path = self._publish(job_id, cached)
+                os.utime(cached)  # LRU by mtime
+                self._remember(job)
+                return job
+            self._remember(job)
+            self._executor.submit(self._render, job, content)
+        return job
+
+    def status(self, key: str, job_id: str) -> Optional[RenderJob]:
+        with self._lock:
+            return self._jobs.get((job_id, key))
+
+    def _remember(self, job: RenderJob):
+        self._jobs[(job.job_id, job.key)] = job
+        if len(self._jobs) > MAX_FINISHED_JOBS:
+            for key in [k for k, j in self._jobs.items() if j.finished][:len(self._jobs) - MAX_FINISHED_JOBS]:
+                del self._jobs[key]
+
+    def _publish(self, job_id: str, cached: str) -> str:
+        if self.output_path is None:
+            return cached
+        target = self.output_path(job_id)
+        try:
+            _copy_atomic(cached, target)
+            return target
+        except OSError as e:
+            logger.warning(f"Serving cached render for {job_id} from the cache: {e}")
+            return cached
+
+    def _render(self, job: RenderJob, content: str):
+        with self._lock:
+            key_lock = self._key_locks.setdefault(job.key, threading.Lock())
+            cv_lock = self._cv_locks.setdefault(job.job_id, threading.Lock())
+        with key_lock, cv_lock:
+            job.state = RUNNING
+            try:
+                cached = self.cache_path(job.key)
+                if os.path.exists(cached):
+                    # Another job rendered the same content while this one waited
+                    job.pdf_path, job.cached = self._publish(job.job_id, cached), True
+                else:
+                    pdf_path, status = self.render_fn(job.job_id, content)
+                    if not pdf_path:
+                        raise RuntimeError(status or "render failed")
+                    _copy_atomic(pdf_path, cached)
+                    job.pdf_path = pdf_path
+                job.state = DONE
+            except Exception as e:
+                logger.error(f"Render failed for {job.job_id}: {e}")
+                job.error = str(e)
+                job.state = FAILED
+            job.finished_at = time.time()
+        if job.state == DONE:
+            self.prune()
+        logger.info(f"Render {job.state} for {job.job_id} in {job.finished_at - job.submitted_at:.1f}s")
+
+    def prune(self, max_entries: int = MAX_CACHED_RENDERS):
+        """Drop the least recently used cached PDFs beyond max_entries."""
+        try:
+            entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".pdf")]
+        except FileNotFoundError:
+            return
+        if len(entries) <= max_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - max_entries]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
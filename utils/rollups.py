@@ -0,0 +1,256 @@
+"""
+Incrementally maintained daily rollups for the Trends page.
+
+Each run the reporter feeds its RunDelta (added / removed / re-scored jobs)
+into RollupStore.apply(). Only the buckets the changes fall into are read
+and rewritten: today's day files, the open-job shards of the changed ids,
+and the two small fixed tables.
+
+    company_day/<day>.json  {company: {"new": n, "closed": n}}
+    source_day/<day>.json   {source: {"new": n, "closed": n}}
+    funnel/<day>.json       {status: n}                  (tracking status funnel)
+    scores.json             {bucket: open jobs}          (match score histogram)
+    time_to_close.json      {"buckets": {...}, "by_company": {company: [days, count]}}
+
+open_jobs/<xx>.json, sharded by id hash, remembers when each open job was
+first seen (plus its source and score bucket), which is what closes and
+re-scores are computed against. The first run only seeds it (see seed()):
+jobs that existed before rollups started are not counted as new postings.
+Re-applying a delta is harmless: jobs already open are not counted again and
+unknown removals are ignored.
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.snapshot import write_if_changed
+
+logger = logging.getLogger(__name__)
+
+# Tables with one file per day, and whole-file tables
+DAY_TABLES = ('company_day', 'source_day', 'funnel')
+FIXED_TABLES = ('scores', 'time_to_close')
+ROLLUP_TABLES = ('company_day', 'source_day', 'scores', 'time_to_close', 'funnel')
+OPEN_JOBS_TABLE = 'open_jobs'
+META_TABLE = 'meta'
+SCORE_BUCKET = 10
+# Upper bounds (days) of the time-to-close buckets; the last is open-ended
+CLOSE_BUCKETS = ((1, "0-1"), (7, "2-7"), (14, "8-14"), (30, "15-30"), (None, "31+"))
+FUNNEL_STATUSES = ('Saved', 'Applied', 'Interviewing', 'Offer', 'Rejected')
+
+
+def shard_of(job_id: str) -> str:
+    return hashlib.sha256(str(job_id).encode("utf-8")).hexdigest()[:2]
+
+
+def score_bucket(score) -> str:
+    value = min(max(float(score or 0), 0), 100)
+    low = min(int(value // SCORE_BUCKET) * SCORE_BUCKET, 100 - SCORE_BUCKET)
+    return f"{low}-{low + SCORE_BUCKET}"
+
+
+def job_bucket(job: Dict[str, Any]) -> str:
+    """
+    Bucket of the job's match score. The ranking score adds +1000 for applied
+    and +50 for fresh postings, which would pile those into the top bucket and
+    move jobs between buckets when freshness expires.
+    """
+    score = job.get('match_score')
+    return score_bucket(job.get('score') if score is None else score)
+
+
+def close_bucket(days: int) -> str:
+    for limit, label in CLOSE_BUCKETS:
+        if limit is None or days <= limit:
+            return label
+    return CLOSE_BUCKETS[-1][1]
+
+
+def _bump(table: Dict[str, Any], day: str, key: str, field: str, by: int = 1):
+    counts = table.setdefault(day, {}).setdefault(key or 'Unknown', {"new": 0, "closed": 0})
+    counts[field] += by
+
+
+class RollupStore:
+    """Rollup tables under data/rollups, updated from run deltas"""
+
+    def __init__(self, directory: str = os.path.join("data", "rollups")):
+        self.directory = directory
+
+    def path(self, table: str, part: Optional[str] = None) -> str:
+        if part is None:
+            return os.path.join(self.directory, f"{table}.json")
+        return os.path.join(self.directory, table, f"{part}.json")
+
+    def _read(self, path: str) -> Dict[str, Any]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, path: str, data: Dict[str, Any]) -> bool:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return write_if_changed(path, json.dumps(data, ensure_ascii=False, sort_keys=True))
+
+    def _parts(self, table: str) -> List[os.DirEntry]:
+        try:
+            return [e for e in os.scandir(os.path.join(self.directory, table)) if e.name.endswith(".json")]
+        except FileNotFoundError:
+            return []
+
+    def load(self, table: str) -> Dict[str, Any]:
+        """A whole table; day tables come back as {day: {...}}"""
+        if table in DAY_TABLES:
+            return {e.name[:-len(".json")]: self._read(e.path) for e in self._parts(table)}
+        return self._read(self.path(table))
+
+    def load_tables(self) -> Dict[str, Dict[str, Any]]:
+        """The page-facing tables (not the open-jobs state)"""
+        return {table: self.load(table) for table in ROLLUP_TABLES}
+
+    def versions(self) -> Tuple:
+        """(files, newest mtime_ns) per day table and (mtime_ns, size) per fixed table, for cache keys"""
+        signature = []
+        for table in ROLLUP_TABLES:
+            if table in DAY_TABLES:
+                parts = self._parts(table)
+                signature.append((len(parts), max((e.stat().st_mtime_ns for e in parts), default=0)))
+                continue
+            try:
+                stat = os.stat(self.path(table))
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def is_seeded(self) -> bool:
+        return bool(self._read(self.path(META_TABLE)).get('baseline'))
+
+    def seed(self, jobs: Iterable[Dict[str, Any]], today: Optional[date] = None) -> int:
+        """
+        First run: record the current jobs as open (and in the score
+        histogram) without counting them as new postings on the Trends page.
+        Returns how many jobs were recorded.
+        """
+        if self.is_seeded():
+            return 0
+        day = (today or datetime.now().date()).isoformat()
+        shards: Dict[str, Dict[str, Any]] = {}
+        scores = self.load('scores')
+        count = 0
+        for job in jobs:
+            job_id = str(job.get('id'))
+            shard = shards.setdefault(shard_of(job_id), {})
+            if job_id in shard:
+                continue
+            bucket = job_bucket(job)
+            shard[job_id] = [day, job.get('company') or 'Unknown', job.get('source') or 'Unknown', bucket]
+            scores[bucket] = scores.get(bucket, 0) + 1
+            count += 1
+        for name, shard in shards.items():
+            self._write(self.path(OPEN_JOBS_TABLE, name), shard)
+        self._write(self.path('scores'), scores)
+        self._write(self.path(META_TABLE), {'baseline': day, 'baseline_jobs': count})
+        logger.info(f"Rollups: seeded baseline of {count} open jobs")
+        return count
+
+    def apply(self, added: Iterable[Dict[str, Any]], removed: Iterable[Dict[str, Any]],
+              rescored: Iterable[Tuple[Dict[str, Any], Any]] = (),
+              tracking: Optional[Dict[str, Dict[str, Any]]] = None,
+              today: Optional[date] = None) -> Dict[str, int]:
+        """Fold one run's changes into the tables. Returns counts of what was applied."""
+        today = today or datetime.now().date()
+        day = today.isoformat()
+        shards: Dict[str, Dict[str, Any]] = {}
+
+        def open_shard(job_id: str) -> Dict[str, Any]:
+            name = shard_of(job_id)
+            if name not in shards:
+                shards[name] = self._read(self.path(OPEN_JOBS_TABLE, name))
+            return shards[name]
+
+        company_day = {day: self._read(self.path('company_day', day))}
+        source_day = {day: self._read(self.path('source_day', day))}
+        scores, ttc = self.load('scores'), self.load('time_to_close')
+        ttc.setdefault('buckets', {})
+        ttc.setdefault('by_company', {})
+        stats = {'added': 0, 'closed': 0, 'rescored': 0}
+
+        for job in added:
+            job_id = str(job.get('id'))
+            shard = open_shard(job_id)
+            if job_id in shard:
+                continue
+            bucket = job_bucket(job)
+            shard[job_id] = [day, job.get('company') or 'Unknown', job.get('source') or 'Unknown', bucket]
+            _bump(company_day, day, job.get('company'), 'new')
+            _bump(source_day, day, job.get('source'), 'new')
+            scores[bucket] = scores.get(bucket, 0) + 1
+            stats['added'] += 1
+
+        for job in removed:
+            job_id = str(job.get('id'))
+            entry = open_shard(job_id).pop(job_id, None)
+            if entry is None:
+                continue
+            first_seen, company, source, bucket = entry
+            _bump(company_day, day, company, 'closed')
+            _bump(source_day, day, source, 'closed')
+            scores[bucket] = max(0, scores.get(bucket, 0) - 1)
+            days = max(0, (today - date.fromisoformat(first_seen)).days)
+            label = close_bucket(days)
+            ttc['buckets'][label] = ttc['buckets'].get(label, 0) + 1
+            total, count = ttc['by_company'].get(company, [0, 0])
+            ttc['by_company'][company] = [total + days, count + 1]
+            stats['closed'] += 1
+
+        for job, _before in rescored:
+            job_id = str(job.get('id'))
+            entry = open_shard(job_id).get(job_id)
+            if entry is None:
+                continue
+            bucket = job_bucket(job)
+            if bucket != entry[3]:
+                scores[entry[3]] = max(0, scores.get(entry[3], 0) - 1)
+                scores[bucket] = scores.get(bucket, 0) + 1
+                entry[3] = bucket
+                stats['rescored'] += 1
+
+        if company_day[day]:
+            self._write(self.path('company_day', day), company_day[day])
+        if source_day[day]:
+            self._write(self.path('source_day', day), source_day[day])
+        if tracking is not None:
+            # Tracking records are few (one per job the user touched); today's file is overwritten
+            self._write(self.path('funnel', day), self.funnel_counts(tracking.values()))
+        self._write(self.path('scores'), scores)
+        self._write(self.path('time_to_close'), ttc)
+        for name, shard in shards.items():
+            self._write(self.path(OPEN_JOBS_TABLE, name), shard)
+        logger.info(f"Rollups: {stats['added']} new, {stats['closed']} closed, {stats['rescored']} re-bucketed")
+        return stats
+
+    @staticmethod
+    def funnel_counts(records: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        counts = {status: 0 for status in FUNNEL_STATUSES}
+        for record in records:
+            if record.get('saved'):
+                counts['Saved'] += 1
+            status = record.get('status')
+            if status in counts and status != 'Saved':
+                counts[status] += 1
+        return counts
+
+
+def daily_totals(day_table: Dict[str, Dict[str, Dict[str, int]]]) -> List[Dict[str, Any]]:
+    """[{day, new, closed}] summed over keys, oldest first"""
+    rows = []
+    for day in sorted(day_table):
+        counts = day_table[day].values()
+        rows.append({'day': day, 'new': sum(c.get('new', 0) for c in counts),
+                     'closed': sum(c.get('closed', 0) for c in counts)})
+    return rows
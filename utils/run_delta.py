@@ -0,0 +1,58 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+# Per-job fields remembered between runs to describe what changed
+TRACKED_FIELDS = ('title', 'company', 'url', 'score')
+# Fields the reports are rendered from. date_posted only counts when it came
+# from the source: a defaulted one is the scrape time and changes every run.
+FINGERPRINT_FIELDS = ('id', 'url', 'title', 'company', 'location', 'description_hash', 'score', 'status')
+
+
+def fingerprint_jobs(jobs: List[Dict[str, Any]]) -> str:
+    """Content fingerprint of the ranked job set (order matters)."""
+    h = hashlib.sha256()
+    for job in jobs:
+        fields = {k: job.get(k) for k in FINGERPRINT_FIELDS}
+        if not job.get('date_estimated'):
+            fields['date_posted'] = job.get('date_posted')
+        h.update(json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def job_index(jobs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Compact id -> tracked fields map persisted between runs."""
+    return {str(job.get('id')): {k: job.get(k) for k in TRACKED_FIELDS} for job in jobs}
+
+
+@dataclass
+class RunDelta:
+    """What changed between the previous run's job set and this one."""
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+    # (current job, previous score)
+    rescored: List[Tuple[Dict[str, Any], Any]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.rescored)
+
+
+def compute_delta(previous: Dict[str, Dict[str, Any]], jobs: List[Dict[str, Any]]) -> RunDelta:
+    """Diff the previous run's job index against the current ranked jobs."""
+    delta = RunDelta()
+    current_ids = set()
+    for job in jobs:
+        job_id = str(job.get('id'))
+        current_ids.add(job_id)
+        before = previous.get(job_id)
+        if before is None:
+            delta.added.append(job)
+        elif before.get('score') != job.get('score'):
+            delta.rescored.append((job, before.get('score')))
+    for job_id, before in previous.items():
+        if job_id not in current_ids:
+            delta.removed.append(dict(before, id=job_id))
+    return delta
@@ -5,6 +5,12 @@ from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+def clean_html(text: str) -> str:
+    """Basic HTML stripping and whitespace cleanup."""
+    if not text: return ""
+    clean = re.sub('<[^<]+?>', '', text)
+    return clean.replace('\n', ' ').strip()
+
 @dataclass
 class JobListing:
     id: str
@@ -14,9 +20,14 @@ class JobListing:
     location: Optional[str] = "Remote"
     description: Optional[str] = ""
     date_posted: Optional[str] = ""
+    # True when date_posted is the scrape time because the source had no date
+    date_estimated: bool = False
     source: Optional[str] = "Unknown"
     score: float = 0.0
+    # score without the freshness / applied ranking boosts
+    match_score: Optional[float] = None
     match_reason: Optional[str] = ""
+    description_hash: Optional[str] = ""
     raw_data: Dict[str, Any] = field(default_factory=dict)
     
     @classmethod
@@ -38,20 +49,21 @@ class JobListing:
             return False
         return True
         
-    def sanitize(self):
-        """Clean up whitespace and remove HTML tags from critical fields."""
-        def clean_html(text: str) -> str:
-            if not text: return ""
-            # Basic HTML stripping
-            clean = re.sub('<[^<]+?>', '', text)
-            return clean.replace('\n', ' ').strip()
+    def sanitize(self, store=None):
+        """Clean up whitespace and remove HTML tags from critical fields.
 
+        If a DescriptionStore is given, the description is interned there and
+        only sanitized when its hash has not been seen before.
+        """
         self.title = clean_html(self.title)
         self.company = clean_html(self.company)
         self.location = clean_html(self.location) if self.location else "Remote"
         
         if self.description:
-            self.description = clean_html(self.description)
+            if store is not None:
+                self.description_hash, self.description = store.intern(self.description, clean_html)
+            else:
+                self.description = clean_html(self.description)
             
         return self
 
@@ -0,0 +1,133 @@
+import bisect
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Keeps tech tokens like "c++", "c#", "node.js" intact
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it",
+    "of", "on", "or", "our", "the", "to", "we", "with", "you", "your", "will", "this", "that",
+})
+
+# Recently used prefix terms kept per index (keystroke reruns repeat them)
+TERM_CACHE_SIZE = 256
+# Prefix matches over more tokens than this are merged through a bitmap
+SMALL_UNION = 8
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords (duplicates kept, order preserved)."""
+    if not text:
+        return []
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        token = token.rstrip(".")
+        if token and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def build_inverted_index(docs: Iterable[Tuple[int, str]]) -> Dict[str, List[int]]:
+    """token -> sorted list of doc numbers, from (doc number, text) pairs."""
+    postings: Dict[str, set] = {}
+    for doc_id, text in docs:
+        for token in set(tokenize(text)):
+            postings.setdefault(token, set()).add(doc_id)
+    return {token: sorted(ids) for token, ids in sorted(postings.items())}
+
+
+class SearchIndex:
+    """
+    In-memory inverted index with prefix matching, AND/OR queries and
+    score ranking.
+
+    Doc numbers are assigned in descending score order, so a sorted list of
+    matching doc numbers is already ranked. Query syntax: terms are ANDed,
+    an uppercase ``OR`` separates alternatives, every term matches as a prefix:
+    ``react OR vue intern`` -> react* OR (vue* AND intern*).
+    """
+
+    def __init__(self, ids: List[str], scores: List[float], postings: Dict[str, List[int]]):
+        self.ids = ids
+        self.scores = scores
+        self.tokens = sorted(postings)
+        self.postings = postings
+        # Array form for fast unions/intersections, built on the first query. Building
+        # and saving the index (the scraper's report step) must not need numpy.
+        self._arrays: Optional[Dict[str, "np.ndarray"]] = None
+        self._term_cache: Dict[str, "np.ndarray"] = {}
+
+    @classmethod
+    def build(cls, docs: Iterable[Tuple[str, str, float]]) -> "SearchIndex":
+        """Build from (job id, searchable text, score) triples."""
+        ranked = sorted(docs, key=lambda d: d[2] or 0, reverse=True)
+        postings = build_inverted_index((n, text) for n, (_, text, _) in enumerate(ranked))
+        return cls([str(d[0]) for d in ranked], [d[2] or 0 for d in ranked], postings)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'ids': self.ids, 'scores': self.scores, 'index': self.postings}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchIndex":
+        return cls(data.get('ids', []), data.get('scores', []), data.get('index', {}))
+
+    @classmethod
+    def load(cls, path: str) -> "SearchIndex":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def _prefix_docs(self, term: str) -> "np.ndarray":
+        """Sorted unique doc numbers of every token starting with term."""
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = {token: np.asarray(docs, dtype=np.int32) for token, docs in self.postings.items()}
+        docs = self._term_cache.get(term)
+        if docs is None:
+            start = bisect.bisect_left(self.tokens, term)
+            end = bisect.bisect_left(self.tokens, term + '\uffff', lo=start)
+            arrays = [self._arrays[token] for token in self.tokens[start:end]]
+            if not arrays:
+                docs = np.empty(0, dtype=np.int32)
+            elif len(arrays) == 1:
+                docs = arrays[0]
+            elif len(arrays) <= SMALL_UNION:
+                docs = np.unique(np.concatenate(arrays))
+            else:
+                # Broad prefix: mark a bitmap instead of sorting every posting
+                bitmap = np.zeros(len(self.ids), dtype=bool)
+                for array in arrays:
+                    bitmap[array] = True
+                docs = np.flatnonzero(bitmap).astype(np.int32)
+            if len(self._term_cache) >= TERM_CACHE_SIZE:
+                self._term_cache.clear()
+            self._term_cache[term] = docs
+        return docs
+
+    def search_docs(self, query: str) -> List[int]:
+        """Matching doc numbers, best score first."""
+        import numpy as np
+
+        groups = []
+        for group in re.split(r'\s+OR\s+', query.strip()):
+            terms = tokenize(group)
+            if not terms:
+                continue
+            # Rarest term first keeps intersections small
+            arrays = sorted((self._prefix_docs(t) for t in terms), key=len)
+            matched = arrays[0]
+            for docs in arrays[1:]:
+                if not len(matched):
+                    break
+                matched = np.intersect1d(matched, docs, assume_unique=True)
+            groups.append(matched)
+        if not groups:
+            return []
+        result = groups[0] if len(groups) == 1 else np.unique(np.concatenate(groups))
+        return result.tolist()
+
+    def search(self, query: str) -> List[str]:
+        """Matching job ids, best score first."""
+        return [self.ids[n] for n in self.search_docs(query)]
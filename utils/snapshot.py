@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Fields that change run-to-run without the posting changing (plus
+# date_posted when it was defaulted to the scrape time, see split_job)
+VOLATILE_FIELDS = ('score', 'match_score')
+FRESH_PREFIX = "🔥 "
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Atomically write content unless the file already holds exactly that. Returns True if written."""
+    encoded = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == encoded:
+                return False
+    except FileNotFoundError:
+        pass
+
+    temp_dir = os.path.dirname(path) or "."
+    os.makedirs(temp_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=temp_dir, delete=False) as tf:
+        tf.write(encoded)
+        temp_name = tf.name
+        tf.flush()
+        os.fsync(tf.fileno())
+    os.replace(temp_name, path)
+    return True
+
+
+def split_job(job: Dict[str, Any]):
+    """Split a job record into its stable part and its volatile part."""
+    volatile_fields = VOLATILE_FIELDS + ('date_posted',) if job.get('date_estimated') else VOLATILE_FIELDS
+    stable = {k: v for k, v in job.items() if k not in volatile_fields}
+    volatile = {k: job[k] for k in volatile_fields if job.get(k) is not None}
+    title = stable.get('title') or ''
+    if title.startswith(FRESH_PREFIX):
+        stable['title'] = title[len(FRESH_PREFIX):]
+        volatile['fresh'] = True
+    return stable, volatile
+
+
+def render_snapshot(jobs: List[Dict[str, Any]]) -> str:
+    """One job per line, sorted by id, keys sorted: diffs are per changed posting."""
+    lines = []
+    for job in sorted(jobs, key=lambda j: str(j.get('id'))):
+        stable, _ = split_job(job)
+        lines.append(json.dumps(stable, sort_keys=True, ensure_ascii=False, separators=(',', ':')))
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def render_volatile(jobs: List[Dict[str, Any]]) -> str:
+    """
+    Small side file with per-run fields (score, freshness, scrape-time dates),
+    one id per line. No run timestamp, so an unchanged run leaves it untouched.
+    """
+    volatile = {str(job.get('id')): split_job(job)[1] for job in jobs}
+    lines = ["{", '  "jobs": {']
+    items = sorted(volatile.items())
+    for idx, (job_id, fields) in enumerate(items):
+        sep = "," if idx < len(items) - 1 else ""
+        lines.append(f"    {json.dumps(job_id, ensure_ascii=False)}: "
+                     f"{json.dumps(fields, sort_keys=True, ensure_ascii=False)}{sep}")
+    lines.extend(["  }", "}"])
+    return "\n".join(lines) + "\n"
+
+
+def read_snapshot(snapshot_path: str, volatile_path: str) -> List[Dict[str, Any]]:
+    """Rebuild the ranked job list (score order) from a snapshot + volatile pair."""
+    try:
+        with open(volatile_path, 'r', encoding='utf-8') as f:
+            volatile = json.load(f).get('jobs', {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        volatile = {}
+
+    jobs = []
+    with open(snapshot_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            extra = dict(volatile.get(str(job.get('id')), {}))
+            if extra.pop('fresh', False):
+                job['title'] = FRESH_PREFIX + job.get('title', '')
+            job.update(extra)
+            jobs.append(job)
+    jobs.sort(key=lambda j: j.get('score', 0), reverse=True)
+    return jobs
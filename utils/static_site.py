@@ -0,0 +1,280 @@
+"""
+Static HTML job browser: index.html plus precomputed JSON under data/.
+
+- manifest.json: companies, their shard files and the search index file
+- jobs-<company>-<page>.<hash>.json: one page of a company's jobs
+- search.<hash>.json: inverted index (token -> doc numbers) plus per-doc
+  (shard, offset, score) so the browser only fetches shards it displays
+
+Shard and index names carry a content hash, so unchanged files are left
+alone between runs and can be cached forever by the browser.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.search_index import STOPWORDS, build_inverted_index
+from utils.snapshot import write_if_changed
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+SNIPPET_CHARS = 300
+SHARD_FIELDS = ('id', 'title', 'company', 'location', 'url', 'score', 'date_posted', 'source')
+
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+_TAG_RE = re.compile('<[^<]+?>')
+
+
+def slugify(name: str) -> str:
+    return _SLUG_RE.sub('-', (name or 'unknown').lower()).strip('-') or 'unknown'
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+def _hashed_name(prefix: str, content: str) -> str:
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=6).hexdigest()
+    return f"{prefix}.{digest}.json"
+
+
+class StaticSiteBuilder:
+    """Writes the static job browser into site_dir"""
+
+    def __init__(self, site_dir: str, describe: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 page_size: int = PAGE_SIZE):
+        self.site_dir = site_dir
+        self.data_dir = os.path.join(site_dir, 'data')
+        # Returns the full plain description of a job (e.g. via DescriptionStore)
+        self.describe = describe or (lambda job: job.get('description') or '')
+        self.page_size = page_size
+
+    def _write_hashed(self, prefix: str, payload: Any, written: List[str]) -> str:
+        content = _dumps(payload)
+        name = _hashed_name(prefix, content)
+        # Atomic, and compared by content rather than existence: a file left
+        # truncated by a crashed run is rewritten instead of cached forever
+        if write_if_changed(os.path.join(self.data_dir, name), content):
+            written.append(name)
+        return name
+
+    def build(self, jobs: List[Dict[str, Any]], generated_at: str) -> Dict[str, Any]:
+        """Build the site. Returns stats: shards, written, removed."""
+        os.makedirs(self.data_dir, exist_ok=True)
+
+        by_company: Dict[str, List[Dict[str, Any]]] = {}
+        for job in jobs:
+            by_company.setdefault(job.get('company') or 'Unknown', []).append(job)
+
+        written: List[str] = []
+        shards: List[str] = []
+        companies = []
+        docs = []  # doc number -> [shard index, offset, score]
+        texts = []  # (doc number, searchable text)
+
+        for company in sorted(by_company):
+            company_jobs = by_company[company]
+            slug = slugify(company)
+            company_shards = []
+            for page_start in range(0, len(company_jobs), self.page_size):
+                page_jobs = company_jobs[page_start:page_start + self.page_size]
+                rows = []
+                for offset, job in enumerate(page_jobs):
+                    description = _TAG_RE.sub('', self.describe(job) or '')
+                    row = {k: job.get(k) for k in SHARD_FIELDS}
+                    row['snippet'] = ' '.join(description[:SNIPPET_CHARS].split())
+                    rows.append(row)
+                    docs.append([len(shards), offset, job.get('score', 0) or 0])
+                    texts.append((len(docs) - 1, ' '.join(
+                        str(job.get(k) or '') for k in ('title', 'company', 'location')) + ' ' + description))
+                page = page_start // self.page_size
+                name = self._write_hashed(f"jobs-{slug}-{page}", {'company': company, 'page': page, 'jobs': rows},
+                                          written)
+                shards.append(name)
+                company_shards.append(len(shards) - 1)
+            companies.append({'name': company, 'count': len(company_jobs), 'shards': company_shards})
+
+        search_payload = {'docs': docs, 'index': build_inverted_index(texts), 'stopwords': sorted(STOPWORDS)}
+        search_name = self._write_hashed('search', search_payload, written)
+
+        manifest = {
+            'generated_at': generated_at,
+            'total_jobs': len(jobs),
+            'page_size': self.page_size,
+            'companies': companies,
+            'shards': shards,
+            'search': search_name,
+        }
+        write_if_changed(os.path.join(self.data_dir, 'manifest.json'), _dumps(manifest))
+        index_file = os.path.join(self.site_dir, 'index.html')
+        write_if_changed(index_file, INDEX_HTML)
+
+        # Drop shards no longer referenced by the manifest
+        live = set(shards) | {search_name, 'manifest.json'}
+        removed = 0
+        for name in os.listdir(self.data_dir):
+            if name.endswith('.json') and name not in live:
+                os.remove(os.path.join(self.data_dir, name))
+                removed += 1
+
+        logger.info(f"Static site: {len(shards)} shards, {len(written)} written, {removed} removed")
+        return {'index': index_file, 'shards': len(shards), 'written': len(written), 'removed': removed}
+
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Job Browser</title>
+<style>
+body { font-family: system-ui, sans-serif; margin: 0 auto; max-width: 1100px; padding: 1rem; }
+header { display: flex; gap: .5rem; flex-wrap: wrap; align-items: center; }
+input, select, button { font-size: 1rem; padding: .3rem .5rem; }
+#q { flex: 1; min-width: 240px; }
+table { border-collapse: collapse; width: 100%; margin-top: 1rem; }
+th, td { text-align: left; padding: .4rem; border-bottom: 1px solid #ddd; vertical-align: top; }
+td.snippet { color: #555; font-size: .85rem; }
+#pager { margin-top: 1rem; display: flex; gap: .5rem; align-items: center; }
+</style>
+</head>
+<body>
+<h1>Job Browser</h1>
+<header>
+  <input id="q" type="search" placeholder="Search title, company, location, description">
+  <select id="company"><option value="">All companies</option></select>
+  <span id="stats"></span>
+</header>
+<table>
+  <thead><tr><th>Score</th><th>Title</th><th>Company</th><th>Location</th><th>Posted</th></tr></thead>
+  <tbody id="rows"></tbody>
+</table>
+<div id="pager"><button id="prev">&laquo; Prev</button><span id="page"></span><button id="next">Next &raquo;</button></div>
+<script>
+(function () {
+  var PER_PAGE = 50;
+  var manifest, search, page = 0, results = [];
+  var shardCache = {};
+  var $ = function (id) { return document.getElementById(id); };
+
+  function getJSON(name) {
+    return fetch('data/' + name).then(function (r) { return r.json(); });
+  }
+  function shard(i) {
+    if (!shardCache[i]) { shardCache[i] = getJSON(manifest.shards[i]); }
+    return shardCache[i];
+  }
+  function tokenize(text) {
+    return (text.toLowerCase().match(/[a-z0-9][a-z0-9+#.]*/g) || [])
+      .map(function (t) { return t.replace(/\\.+$/, ''); })
+      .filter(function (t) { return t.length > 0 && search.stopwords.indexOf(t) < 0; });
+  }
+  function intersect(a, b) {
+    var out = [], i = 0, j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] === b[j]) { out.push(a[i]); i++; j++; }
+      else if (a[i] < b[j]) { i++; } else { j++; }
+    }
+    return out;
+  }
+  function prefixPostings(token) {
+    // Prefix match so results update while typing
+    var seen = {}, out = [];
+    Object.keys(search.index).forEach(function (key) {
+      if (key.lastIndexOf(token, 0) === 0) {
+        search.index[key].forEach(function (d) { if (!seen[d]) { seen[d] = true; out.push(d); } });
+      }
+    });
+    return out.sort(function (a, b) { return a - b; });
+  }
+  function allowedDocs() {
+    var company = $('company').value;
+    if (!company) { return null; }
+    var allowed = {};
+    manifest.companies.forEach(function (c) {
+      if (c.name !== company) { return; }
+      search.docs.forEach(function (d, n) { if (c.shards.indexOf(d[0]) >= 0) { allowed[n] = true; } });
+    });
+    return allowed;
+  }
+  function runQuery() {
+    var tokens = tokenize($('q').value);
+    var docs;
+    if (tokens.length) {
+      docs = tokens.map(prefixPostings).reduce(intersect);
+    } else {
+      docs = search.docs.map(function (_, n) { return n; });
+    }
+    var allowed = allowedDocs();
+    if (allowed) { docs = docs.filter(function (n) { return allowed[n]; }); }
+    results = docs.sort(function (a, b) { return search.docs[b][2] - search.docs[a][2] || a - b; });
+    page = 0;
+    render();
+  }
+  function cell(text) {
+    var td = document.createElement('td');
+    td.textContent = text == null ? '' : text;
+    return td;
+  }
+  function render() {
+    var pages = Math.max(1, Math.ceil(results.length / PER_PAGE));
+    var slice = results.slice(page * PER_PAGE, (page + 1) * PER_PAGE);
+    $('stats').textContent = results.length + ' of ' + manifest.total_jobs + ' jobs';
+    $('page').textContent = 'Page ' + (page + 1) + ' / ' + pages;
+    $('prev').disabled = page === 0;
+    $('next').disabled = page >= pages - 1;
+    var needed = {};
+    slice.forEach(function (n) { needed[search.docs[n][0]] = true; });
+    Promise.all(Object.keys(needed).map(function (i) {
+      return shard(+i).then(function (s) { needed[i] = s; });
+    })).then(function () {
+      var body = $('rows');
+      body.innerHTML = '';
+      slice.forEach(function (n) {
+        var d = search.docs[n], job = needed[d[0]].jobs[d[1]];
+        var tr = document.createElement('tr');
+        tr.appendChild(cell(Number(job.score || 0).toFixed(1)));
+        var title = document.createElement('td');
+        var a = document.createElement('a');
+        a.href = job.url; a.target = '_blank'; a.rel = 'noopener'; a.textContent = job.title;
+        title.appendChild(a);
+        tr.appendChild(title);
+        tr.appendChild(cell(job.company));
+        tr.appendChild(cell(job.location));
+        tr.appendChild(cell((job.date_posted || '').slice(0, 10)));
+        body.appendChild(tr);
+        if (job.snippet) {
+          var sr = document.createElement('tr'), sd = cell(job.snippet);
+          sd.colSpan = 5; sd.className = 'snippet';
+          sr.appendChild(sd);
+          body.appendChild(sr);
+        }
+      });
+    });
+  }
+
+  getJSON('manifest.json').then(function (m) {
+    manifest = m;
+    manifest.companies.forEach(function (c) {
+      var opt = document.createElement('option');
+      opt.value = c.name; opt.textContent = c.name + ' (' + c.count + ')';
+      $('company').appendChild(opt);
+    });
+    return getJSON(m.search);
+  }).then(function (s) {
+    search = s;
+    $('q').addEventListener('input', runQuery);
+    $('company').addEventListener('change', runQuery);
+    $('prev').addEventListener('click', function () { page--; render(); });
+    $('next').addEventListener('click', function () { page++; render(); });
+    runQuery();
+  });
+})();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,360 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# Statuses that imply the application was submitted
+APPLIED_STATUSES = ('Applied', 'Interviewing', 'Offer')
+
+# Query params that never identify a posting
+_TRACKING_PARAMS = {'gh_src', 'lever-source', 'lever-origin', 'source', 'src', 'ref', 'referrer'}
+
+# Job fields kept on applied records so closed postings can be resurrected
+JOB_SNAPSHOT_FIELDS = ('title', 'company', 'location', 'url', 'score', 'date_posted',
+                       'source', 'description_hash')
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a posting URL for lookups (case, fragment, tracking params, trailing slash)."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith('utm_')
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        urlencode(query),
+        ''
+    ))
+
+
+def job_snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Minimal copy of a job record with display prefixes stripped."""
+    snap = {k: job[k] for k in JOB_SNAPSHOT_FIELDS if k in job}
+    if 'title' in snap:
+        snap['title'] = snap['title'].replace("🔥 ", "").replace("✅ ", "").replace(" (Closed)", "")
+    return snap
+
+
+class TrackingStore:
+    """
+    Journaled store for per-job user state: saved / status / CV fields and
+    applied records. Single source of truth for the dashboard, the CV editor,
+    mark_applied.py and the processor.
+
+    data/tracking.json stays the compacted snapshot (same format as before).
+    Every change is appended as one JSON line to tracking.journal.jsonl and
+    replayed on top of the snapshot to build the in-memory view. Writers hold
+    an exclusive lock on tracking.lock, so the dashboard, the CV editor and CLI
+    scripts can write at the same time without losing updates. Journal entries
+    only ever *set* fields, so replaying one twice is harmless.
+
+    Records are indexed by job id (the view itself) and by canonical URL. The
+    legacy data/applied_jobs.json is folded in read-only (fields it carries are
+    only filled in where missing) and persisted on the next compaction.
+    """
+
+    COMPACT_EVERY = 200
+
+    def __init__(self, path: str, compact_every: int = COMPACT_EVERY,
+                 legacy_applied_path: Optional[str] = None):
+        self.path = path
+        base = os.path.splitext(path)[0]
+        self.journal_path = f"{base}.journal.jsonl"
+        self.lock_path = f"{base}.lock"
+        self.compact_every = compact_every
+        if legacy_applied_path is None:
+            legacy_applied_path = os.path.join(os.path.dirname(path), "applied_jobs.json")
+        self.legacy_applied_path = legacy_applied_path
+
+        self._mutex = threading.RLock()
+        self._view: Dict[str, Dict[str, Any]] = {}
+        self._url_index: Dict[str, str] = {}
+        self._legacy: Dict[str, Dict[str, Any]] = {}
+        self._legacy_sig = None
+        self._applied_cache = (None, [])
+        self._snapshot_sig = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        # Bumped whenever the materialized view changes; cheap cache key for readers
+        self.version = 0
+
+    # --- Locking ---
+    @contextmanager
+    def _file_lock(self, shared: bool = False):
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        with open(self.lock_path, "a+") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    @staticmethod
+    def _signature(path: str):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    # --- Reading ---
+    def _reload_snapshot(self):
+        data = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                logger.error(f"Corrupt tracking snapshot {self.path}: {e}")
+        self._view = data if isinstance(data, dict) else {}
+        self._snapshot_sig = self._signature(self.path)
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._url_index = {}
+        for job_id, record in self._view.items():
+            self._index_record(job_id, record)
+        self._merge_legacy()
+        self.version += 1
+
+    def _index_record(self, job_id: str, record: Dict[str, Any]):
+        url = record.get('url') or record.get('job', {}).get('url')
+        if url:
+            self._url_index[canonical_url(url)] = job_id
+
+    def _apply_changes(self, changes: Dict[str, Dict[str, Any]]):
+        for job_id, fields in changes.items():
+            record = self._view.setdefault(job_id, {})
+            record.update(fields)
+            if 'url' in fields or 'job' in fields:
+                self._index_record(job_id, record)
+
+    def _reload_legacy(self):
+        """Re-read applied_jobs.json only when its mtime/size changed."""
+        sig = self._signature(self.legacy_applied_path)
+        if sig == self._legacy_sig:
+            return False
+        self._legacy_sig = sig
+        self._legacy = {}
+        if sig is not None:
+            try:
+                with open(self.legacy_applied_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                for job in data if isinstance(data, list) else []:
+                    self._legacy[job['id']] = job
+            except Exception as e:
+                logger.error(f"Error loading legacy applied jobs: {e}")
+        return True
+
+    def _merge_legacy(self):
+        for job_id, job in self._legacy.items():
+            record = self._view.setdefault(job_id, {})
+            record.setdefault('status', 'Applied')
+            record.setdefault('saved', True)
+            if job.get('applied_at'):
+                record.setdefault('applied_at', job['applied_at'])
+            record.setdefault('job', job_snapshot(job))
+            self._index_record(job_id, record)
+
+    def _read_journal(self):
+        try:
+            size = os.path.getsize(self.journal_path)
+        except FileNotFoundError:
+            size = 0
+        if size < self._journal_offset:
+            # Journal was compacted by another process after our snapshot read
+            self._reload_snapshot()
+        if size == self._journal_offset:
+            return
+
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            chunk = f.read(size - self._journal_offset)
+
+        # Only consume complete lines; a partial trailing line is still being written
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                self._apply_changes(entry.get("changes", {}))
+                self._journal_entries += 1
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed tracking journal line")
+        self._journal_offset += end
+        self.version += 1
+
+    def refresh(self):
+        """Bring the in-memory view up to date with other writers."""
+        with self._mutex:
+            with self._file_lock(shared=True):
+                self._sync_locked()
+
+    def _sync_locked(self):
+        if self._signature(self.path) != self._snapshot_sig:
+            self._reload_legacy()
+            self._reload_snapshot()
+        elif self._reload_legacy():
+            self._merge_legacy()
+            self.version += 1
+        self._read_journal()
+
+    @staticmethod
+    def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy deep enough that callers can't edit the view (records nest only the job snapshot)"""
+        copy = dict(record)
+        if isinstance(copy.get('job'), dict):
+            copy['job'] = dict(copy['job'])
+        return copy
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of the current materialized view. Write with apply()."""
+        with self._mutex:
+            self.refresh()
+            return {job_id: self._copy_record(record) for job_id, record in self._view.items()}
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        """Copy of one job's record ({} if unknown)"""
+        with self._mutex:
+            self.refresh()
+            record = self._view.get(job_id)
+            return self._copy_record(record) if record is not None else {}
+
+    # --- Writing ---
+    def apply(self, changes: Dict[str, Dict[str, Any]]):
+        """Append one journal entry setting fields on one or more jobs."""
+        if not changes:
+            return
+        entry = {"ts": datetime.now().isoformat(), "changes": changes}
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+        with self._mutex:
+            with self._file_lock():
+                self._sync_locked()
+
+                fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+                self._apply_changes(changes)
+                self._journal_offset += len(line)
+                self._journal_entries += 1
+                self.version += 1
+
+                if self._journal_entries >= self.compact_every:
+                    self._compact_locked()
+
+    def update(self, job_id: str, **fields):
+        self.apply({job_id: fields})
+
+    def bulk_update(self, changes: Dict[str, Dict[str, Any]]):
+        """Set fields on many jobs in a single journal entry."""
+        self.apply(changes)
+
+    # --- Lookups ---
+    def find(self, identifier: str) -> Optional[str]:
+        """Resolve a job id or posting URL to a known job id in O(1)."""
+        with self._mutex:
+            self.refresh()
+            if identifier in self._view:
+                return identifier
+            return self._url_index.get(canonical_url(identifier))
+
+    @staticmethod
+    def is_applied(record: Dict[str, Any]) -> bool:
+        """An explicit status wins: a job moved on to Rejected/Hidden keeps its applied_at but is no longer applied"""
+        status = record.get('status')
+        if status:
+            return status in APPLIED_STATUSES
+        return bool(record.get('applied_at') or record.get('date_applied'))
+
+    def applied_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Applied records as job dicts ({'id', 'applied_at', ...snapshot}),
+        recomputed only when the view version changes.
+        """
+        with self._mutex:
+            self.refresh()
+            version, cached = self._applied_cache
+            if version == self.version:
+                return cached
+            applied = []
+            for job_id, record in self._view.items():
+                if self.is_applied(record):
+                    job = dict(record.get('job', {}))
+                    job['id'] = job_id
+                    job['applied_at'] = record.get('applied_at') or record.get('date_applied')
+                    applied.append(job)
+            self._applied_cache = (self.version, applied)
+            return applied
+
+    def compact(self):
+        """Fold the journal into the snapshot and truncate it."""
+        with self._mutex:
+            with self._file_lock():
+                self._sync_locked()
+                self._compact_locked()
+
+    def _compact_locked(self):
+        temp_dir = os.path.dirname(self.path) or "."
+        os.makedirs(temp_dir, exist_ok=True)
+        temp_name: Optional[str] = None
+        try:
+            with tempfile.NamedTemporaryFile("w", dir=temp_dir, delete=False, encoding="utf-8") as tf:
+                temp_name = tf.name
+                json.dump(self._view, tf, indent=2)
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(temp_name, self.path)
+        except Exception as e:
+            logger.error(f"Error compacting tracking journal: {e}")
+            if temp_name and os.path.exists(temp_name):
+                os.remove(temp_name)
+            return
+
+        # Snapshot now contains everything; start a fresh journal
+        open(self.journal_path, "w").close()
+        self._snapshot_sig = self._signature(self.path)
+        self._journal_offset = 0
+        self._journal_entries = 0
+        logger.info(f"Compacted tracking journal into {self.path}")
+
+
+_open_stores: Dict[str, TrackingStore] = {}
+
+
+def open_tracking_store(path: str = os.path.join("data", "tracking.json")) -> TrackingStore:
+    """Process-wide store per path, so repeated runs reuse the cached view."""
+    key = os.path.abspath(path)
+    if key not in _open_stores:
+        _open_stores[key] = TrackingStore(path)
+    return _open_stores[key]
@@ -0,0 +1,188 @@
+"""
+Precomputed row bitsets for the dashboard views.
+
+Built once per jobs data version from the tracking-free prepared frame.
+Tracking changes only touch the rows whose record changed; the Feed,
+Shortlist, Tracking and All views, the sidebar facet counts and the
+default ordering are all answered from the bitsets.
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.job_frame import STATUS_PRIORITY, display_titles, tracking_fields
+
+VIEWS = ("Feed", "Shortlist", "Tracking", "All")
+SHORTLIST_STATUSES = ('New', 'Saved')
+TRACKING_STATUSES = ('Applied', 'Interviewing', 'Offer')
+# Table sort modes; "Default" is the precomputed priority order
+SORT_MODES = ("Default", "Score", "Newest", "Company")
+
+
+class ViewIndex:
+    """Per-status, per-saved and per-company row bitsets over a fixed job frame"""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        n = len(frame)
+        self.size = n
+        self.ids: List[str] = frame['id'].astype(str).tolist() if n else []
+        self.row_of = {job_id: row for row, job_id in enumerate(self.ids)}
+
+        # Tracking-derived per-row state
+        self.status = np.full(n, 'New', dtype=object)
+        self.saved = np.zeros(n, dtype=bool)
+        self.cv_status = np.full(n, 'Generic', dtype=object)
+        self.resume = np.full(n, '', dtype=object)
+        self.status_bits: Dict[str, np.ndarray] = {'New': np.ones(n, dtype=bool)}
+
+        self.company_bits: Dict[str, np.ndarray] = {}
+        self._company_code = np.zeros(n, dtype=int)
+        if n:
+            codes, companies = pd.factorize(frame['company'].astype(object), sort=True)
+            self._company_code = codes
+            for code, company in enumerate(companies):
+                self.company_bits[company] = codes == code
+        self.score = pd.to_numeric(frame['score'], errors='coerce').fillna(0).to_numpy(float) if n else np.zeros(0)
+
+        # Sort keys for the default order: status priority, saved, date_posted, score (all desc)
+        self._prio = np.ones(n)
+        if n and 'date_posted' in frame.columns:
+            self._date_rank, _ = pd.factorize(frame['date_posted'], sort=True)  # missing -> -1, sorts last
+        else:
+            self._date_rank = np.zeros(n, dtype=int)
+        self._order: Optional[np.ndarray] = None
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self.tracking_version = None
+        self._lock = threading.Lock()
+
+    # --- Tracking sync ---
+    def sync_tracking(self, tracking: Dict[str, Dict[str, Any]], version=None) -> int:
+        """Update the rows whose tracking record changed. Returns rows touched."""
+        with self._lock:
+            if version is not None and version == self.tracking_version:
+                return 0
+            touched = [job_id for job_id, record in tracking.items() if self._records.get(job_id) != record]
+            touched += [job_id for job_id in self._records if job_id not in tracking]
+            updated = 0
+            for job_id in touched:
+                record = tracking.get(job_id)
+                if record is None:
+                    self._records.pop(job_id, None)
+                else:
+                    self._records[job_id] = dict(record)
+                row = self.row_of.get(job_id)
+                if row is not None:
+                    self._set_row(row, tracking_fields(record or {}))
+                    updated += 1
+            self.tracking_version = version
+            return updated
+
+    def _set_row(self, row: int, fields):
+        status, saved, cv_status, resume = fields
+        old_status = self.status[row]
+        if status != old_status:
+            self.status_bits[old_status][row] = False
+            if status not in self.status_bits:
+                self.status_bits[status] = np.zeros(self.size, dtype=bool)
+            self.status_bits[status][row] = True
+            self.status[row] = status
+        if saved != self.saved[row] or status != old_status:
+            self._order = None
+        self.saved[row] = saved
+        self.cv_status[row] = cv_status
+        self.resume[row] = resume
+        self._prio[row] = STATUS_PRIORITY.get(status, 1)
+
+    # --- Queries ---
+    def _bits(self, status: str) -> np.ndarray:
+        bits = self.status_bits.get(status)
+        return bits if bits is not None else np.zeros(self.size, dtype=bool)
+
+    def statuses_mask(self, statuses: Iterable[str]) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        for status in statuses:
+            mask |= self._bits(status)
+        return mask
+
+    def view_mask(self, view: str, hide_rejected: bool = True, hide_hidden: bool = True) -> np.ndarray:
+        """Row mask of a main view (see the dashboard's 'Inbox Zero' flow)"""
+        with self._lock:
+            if view == "Feed":
+                # New and not saved (New already excludes Rejected/Hidden)
+                return self._bits('New') & ~self.saved
+            if view == "Shortlist":
+                return self.saved & self.statuses_mask(SHORTLIST_STATUSES)
+            if view == "Tracking":
+                return self.statuses_mask(TRACKING_STATUSES)
+            mask = np.ones(self.size, dtype=bool)
+            if hide_rejected:
+                mask &= ~self._bits('Rejected')
+            if hide_hidden:
+                mask &= ~self._bits('Hidden')
+            return mask
+
+    def company_mask(self, company: str) -> np.ndarray:
+        bits = self.company_bits.get(company)
+        return bits if bits is not None else np.zeros(self.size, dtype=bool)
+
+    def rows_for_ids(self, ids: Iterable[str]) -> np.ndarray:
+        """Row positions of the given job ids, in the given order (unknown ids skipped)."""
+        row_of = self.row_of
+        return np.fromiter((row_of[i] for i in ids if i in row_of), dtype=np.intp)
+
+    def ordered(self, mask: np.ndarray) -> np.ndarray:
+        """Row positions selected by mask, in the precomputed default order."""
+        with self._lock:
+            if self._order is None:
+                # lexsort: last key is primary; negate for descending
+                self._order = np.lexsort((-self.score, -self._date_rank, -self.saved.astype(int), -self._prio))
+            order = self._order
+        return order[mask[order]]
+
+    def sort_rows(self, rows: np.ndarray, mode: str) -> np.ndarray:
+        """Re-sort selected rows by a table sort mode (stable, so ties keep the incoming order)."""
+        if mode == "Score":
+            keys = -self.score[rows]
+        elif mode == "Newest":
+            keys = -self._date_rank[rows]
+        elif mode == "Company":
+            keys = self._company_code[rows]
+        else:
+            return rows
+        return rows[np.argsort(keys, kind='stable')]
+
+    def facet_counts(self) -> Dict[str, int]:
+        """Sidebar metrics from the bitsets"""
+        with self._lock:
+            return {
+                'total': self.size,
+                'companies': len(self.company_bits),
+                'saved': int(self.saved.sum()),
+                'applied': int(self._bits('Applied').sum()),
+                'interviewing': int(self._bits('Interviewing').sum()),
+                'offers': int(self._bits('Offer').sum()),
+                'rejected': int(self._bits('Rejected').sum()),
+                'saved_unapplied': int((self.saved & ~self._bits('Applied')).sum()),
+            }
+
+    def materialize(self, rows: np.ndarray) -> pd.DataFrame:
+        """Display frame for the given rows, with tracking columns and titles applied."""
+        with self._lock:
+            status = self.status[rows]
+            saved = self.saved[rows]
+            cv_status = self.cv_status[rows]
+            resume = self.resume[rows]
+        df = self.frame.iloc[rows].reset_index(drop=True)
+        status = pd.Series(status, dtype=object)
+        saved = pd.Series(saved, dtype=bool)
+        df['Status'] = status
+        df['is_saved'] = saved
+        df['cv_status'] = cv_status
+        df['resume'] = resume
+        df['title'] = display_titles(df['title'], saved, status)
+        df['status_prio'] = status.map(STATUS_PRIORITY).fillna(1)
+        return df
@@ -0,0 +1,190 @@
+"""
+Write-behind layer over TrackingStore for interactive writers (the dashboard).
+
+apply() records the change in a small pending log (append + fsync, no store
+lock), merges it into an in-memory overlay and returns immediately. Readers
+see the overlay on top of the store. A background thread flushes the
+coalesced overlay as a single store journal entry once writes have been
+quiet for `delay` seconds, and never later than `max_delay` after the first
+pending change. Pending entries left by a crash are replayed on start.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from utils.tracking_store import TrackingStore
+
+logger = logging.getLogger(__name__)
+
+FLUSH_DELAY = 1.0
+MAX_FLUSH_DELAY = 5.0
+
+
+def merge_changes(target: Dict[str, Dict[str, Any]], changes: Dict[str, Dict[str, Any]]):
+    for job_id, fields in changes.items():
+        target.setdefault(job_id, {}).update(fields)
+
+
+class WriteBehindTracker:
+    """Optimistic, coalescing writer in front of a TrackingStore"""
+
+    def __init__(self, store: TrackingStore, pending_path: Optional[str] = None,
+                 delay: float = FLUSH_DELAY, max_delay: float = MAX_FLUSH_DELAY):
+        self.store = store
+        base, _ = os.path.splitext(store.path)
+        self.pending_path = pending_path or f"{base}.pending.jsonl"
+        self.delay = delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._overlay: Dict[str, Dict[str, Any]] = {}
+        self._inflight: Dict[str, Dict[str, Any]] = {}
+        self._first_pending = None
+        self._last_pending = None
+        self._local_version = 0
+        self._closed = False
+
+        self.replay_pending()
+        self._thread = threading.Thread(target=self._run, name="tracking-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # --- Pending log ---
+    def replay_pending(self) -> int:
+        """Apply changes left in the pending log by a previous process."""
+        changes: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.pending_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        merge_changes(changes, json.loads(line).get("changes", {}))
+                    except json.JSONDecodeError:
+                        # Torn final line from a crash mid-write
+                        logger.warning("Skipping malformed pending tracking line")
+        except FileNotFoundError:
+            return 0
+        if changes:
+            self.store.apply(changes)
+            logger.info(f"Replayed {len(changes)} pending tracking changes")
+        os.remove(self.pending_path)
+        return len(changes)
+
+    def _append_pending(self, changes: Dict[str, Dict[str, Any]]):
+        entry = {"ts": datetime.now().isoformat(), "changes": changes}
+        fd = os.open(self.pending_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # --- Public API ---
+    @property
+    def version(self):
+        """Changes with every optimistic write and every store change."""
+        return (self.store.version, self._local_version)
+
+    def refresh(self):
+        self.store.refresh()
+
+    def apply(self, changes: Dict[str, Dict[str, Any]]):
+        """Record changes durably in the pending log and apply them optimistically."""
+        if not changes:
+            return
+        with self._cond:
+            self._append_pending(changes)
+            merge_changes(self._overlay, changes)
+            now = time.monotonic()
+            if self._first_pending is None:
+                self._first_pending = now
+            self._last_pending = now
+            self._local_version += 1
+            self._cond.notify()
+
+    def update(self, job_id: str, **fields):
+        self.apply({job_id: fields})
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Store view with in-flight and pending changes layered on top."""
+        view = self.store.load()
+        with self._cond:
+            for layer in (self._inflight, self._overlay):
+                for job_id, fields in layer.items():
+                    view[job_id] = dict(view.get(job_id, {}), **fields)
+        return view
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        record = self.store.get(job_id)
+        with self._cond:
+            for layer in (self._inflight, self._overlay):
+                record.update(layer.get(job_id, {}))
+        return record
+
+    def flush(self):
+        """Write pending changes to the store now."""
+        with self._cond:
+            if not self._overlay:
+                return
+            batch, self._inflight = self._overlay, self._overlay
+            self._overlay = {}
+            self._first_pending = self._last_pending = None
+        try:
+            self.store.apply(batch)
+        except Exception as e:
+            # Keep the changes pending; the log still has them
+            logger.error(f"Error flushing tracking changes: {e}")
+            with self._cond:
+                merged = dict(batch)
+                merge_changes(merged, self._overlay)
+                self._overlay = merged
+                self._inflight = {}
+                self._first_pending = self._last_pending = time.monotonic()
+            return
+        with self._cond:
+            self._inflight = {}
+            self._rewrite_pending_locked()
+
+    def _rewrite_pending_locked(self):
+        """Pending log now only needs what arrived during the flush."""
+        if not self._overlay:
+            try:
+                os.remove(self.pending_path)
+            except FileNotFoundError:
+                pass
+            return
+        temp_name = f"{self.pending_path}.tmp"
+        with open(temp_name, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"ts": datetime.now().isoformat(), "changes": self._overlay}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, self.pending_path)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+
+    # --- Background flusher ---
+    def _due_in(self) -> Optional[float]:
+        if self._first_pending is None:
+            return None
+        now = time.monotonic()
+        return max(0.0, min(self._last_pending + self.delay, self._first_pending + self.max_delay) - now)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    wait = self._due_in()
+                    if wait == 0:
+                        break
+                    self._cond.wait(wait)
+                if self._closed:
+                    return
+            self.flush()